@@ -19,20 +19,63 @@ struct CompleteInfo {
 struct Request{
     1:string type
     2:string filename
+    3:ContactInfo requester # Replica the job runs on, read quorums always include it
+    4:string priority # Scheduling class, e.g. interactive, bulk or background; empty picks by type
+    5:double deadline # Unix time the caller gives up at, 0 for none
+}
+
+struct Completion {
+    1:i64 jobId
+    2:string filename
+    3:i32 version # New version for writes
+    4:string type # "read" or "write", a write is fenced off if its lease was reclaimed
+}
+
+struct BulkTicket {
+    1:i64 token # Single use, sent as 8 big-endian bytes when connecting to the side channel
+    2:i32 port # Side channel listener, on the same host as the issuing node
+    3:i64 size # Bytes the token covers
+}
+
+struct BlockSignature {
+    1:i64 weak # adler32 of the block
+    2:binary strong # md5 of the block
+}
+
+struct DeltaOp {
+    1:i32 block # First of the copier's blocks to reuse, -1 for new bytes
+    2:i64 offset # Where the bytes go (and, for new bytes, where they are in the source's file)
+    3:i64 length
+    4:binary data # New bytes sent inline, empty means fetch them with request_data
+}
+
+struct Delta {
+    1:list<DeltaOp> ops # Empty when a delta doesn't pay off, copy the whole file instead
+    2:i64 checksum # CRC-32 of the whole new version
+}
+
+struct CompressedChunk {
+    1:string codec # Codec the data is compressed with, empty when the chunk didn't shrink and is sent raw
+    2:binary data
 }
 
 struct Response {
     1:i32 version
     2:ContactInfo contact
+    3:i64 jobId # Lease handle, passed back to finish_read/finish_write
+    4:double retryAfter # Set instead of a job when the coordinator is overloaded, seconds to back off
+    5:list<ContactInfo> holders # Reads: every replica known to hold version, contact first
 }
 
 service replicaServer {
 
     # For client to call
     list<CompleteInfo> list_files()
-    string read_file(1:string filename)
-    void write_file(1:string filename, 2:string filepath)
+    string read_file(1:string filename, 2:string priority, 3:double deadline)
+    list<string> read_files(1:list<string> filenames, 2:string priority, 3:double deadline)
+    void write_file(1:string filename, 2:string filepath, 3:string priority, 4:double deadline)
     void confirm_operation() 
+    map<string, double> get_stats()
 
     # For coordinator to call
     i32 get_version(1: string filename) # Called by coordinator to get version from a server
@@ -41,14 +84,33 @@ service replicaServer {
 
     # Called on Coordinator
     Response insert_job(1: Request request)
-    void finish_write(1:i32 version, 2:string filename, 3:string ip, 4:i32 port, 5:string source_ip, 6:i32 source_port)
-    void finish_read()
+    list<Response> insert_jobs(1: list<Request> requests)
+    void finish_write(1:i32 version, 2:string filename, 3:string ip, 4:i32 port, 5:string source_ip, 6:i32 source_port, 7:i64 jobId)
+    void finish_read(1:string filename, 2:i64 jobId)
+    void finish_jobs(1:list<Completion> completions, 2:ContactInfo source)
     list<CompleteInfo> cord_list_files()
 
 
     # For Sending Data Around
     i64 get_file_size(1: string filename)
     binary request_data(1: string filename, 2:i32 offest, 3:i32 size)
-    void copy_file(1:i32 version, 2:string filename, 3:string ip, 4:i32 port)
+    void copy_file(1:i32 version, 2:string filename, 3:string ip, 4:i32 port, 5:i32 chunk_size) # chunk_size 0 uses the copier's default
+
+    # Streamed transfers: the copier makes one stream_file call and the source pushes the bytes back
+    # as stream_chunk frames over its own connection, syncing every window frames for flow control
+    i64 stream_file(1:string filename, 2:i64 offset, 3:i64 length, 4:ContactInfo receiver, 5:i64 streamId, 6:i32 chunk_size, 7:i32 window, 8:double deadline) # Returns the CRC-32 of the bytes sent
+    oneway void stream_chunk(1:i64 streamId, 2:binary data)
+    i64 stream_sync(1:i64 streamId) # Bytes of the stream received so far
+
+    # Sendfile transfers: a token for a byte range (length 0 = to the end), redeemed on the raw side channel
+    BulkTicket open_bulk(1:string filename, 2:i64 offset, 3:i64 length)
+
+    # Delta sync: the copier sends signatures of its current blocks, the source answers with the runs it can reuse and the new bytes
+    Delta request_delta(1:string filename, 2:i32 block_size, 3:list<BlockSignature> signatures)
+
+    # Compressed transfers: the copier lists the codecs it accepts, the source picks the first it supports
+    # (empty = send raw, e.g. sampling found the file incompressible), chunks then come back compressed
+    string negotiate_compression(1:string filename, 2:list<string> codecs)
+    CompressedChunk request_compressed(1:string filename, 2:i64 offset, 3:i32 size, 4:string codec, 5:i32 level)
 
 }
\ No newline at end of file
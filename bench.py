@@ -0,0 +1,390 @@
+# bench.py
+# Written by Matthew Breach and Lily Hymes
+
+"""
+Microbenchmarks for PA3
+---------------------------------------
+* Exercises coordinator and transfer code paths in-process, without launching a cluster.
+* quorum: simulates a set of FIFO replicas with uneven service times and compares each
+  quorum selection policy in replica_server.QUORUM_POLICIES against random selection.
+* chunks: starts two replica handlers in this process on loopback and times copy_file
+  between them for a range of chunk sizes, chunked (sequential, adaptive and pipelined) and streamed,
+  and once over the sendfile side channel. Use --size in the hundreds for the sendfile comparison.
+* delta: updates a copy of a file to a new version (appended, edited, shifted, rewritten) with
+  and without delta sync and reports the time and the bytes fetched.
+* compress: compression ratio and compress/decompress CPU cost of each codec and level on
+  files of different types, the sampled bypass verdict, and copy_file times with each codec
+  over a throttled link.
+
+Usage:
+    python3 bench.py quorum [--replicas N] [--quorum K] [--requests R] [--load L] [--slow S] [--seed SEED]
+    python3 bench.py chunks [--size MB] [--chunks B [B ...]] [--repeat R] [--cap B] [--windows W [W ...]]
+                            [--connections C] [--latency MS] [--file-cache N]
+                            [--transfer MODE [MODE ...]]
+    python3 bench.py delta [--size MB]
+    python3 bench.py compress [FILE ...] [--levels N [N ...]] [--chunk B] [--bandwidth MBPS]
+"""
+
+#  ██████╗ ██████╗ ███╗   ██╗███████╗██╗ ██████╗
+# ██╔════╝██╔═══██╗████╗  ██║██╔════╝██║██╔════╝
+# ██║     ██║   ██║██╔██╗ ██║█████╗  ██║██║  ███╗
+# ██║     ██║   ██║██║╚██╗██║██╔══╝  ██║██║   ██║
+# ╚██████╗╚██████╔╝██║ ╚████║██║     ██║╚██████╔╝
+#  ╚═════╝ ╚═════╝ ╚═╝  ╚═══╝╚═╝     ╚═╝ ╚═════╝
+
+import argparse, heapq, os, random, shutil, socket, tempfile, threading, time
+from replica_server import QUORUM_POLICIES, ReplicaLoad, ReplicaServerHandler, CHUNK_CAP, TRANSFER_MODES, FILE_CACHE_SIZE, DELTA_BLOCK, \
+    COMPRESSORS, COMPRESS_MAX_RATIO, sample_ratio
+from PA3 import replicaServer
+from thrift.transport import TSocket, TTransport
+from thrift.protocol import TBinaryProtocol
+from thrift.server import TServer
+
+BASE_SERVICE = 0.010 # mean seconds a healthy replica spends on one version query
+SLOW_FACTOR  = 5.0   # how much slower the slow replicas are
+COMPRESS_FILES = ["beemoviescript.txt", "results.csv", "PA3 Design Document.pdf", "chicken_jockey.jpg", "PA3.zip"] # repo files of each type
+
+# ██╗  ██╗███████╗██╗     ██████╗ ███████╗██████╗ ███████╗
+# ██║  ██║██╔════╝██║     ██╔══██╗██╔════╝██╔══██╗██╔════╝
+# ███████║█████╗  ██║     ██████╔╝█████╗  ██████╔╝███████╗
+# ██╔══██║██╔══╝  ██║     ██╔═══╝ ██╔══╝  ██╔══██╗╚════██║
+# ██║  ██║███████╗███████╗██║     ███████╗██║  ██║███████║
+# ╚═╝  ╚═╝╚══════╝╚══════╝╚═╝     ╚══════╝╚═╝  ╚═╝╚══════╝
+
+# Value at fraction p of an already sorted list
+def percentile(values, p):
+    return values[min(len(values) - 1, int(p * len(values)))]
+
+# Print one row of a results table
+def report(name, latencies, baseline=None):
+    latencies = sorted(latencies)
+    mean = sum(latencies) / len(latencies)
+    p50, p99 = percentile(latencies, 0.50), percentile(latencies, 0.99)
+    line = f"{name:<20}{mean * 1000:>10.2f}{p50 * 1000:>10.2f}{p99 * 1000:>10.2f}"
+    if baseline:
+        line += f"{baseline / p99:>10.2f}x"
+    print(line)
+    return p99
+
+#  ██████╗ ██╗   ██╗ ██████╗ ██████╗ ██╗   ██╗███╗   ███╗
+# ██╔═══██╗██║   ██║██╔═══██╗██╔══██╗██║   ██║████╗ ████║
+# ██║   ██║██║   ██║██║   ██║██████╔╝██║   ██║██╔████╔██║
+# ██║▄▄ ██║██║   ██║██║   ██║██╔══██╗██║   ██║██║╚██╔╝██║
+# ╚██████╔╝╚██████╔╝╚██████╔╝██║  ██║╚██████╔╝██║ ╚═╝ ██║
+#  ╚══▀▀═╝  ╚═════╝  ╚═════╝ ╚═╝  ╚═╝ ╚═════╝ ╚═╝     ╚═╝
+
+# Discrete-event run of one policy: Poisson arrivals, each request queries k FIFO replicas
+# and finishes when its slowest member answers. Loads are fed back the same way the
+# coordinator does it, in-flight on dispatch and a latency sample on every reply.
+def simulate_quorum(policy, service, k, requests, rate, seed):
+    rng = random.Random(seed)
+    random.seed(seed)
+    servers = list(range(len(service)))
+    loads = [ReplicaLoad() for _ in servers]
+    free_at = [0.0] * len(servers)
+    events = [] # (time, replica, request, sent)
+    remaining, latencies = {}, []
+    now = 0.0
+    for req in range(requests):
+        now += rng.expovariate(rate)
+        while events and events[0][0] <= now:
+            done, replica, other, sent = heapq.heappop(events)
+            loads[replica].inflight -= 1
+            loads[replica].observe(done - sent)
+            remaining[other][0] -= 1
+            if remaining[other][0] == 0:
+                latencies.append(done - remaining.pop(other)[1])
+        remaining[req] = [k, now]
+        for replica in policy(servers, loads, k):
+            free_at[replica] = max(free_at[replica], now) + rng.expovariate(1 / service[replica])
+            loads[replica].inflight += 1
+            heapq.heappush(events, (free_at[replica], replica, req, now))
+    while events:
+        done, replica, other, sent = heapq.heappop(events)
+        remaining[other][0] -= 1
+        if remaining[other][0] == 0:
+            latencies.append(done - remaining.pop(other)[1])
+    return latencies
+
+def bench_quorum(args):
+    service = [BASE_SERVICE * (SLOW_FACTOR if i < args.slow else 1) for i in range(args.replicas)]
+    # Offered load relative to the rate at which random selection saturates the slowest replica
+    capacity = args.replicas / (args.quorum * max(service))
+    rate = args.load * capacity
+    print(f"{args.replicas} replicas ({args.slow} slow), quorum {args.quorum}, "
+          f"{args.requests} requests at {rate:.0f}/s")
+    print(f"{'policy':<20}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}{'p99 gain':>11}")
+    baseline = None
+    for name, policy in QUORUM_POLICIES.items():
+        latencies = simulate_quorum(policy, service, args.quorum, args.requests, rate, args.seed)
+        p99 = report(name, latencies, baseline)
+        baseline = baseline or p99
+
+#  ██████╗██╗  ██╗██╗   ██╗███╗   ██╗██╗  ██╗███████╗
+# ██╔════╝██║  ██║██║   ██║████╗  ██║██║ ██╔╝██╔════╝
+# ██║     ███████║██║   ██║██╔██╗ ██║█████╔╝ ███████╗
+# ██║     ██╔══██║██║   ██║██║╚██╗██║██╔═██╗ ╚════██║
+# ╚██████╗██║  ██║╚██████╔╝██║ ╚████║██║  ██╗███████║
+#  ╚═════╝╚═╝  ╚═╝ ╚═════╝ ╚═╝  ╚═══╝╚═╝  ╚═╝╚══════╝
+
+# Unused loopback port for an in-process server
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+# Serve a handler from a daemon thread, the way run_replica_server does
+def serve(handler, port):
+    transport = TSocket.TServerSocket(host="127.0.0.1", port=port)
+    server = TServer.TThreadPoolServer(replicaServer.Processor(handler), transport,
+                                       TTransport.TBufferedTransportFactory(),
+                                       TBinaryProtocol.TBinaryProtocolFactory(), daemon=True)
+    server.setNumThreads(4)
+    threading.Thread(target=server.serve, daemon=True).start()
+    for _ in range(50): # wait until it accepts connections
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"bench server on port {port} did not start")
+
+# Two-node cluster in a temp dir, both served: the source hands out the file, the copier pulls it
+# (streamed transfers push their frames to the copier)
+def start_pair(source_options, copier_options):
+    workdir = tempfile.mkdtemp(prefix="pa3_bench_")
+    source_port, copier_port = free_port(), free_port()
+    with open(os.path.join(workdir, "compute_nodes.txt"), "w") as fp:
+        fp.write(f"1,2\n127.0.0.1,{source_port},1\n127.0.0.1,{copier_port},0\n")
+    os.chdir(workdir) # handlers read compute_nodes.txt from the working directory
+
+    source = ReplicaServerHandler("127.0.0.1", source_port, os.path.join(workdir, "source"), **source_options)
+    copier = ReplicaServerHandler("127.0.0.1", copier_port, os.path.join(workdir, "copier"), **copier_options)
+    serve(source, source_port)
+    serve(copier, copier_port)
+    return workdir, source, source_port, copier
+
+def bench_chunks(args):
+    workdir, source, source_port, copier = start_pair({"file_cache": args.file_cache},
+                                                      {"chunk_cap": args.cap, "fetch_connections": args.connections})
+    if args.latency:
+        # Stand-in for a slower disk or link: every chunk the source serves takes this much longer
+        serve_chunk = source.request_data
+        def slow_request_data(filename, offset, size):
+            time.sleep(args.latency / 1000)
+            return serve_chunk(filename, offset, size)
+        source.request_data = slow_request_data
+    filename = "bench.bin"
+    with open(os.path.join(workdir, "source", filename), "wb") as fp:
+        fp.write(os.urandom(args.size * 1024 * 1024))
+
+    print(f"copy_file of a {args.size} MiB file over loopback, best of {args.repeat}")
+    print(f"{'transfer':<10}{'window':>7}  {'chunk':<20}{'seconds':>10}{'MB/s':>10}{'calls':>10}")
+    runs = []
+    for transfer in args.transfer:
+        if transfer == "chunked":
+            runs.append((transfer, 1, f"adaptive from {args.chunks[0]}", args.chunks[0], True))
+            runs += [(transfer, window, f"{size}", size, False) for window in args.windows for size in args.chunks]
+        elif transfer == "stream":
+            runs += [(transfer, 1, f"{size}", size, False) for size in args.chunks]
+        else:
+            runs.append((transfer, 1, "-", args.chunks[0], False)) # one sendfile, no chunks
+    for transfer, window, name, size, adaptive in runs:
+        copier.transfer, copier.chunkSize, copier.adaptiveChunks = transfer, size, adaptive
+        # Window 1 is the sequential loop, larger windows pipeline over --connections connections
+        copier.fetchWindow = window
+        copier.fetchConnections = args.connections if window > 1 else 1
+        best = None
+        for _ in range(args.repeat):
+            copier.stats.clear()
+            start = time.time()
+            copier.copy_file(1, filename, "127.0.0.1", source_port)
+            elapsed = time.time() - start
+            best = min(best or elapsed, elapsed)
+        calls = copier.stats.get("chunks_fetched", 1) # a stream is one stream_file call, sendfile one open_bulk
+        print(f"{transfer:<10}{window:>7}  {name:<20}{best:>10.3f}{args.size * 1.048576 / best:>10.1f}{calls:>10}")
+    copier.pool.close()
+    source.pool.close()
+    shutil.rmtree(workdir)
+
+# ██████╗ ███████╗██╗  ████████╗ █████╗
+# ██╔══██╗██╔════╝██║  ╚══██╔══╝██╔══██╗
+# ██║  ██║█████╗  ██║     ██║   ███████║
+# ██║  ██║██╔══╝  ██║     ██║   ██╔══██║
+# ██████╔╝███████╗███████╗██║   ██║  ██║
+# ╚═════╝ ╚══════╝╚══════╝╚═╝   ╚═╝  ╚═╝
+
+# New versions of a base file, from a small edit to a complete rewrite
+def delta_cases(base):
+    middle = len(base) // 2
+    edits = bytearray(base)
+    for offset in range(0, len(base), len(base) // 10):
+        edits[offset:offset + 3] = b"XYZ"
+    return {
+        "append 1%": base + os.urandom(len(base) // 100),
+        "10 small edits": bytes(edits),
+        "insert 1000 B": base[:12345] + os.urandom(1000) + base[12345:],
+        "delete 64 KiB": base[:middle] + base[middle + 65536:],
+        "rewrite": os.urandom(len(base)),
+    }
+
+# Copier holds version 1 of a file, the source version 2, time bringing the copier up to date
+def bench_delta(args):
+    workdir, source, source_port, copier = start_pair({}, {})
+    filename = "bench.bin"
+    base = os.urandom(args.size * 1024 * 1024)
+    print(f"copy_file of a new version of a {args.size} MiB file, copier holds the old one")
+    print(f"{'change':<16}{'mode':<8}{'seconds':>10}{'fetched KiB':>13}{'reused KiB':>12}{'signatures KiB':>16}")
+    signatures = (len(base) // DELTA_BLOCK) * (8 + 16) / 1024 # weak + strong hash per block
+    for name, new in delta_cases(base).items():
+        with open(os.path.join(workdir, "source", filename), "wb") as fp:
+            fp.write(new)
+        source.fileCache.invalidate(os.path.join(workdir, "source", filename))
+        for delta in (False, True):
+            with open(os.path.join(workdir, "copier", filename), "wb") as fp:
+                fp.write(base)
+            copier.deltaSync = delta
+            copier.stats.clear()
+            start = time.time()
+            copier.copy_file(2, filename, "127.0.0.1", source_port)
+            elapsed = time.time() - start
+            with open(os.path.join(workdir, "copier", filename), "rb") as fp:
+                assert fp.read() == new, f"{name} rebuilt wrong"
+            if copier.stats.get("delta_syncs"):
+                fetched, reused, sent = copier.stats["delta_bytes_fetched"], copier.stats["delta_bytes_reused"], signatures
+            else:
+                fetched, reused, sent = len(new), 0, signatures if delta else 0
+            print(f"{name:<16}{'delta' if delta else 'full':<8}{elapsed:>10.3f}{fetched / 1024:>13.1f}"
+                  f"{reused / 1024:>12.1f}{sent:>16.1f}")
+    copier.pool.close()
+    source.pool.close()
+    shutil.rmtree(workdir)
+
+#  ██████╗ ██████╗ ███╗   ███╗██████╗ ██████╗ ███████╗███████╗███████╗
+# ██╔════╝██╔═══██╗████╗ ████║██╔══██╗██╔══██╗██╔════╝██╔════╝██╔════╝
+# ██║     ██║   ██║██╔████╔██║██████╔╝██████╔╝█████╗  ███████╗███████╗
+# ██║     ██║   ██║██║╚██╔╝██║██╔═══╝ ██╔══██╗██╔══╝  ╚════██║╚════██║
+# ╚██████╗╚██████╔╝██║ ╚═╝ ██║██║     ██║  ██║███████╗███████║███████║
+#  ╚═════╝ ╚═════╝ ╚═╝     ╚═╝╚═╝     ╚═╝  ╚═╝╚══════╝╚══════╝╚══════╝
+
+# Compress data chunk by chunk like a transfer does, returns (compressed bytes, compress and decompress CPU seconds)
+def compress_chunks(data, codec, level, chunk):
+    compress, decompress = COMPRESSORS[codec]
+    packed, squeeze, expand = 0, 0.0, 0.0
+    for offset in range(0, len(data), chunk):
+        piece = data[offset:offset + chunk]
+        start = time.thread_time()
+        small = compress(piece, level)
+        squeeze += time.thread_time() - start
+        start = time.thread_time()
+        assert decompress(small) == piece
+        expand += time.thread_time() - start
+        packed += min(len(small), len(piece)) # chunks that don't shrink are sent raw
+    return packed, squeeze, expand
+
+def bench_compress(args):
+    here = os.path.dirname(os.path.abspath(__file__))
+    samples = {}
+    for name in args.files:
+        with open(os.path.join(here, name), "rb") as fp:
+            samples[name] = fp.read()
+    samples["random"] = os.urandom(1024 * 1024) # incompressible, like the JPEG and the zip
+
+    mb = lambda size, seconds: size / seconds / 1e6 if seconds > 0 else float("inf")
+    print(f"Compression of {args.chunk // 1024} KiB chunks (CPU time), a zlib sample ratio above {COMPRESS_MAX_RATIO} bypasses compression")
+    print(f"{'file':<26}{'KiB':>8}{'codec':>7}{'level':>7}{'ratio':>8}{'comp MB/s':>11}{'decomp MB/s':>13}{'sample':>8}  verdict")
+    for name, data in samples.items():
+        for codec in COMPRESSORS:
+            for level in args.levels:
+                packed, squeeze, expand = compress_chunks(data, codec, level, args.chunk)
+                sampled = sample_ratio(len(data), lambda offset, size: data[offset:offset + size])
+                verdict = "raw" if sampled > COMPRESS_MAX_RATIO else "compress"
+                print(f"{name[:25]:<26}{len(data) / 1024:>8.0f}{codec:>7}{level:>7}{len(data) / packed:>8.2f}"
+                      f"{mb(len(data), squeeze):>11.1f}{mb(len(data), expand):>13.1f}{sampled:>8.2f}  {verdict}")
+
+    # End to end, with the source's link throttled so the bytes saved show up as time saved
+    workdir, source, source_port, copier = start_pair({}, {"chunk_size": args.chunk})
+    if args.bandwidth:
+        def throttled(serve_chunk, measure):
+            def call(*request):
+                reply = serve_chunk(*request)
+                time.sleep(measure(reply) / (args.bandwidth * 1e6))
+                return reply
+            return call
+        source.request_data = throttled(source.request_data, len)
+        source.request_compressed = throttled(source.request_compressed, lambda chunk: len(chunk.data))
+    level = args.levels[0]
+    link = f"{args.bandwidth:g} MB/s link" if args.bandwidth else "loopback"
+    print(f"\ncopy_file seconds over a {link}, level {level}, KiB on the wire in brackets")
+    print(f"{'file':<26}{'raw':>18}" + "".join(f"{codec:>18}" for codec in COMPRESSORS))
+    for name, data in samples.items():
+        filename = os.path.basename(name)
+        with open(os.path.join(workdir, "source", filename), "wb") as fp:
+            fp.write(data)
+        line = f"{name[:25]:<26}"
+        for codec in [None, *COMPRESSORS]:
+            copier.compress = [codec] if codec else []
+            copier.compressLevel = level
+            copier.stats.clear()
+            start = time.time()
+            copier.copy_file(1, filename, "127.0.0.1", source_port)
+            elapsed = time.time() - start
+            wire = copier.stats.get("compressed_bytes_wire", len(data))
+            line += f"{elapsed:>10.3f} ({wire / 1024:>5.0f})"
+        print(line)
+    copier.pool.close()
+    source.pool.close()
+    shutil.rmtree(workdir)
+
+# ███╗   ███╗ █████╗ ██╗███╗   ██╗
+# ████╗ ████║██╔══██╗██║████╗  ██║
+# ██╔████╔██║███████║██║██╔██╗ ██║
+# ██║╚██╔╝██║██╔══██║██║██║╚██╗██║
+# ██║ ╚═╝ ██║██║  ██║██║██║ ╚████║
+# ╚═╝     ╚═╝╚═╝  ╚═╝╚═╝╚═╝  ╚═══╝
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmarks for CSCI 5105 PA3")
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    quorum = sub.add_parser("quorum", help="compare quorum selection policies")
+    quorum.add_argument("--replicas", type=int, default=7, help="number of replicas")
+    quorum.add_argument("--quorum", type=int, default=3, help="replicas queried per request")
+    quorum.add_argument("--requests", type=int, default=20000, help="requests to simulate")
+    quorum.add_argument("--load", type=float, default=0.6, help="offered load as a fraction of what random selection can sustain")
+    quorum.add_argument("--slow", type=int, default=2, help="how many replicas are slow")
+    quorum.add_argument("--seed", type=int, default=5105, help="random seed")
+    quorum.set_defaults(run=bench_quorum)
+
+    chunks = sub.add_parser("chunks", help="compare request_data chunk sizes for copy_file")
+    chunks.add_argument("--size", type=int, default=32, help="file size in MiB")
+    chunks.add_argument("--chunks", type=int, nargs="+", default=[2048, 16384, 65536, 262144, 1048576],
+                        help="chunk sizes to try, in bytes; adaptive mode starts from the first")
+    chunks.add_argument("--repeat", type=int, default=3, help="copies per chunk size, the fastest is reported")
+    chunks.add_argument("--cap", type=int, default=CHUNK_CAP, help="chunk cap for the adaptive run")
+    chunks.add_argument("--windows", type=int, nargs="+", default=[1, 8],
+                        help="request_data calls kept outstanding by chunked copies")
+    chunks.add_argument("--connections", type=int, default=1, help="connections pipelined copies spread their window over")
+    chunks.add_argument("--latency", type=float, default=0.0, help="milliseconds the source adds to every request_data call")
+    chunks.add_argument("--file-cache", type=int, default=FILE_CACHE_SIZE, help="files the source keeps memory mapped, 0 opens per call")
+    chunks.add_argument("--transfer", choices=TRANSFER_MODES, nargs="+", default=list(TRANSFER_MODES),
+                        help="copy_file modes to time")
+    chunks.set_defaults(run=bench_chunks)
+
+    delta = sub.add_parser("delta", help="compare delta sync with full copies of updated files")
+    delta.add_argument("--size", type=int, default=16, help="file size in MiB")
+    delta.set_defaults(run=bench_delta)
+
+    compress = sub.add_parser("compress", help="compression ratio and CPU cost per file type, and compressed copies")
+    compress.add_argument("files", nargs="*", default=COMPRESS_FILES, help="files to compress, relative to bench.py")
+    compress.add_argument("--levels", type=int, nargs="+", default=[1, 6, 9],
+                          help="compression levels to try, copies use the first")
+    compress.add_argument("--chunk", type=int, default=65536, help="bytes per chunk")
+    compress.add_argument("--bandwidth", type=float, default=12.5, help="MB/s the source's link is throttled to, 0 = loopback speed")
+    compress.set_defaults(run=bench_compress)
+
+    args = parser.parse_args()
+    args.run(args)
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@
 Client for reading and writing to replica server
 
 Usage: 
-    python3 client.py [-h] [-l] [-r READ] [-w WRITE WRITE] [-d] server_ip server_port
+    python3 client.py [-h] [-l] [-r READ [READ ...]] [-w WRITE WRITE] [-s] [-p CLASS] [-t SECONDS] [-d] server_ip server_port
 
     Client for reading and writing
 
@@ -16,9 +16,15 @@ Usage:
     Options:
         -h, --help            show this help message and exit
         -l, --list            List all files and versions
-        -r READ, --read READ  Read a file with given filename
+        -r READ [READ ...], --read READ [READ ...]
+                                Read a file (or several, as one batch) with given filename(s)
         -w WRITE WRITE, --write WRITE WRITE
                                 Write a file with given filename and filepath
+        -s, --stats           Show the contacted server's statistics
+        -p CLASS, --priority CLASS
+                                Scheduling class for the read/write (interactive, bulk, background)
+        -t SECONDS, --timeout SECONDS
+                                Seconds to give a read/write before the DFS drops it
         -d, --debug           Enable debug output
 """
 
@@ -30,16 +36,19 @@ Usage:
 #  ╚═════╝ ╚═════╝ ╚═╝  ╚═══╝╚═╝     ╚═╝ ╚═════╝                          
 
 # Imports
-import sys, glob, argparse
+import sys, glob, argparse, time, random
 
 # Thrift setup 
 sys.path.append('gen-py')
 sys.path.insert(0, glob.glob('../thrift/thrift-0.19.0/lib/py/build/lib*')[0])
 
-from PA3 import replicaServer
 from PA3.ttypes import FileInfo, ContactInfo, CompleteInfo
-from thrift.transport import TSocket, TTransport
-from thrift.protocol import TBinaryProtocol
+from thrift.Thrift import TApplicationException
+from connection_pool import ConnectionPool
+
+OVERLOADED = 64 # TApplicationException type of a replica with no thread to spare (see replica_server.py)
+RETRIES = 6     # Times an overloaded operation is retried
+BACKOFF = 0.05  # First back-off in seconds, doubled (with jitter) on every retry
 
 # Debug printing
 DEBUG = 0
@@ -54,16 +63,20 @@ def dprint(msg: str):
 #  ██║  ██║███████╗███████╗██║     ███████╗██║  ██║███████║
 #  ╚═╝  ╚═╝╚══════╝╚══════╝╚═╝     ╚══════╝╚═╝  ╚═╝╚══════╝
 
-def open_client(ip, port):
-    """ Create thrift client by calling self.open_client to simplify thrift interaction """
-    dprint(f"Opening connection to {ip}:{port}")
-    sock = TSocket.TSocket(ip, port)
-    # sock.setTimeout(2000) #2s timeout
-    transport = TTransport.TBufferedTransport(sock)
-    protocol = TBinaryProtocol.TBinaryProtocol(transport)
-    client = replicaServer.Client(protocol)
-    transport.open()
-    return client, transport
+# Connections to the replica, kept open across retries
+POOL = ConnectionPool()
+
+def call_with_backoff(ip, port, method, *args, deadline=None):
+    """ Call a replica RPC, backing off and retrying while the replica reports it is overloaded """
+    for attempt in range(RETRIES + 1):
+        try:
+            with POOL.connection(ip, port) as client:
+                return getattr(client, method)(*args)
+        except TApplicationException as e:
+            if e.type != OVERLOADED or attempt == RETRIES or (deadline and time.time() > deadline):
+                raise
+            dprint(f"{e.message}, backing off")
+        time.sleep(BACKOFF * (2 ** attempt) * random.uniform(0.5, 1.5))
 
 #  ███████╗███████╗██████╗ ██╗   ██╗███████╗██████╗ 
 #  ██╔════╝██╔════╝██╔══██╗██║   ██║██╔════╝██╔══██╗
@@ -80,36 +93,38 @@ def open_client(ip, port):
 #   ╚═════╝╚═╝  ╚═╝╚══════╝╚══════╝╚══════╝         
 
 def list_files(ip, port):
-    client, transport = open_client(ip, port)
-
-    try:
+    with POOL.connection(ip, port) as client:
         files = client.list_files()
-    finally:
-        transport.close()
 
     for server in files:
         print(f"Server: {server.contact.ip}, {server.contact.port}, Stored Files: ")
         for file in server.files:
             print(f"{file.name}  (v{file.version})")
 
-def read_file(ip, port, filename):
-    client, transport = open_client(ip, port)
-    try:
-        filepath = client.read_file(filename)
-    finally:
-        transport.close()
+def read_file(ip, port, filename, priority=None, deadline=None):
+    filepath = call_with_backoff(ip, port, "read_file", filename, priority, deadline, deadline=deadline)
 
     dprint(f"Pretend you're reading a file: {filename} at {filepath}")
     dprint(f"Done reading file")
 
-def write_file(ip, port, filename, filepath):
+def read_files(ip, port, filenames, priority=None, deadline=None):
+    filepaths = call_with_backoff(ip, port, "read_files", filenames, priority, deadline, deadline=deadline)
+
+    for filename, filepath in zip(filenames, filepaths):
+        dprint(f"Pretend you're reading a file: {filename} at {filepath}")
+    dprint(f"Done reading {len(filenames)} files")
+
+def write_file(ip, port, filename, filepath, priority=None, deadline=None):
     dprint(f"Writing File: {filename} at path: {filepath}")
-    client, transport = open_client(ip, port)
+    call_with_backoff(ip, port, "write_file", filename, filepath, priority, deadline, deadline=deadline)
+
+def show_stats(ip, port):
+    with POOL.connection(ip, port) as client:
+        stats = client.get_stats()
 
-    try:
-        client.write_file(filename, filepath)
-    finally:
-        transport.close()
+    print(f"Server: {ip}, {port}, Stats: ")
+    for name in sorted(stats):
+        print(f"{name}  {stats[name]:g}")
 
 #  ███╗   ███╗ █████╗ ██╗███╗   ██╗
 #  ████╗ ████║██╔══██╗██║████╗  ██║
@@ -123,24 +138,37 @@ def main():
     parser.add_argument("server_ip", type=str, help="Server IP address")
     parser.add_argument("server_port", type=int, help="Server port")
     parser.add_argument("-l", "--list", action="store_true", help = "List all files and versions")
-    parser.add_argument("-r", "--read", help = "Read a file with given filename")
+    parser.add_argument("-r", "--read", nargs="+", help = "Read a file (or several, as one batch) with given filename(s)")
     parser.add_argument("-w", "--write" ,nargs=2, help="Write a file with given filename and filepath")
+    parser.add_argument("-s", "--stats", action="store_true", help="Show the contacted server's statistics")
+    parser.add_argument("-p", "--priority", help="Scheduling class for the read/write (interactive, bulk, background)")
+    parser.add_argument("-t", "--timeout", type=float, help="Seconds to give a read/write before the DFS drops it")
     parser.add_argument("-d", "--debug", action="store_true", help="Enable debug output")
 
     args = parser.parse_args()
     if args.debug:
         DEBUG = 1
+    deadline = time.time() + args.timeout if args.timeout else None
 
     #TODO: Figure out a way to get the filename from the filepath for write operations then you only need one entry
 
     if args.list:
         list_files(args.server_ip, args.server_port)
 
+    elif args.read and len(args.read) == 1:
+        read_file(args.server_ip, args.server_port, args.read[0], args.priority, deadline)
+
     elif args.read:
-        read_file(args.server_ip, args.server_port, args.read)
+        read_files(args.server_ip, args.server_port, args.read, args.priority, deadline)
 
     elif args.write:
-        write_file(args.server_ip, args.server_port, args.write[0], args.write[1])
-    
+        write_file(args.server_ip, args.server_port, args.write[0], args.write[1], args.priority, deadline)
+
+    elif args.stats:
+        show_stats(args.server_ip, args.server_port)
+
+    dprint(f"Connections: {POOL.stats}")
+    POOL.close()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,146 @@
+# connection_pool.py
+# Written by Matthew Breach and Lily Hymes
+
+"""
+Per-peer pool of open Thrift connections
+---------------------------------------
+* Shared by replica_server.py and client.py, import it after the Thrift paths are set up.
+* Connections are checked out for a call (or a run of calls) and checked back in afterwards.
+* A parked connection is health checked before reuse and closed once idle for too long.
+* At most max_per_peer connections are parked per peer; extra ones made under load are closed on check-in.
+
+Note: a TThreadPoolServer keeps one of its threads on every open connection, so parked
+connections tie up server threads on the peer. Servers size their thread pool with
+that in mind (see run_replica_server).
+"""
+
+#  ██████╗ ██████╗ ███╗   ██╗███████╗██╗ ██████╗
+# ██╔════╝██╔═══██╗████╗  ██║██╔════╝██║██╔════╝
+# ██║     ██║   ██║██╔██╗ ██║█████╗  ██║██║  ███╗
+# ██║     ██║   ██║██║╚██╗██║██╔══╝  ██║██║   ██║
+# ╚██████╗╚██████╔╝██║ ╚████║██║     ██║╚██████╔╝
+#  ╚═════╝ ╚═════╝ ╚═╝  ╚═══╝╚═╝     ╚═╝ ╚═════╝
+
+import select, socket, threading, time, contextlib
+from PA3 import replicaServer
+from thrift.Thrift import TApplicationException
+from thrift.transport import TSocket, TTransport
+from thrift.protocol import TBinaryProtocol
+
+POOL_SIZE    = 4    # Default connections parked per peer
+IDLE_TIMEOUT = 30.0 # Default seconds a parked connection may sit unused before it is closed
+
+#  ██████╗  ██████╗  ██████╗ ██╗
+#  ██╔══██╗██╔═══██╗██╔═══██╗██║
+#  ██████╔╝██║   ██║██║   ██║██║
+#  ██╔═══╝ ██║   ██║██║   ██║██║
+#  ██║     ╚██████╔╝╚██████╔╝███████╗
+#  ╚═╝      ╚═════╝  ╚═════╝ ╚══════╝
+
+class Connection():
+    """One open Thrift client and the socket under it"""
+
+    def __init__(self, ip, port):
+        self.socket = TSocket.TSocket(ip, port)
+        # self.socket.setTimeout(2000) # 2s timeout
+        self.transport = TTransport.TBufferedTransport(self.socket)
+        self.client = replicaServer.Client(TBinaryProtocol.TBinaryProtocol(self.transport))
+        self.transport.open()
+        # Streamed transfers send oneway frames back to back, don't let Nagle hold them for an ACK
+        self.socket.handle.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.lastUsed = time.time()
+
+    def healthy(self):
+        """An idle connection should have nothing to read, anything there means the peer hung up"""
+        if self.socket.handle is None:
+            return False
+        try:
+            readable, _, _ = select.select([self.socket.handle], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def close(self):
+        self.transport.close()
+
+class ConnectionPool():
+    """Parks open connections per (ip, port) so consecutive calls to a peer skip the connect
+
+    With max_per_peer = 0 every call opens and closes its own connection, as before.
+    """
+
+    def __init__(self, max_per_peer=POOL_SIZE, idle_timeout=IDLE_TIMEOUT):
+        self.maxPerPeer = max_per_peer
+        self.idleTimeout = idle_timeout
+        self.idle = {} # (ip, port) -> list of parked Connections, most recently used last
+        self._lock = threading.Lock()
+        self.stats = {"connects": 0, "reuses": 0, "evictions": 0, "discards": 0}
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def checkout(self, ip, port):
+        """Hands out a parked connection to the peer if a healthy one is left, otherwise opens one"""
+        now = time.time()
+        while True:
+            with self._lock:
+                parked = self.idle.get((ip, port))
+                conn = parked.pop() if parked else None
+            if conn is None:
+                break
+            if now - conn.lastUsed > self.idleTimeout:
+                self.count("evictions")
+            elif conn.healthy():
+                self.count("reuses")
+                return conn
+            else:
+                self.count("discards")
+            conn.close()
+
+        self.count("connects")
+        return Connection(ip, port)
+
+    def checkin(self, ip, port, conn):
+        """Parks a connection after use, or closes it if the peer already has enough parked"""
+        conn.lastUsed = time.time()
+        stale = []
+        with self._lock:
+            parked = self.idle.setdefault((ip, port), [])
+            # Oldest are first, drop the ones that sat too long
+            while parked and conn.lastUsed - parked[0].lastUsed > self.idleTimeout:
+                stale.append(parked.pop(0))
+            if len(parked) < self.maxPerPeer:
+                parked.append(conn)
+                conn = None
+            self.stats["evictions"] += len(stale)
+        for old in stale:
+            old.close()
+        if conn is not None:
+            conn.close()
+
+    @contextlib.contextmanager
+    def connection(self, ip, port):
+        """Yields a Thrift client to the peer, returning the connection to the pool afterwards
+
+        Errors raised by the remote handler leave the connection usable. Anything else
+        (timeouts, broken sockets) may leave a half-read reply behind, so the connection is dropped.
+        """
+        conn = self.checkout(ip, port)
+        try:
+            yield conn.client
+        except TApplicationException:
+            self.checkin(ip, port, conn)
+            raise
+        except BaseException:
+            conn.close()
+            self.count("discards")
+            raise
+        self.checkin(ip, port, conn)
+
+    def close(self):
+        with self._lock:
+            parked = [conn for conns in self.idle.values() for conn in conns]
+            self.idle = {}
+        for conn in parked:
+            conn.close()
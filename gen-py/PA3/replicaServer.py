@@ -22,19 +22,33 @@ class Iface(object):
     def list_files(self):
         pass
 
-    def read_file(self, filename):
+    def read_file(self, filename, priority, deadline):
         """
         Parameters:
          - filename
+         - priority
+         - deadline
 
         """
         pass
 
-    def write_file(self, filename, filepath):
+    def read_files(self, filenames, priority, deadline):
+        """
+        Parameters:
+         - filenames
+         - priority
+         - deadline
+
+        """
+        pass
+
+    def write_file(self, filename, filepath, priority, deadline):
         """
         Parameters:
          - filename
          - filepath
+         - priority
+         - deadline
 
         """
         pass
@@ -42,6 +56,9 @@ class Iface(object):
     def confirm_operation(self):
         pass
 
+    def get_stats(self):
+        pass
+
     def get_version(self, filename):
         """
         Parameters:
@@ -71,7 +88,15 @@ class Iface(object):
         """
         pass
 
-    def finish_write(self, version, filename, ip, port, source_ip, source_port):
+    def insert_jobs(self, requests):
+        """
+        Parameters:
+         - requests
+
+        """
+        pass
+
+    def finish_write(self, version, filename, ip, port, source_ip, source_port, jobId):
         """
         Parameters:
          - version
@@ -80,11 +105,27 @@ class Iface(object):
          - port
          - source_ip
          - source_port
+         - jobId
+
+        """
+        pass
+
+    def finish_read(self, filename, jobId):
+        """
+        Parameters:
+         - filename
+         - jobId
 
         """
         pass
 
-    def finish_read(self):
+    def finish_jobs(self, completions, source):
+        """
+        Parameters:
+         - completions
+         - source
+
+        """
         pass
 
     def cord_list_files(self):
@@ -108,13 +149,87 @@ class Iface(object):
         """
         pass
 
-    def copy_file(self, version, filename, ip, port):
+    def copy_file(self, version, filename, ip, port, chunk_size):
         """
         Parameters:
          - version
          - filename
          - ip
          - port
+         - chunk_size
+
+        """
+        pass
+
+    def stream_file(self, filename, offset, length, receiver, streamId, chunk_size, window, deadline):
+        """
+        Parameters:
+         - filename
+         - offset
+         - length
+         - receiver
+         - streamId
+         - chunk_size
+         - window
+         - deadline
+
+        """
+        pass
+
+    def stream_chunk(self, streamId, data):
+        """
+        Parameters:
+         - streamId
+         - data
+
+        """
+        pass
+
+    def stream_sync(self, streamId):
+        """
+        Parameters:
+         - streamId
+
+        """
+        pass
+
+    def open_bulk(self, filename, offset, length):
+        """
+        Parameters:
+         - filename
+         - offset
+         - length
+
+        """
+        pass
+
+    def request_delta(self, filename, block_size, signatures):
+        """
+        Parameters:
+         - filename
+         - block_size
+         - signatures
+
+        """
+        pass
+
+    def negotiate_compression(self, filename, codecs):
+        """
+        Parameters:
+         - filename
+         - codecs
+
+        """
+        pass
+
+    def request_compressed(self, filename, offset, size, codec, level):
+        """
+        Parameters:
+         - filename
+         - offset
+         - size
+         - codec
+         - level
 
         """
         pass
@@ -153,19 +268,23 @@ class Client(Iface):
             return result.success
         raise TApplicationException(TApplicationException.MISSING_RESULT, "list_files failed: unknown result")
 
-    def read_file(self, filename):
+    def read_file(self, filename, priority, deadline):
         """
         Parameters:
          - filename
+         - priority
+         - deadline
 
         """
-        self.send_read_file(filename)
+        self.send_read_file(filename, priority, deadline)
         return self.recv_read_file()
 
-    def send_read_file(self, filename):
+    def send_read_file(self, filename, priority, deadline):
         self._oprot.writeMessageBegin('read_file', TMessageType.CALL, self._seqid)
         args = read_file_args()
         args.filename = filename
+        args.priority = priority
+        args.deadline = deadline
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
@@ -185,21 +304,61 @@ class Client(Iface):
             return result.success
         raise TApplicationException(TApplicationException.MISSING_RESULT, "read_file failed: unknown result")
 
-    def write_file(self, filename, filepath):
+    def read_files(self, filenames, priority, deadline):
+        """
+        Parameters:
+         - filenames
+         - priority
+         - deadline
+
+        """
+        self.send_read_files(filenames, priority, deadline)
+        return self.recv_read_files()
+
+    def send_read_files(self, filenames, priority, deadline):
+        self._oprot.writeMessageBegin('read_files', TMessageType.CALL, self._seqid)
+        args = read_files_args()
+        args.filenames = filenames
+        args.priority = priority
+        args.deadline = deadline
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_read_files(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = read_files_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "read_files failed: unknown result")
+
+    def write_file(self, filename, filepath, priority, deadline):
         """
         Parameters:
          - filename
          - filepath
+         - priority
+         - deadline
 
         """
-        self.send_write_file(filename, filepath)
+        self.send_write_file(filename, filepath, priority, deadline)
         self.recv_write_file()
 
-    def send_write_file(self, filename, filepath):
+    def send_write_file(self, filename, filepath, priority, deadline):
         self._oprot.writeMessageBegin('write_file', TMessageType.CALL, self._seqid)
         args = write_file_args()
         args.filename = filename
         args.filepath = filepath
+        args.priority = priority
+        args.deadline = deadline
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
@@ -241,6 +400,32 @@ class Client(Iface):
         iprot.readMessageEnd()
         return
 
+    def get_stats(self):
+        self.send_get_stats()
+        return self.recv_get_stats()
+
+    def send_get_stats(self):
+        self._oprot.writeMessageBegin('get_stats', TMessageType.CALL, self._seqid)
+        args = get_stats_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_get_stats(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = get_stats_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "get_stats failed: unknown result")
+
     def get_version(self, filename):
         """
         Parameters:
@@ -365,7 +550,39 @@ class Client(Iface):
             return result.success
         raise TApplicationException(TApplicationException.MISSING_RESULT, "insert_job failed: unknown result")
 
-    def finish_write(self, version, filename, ip, port, source_ip, source_port):
+    def insert_jobs(self, requests):
+        """
+        Parameters:
+         - requests
+
+        """
+        self.send_insert_jobs(requests)
+        return self.recv_insert_jobs()
+
+    def send_insert_jobs(self, requests):
+        self._oprot.writeMessageBegin('insert_jobs', TMessageType.CALL, self._seqid)
+        args = insert_jobs_args()
+        args.requests = requests
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_insert_jobs(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = insert_jobs_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "insert_jobs failed: unknown result")
+
+    def finish_write(self, version, filename, ip, port, source_ip, source_port, jobId):
         """
         Parameters:
          - version
@@ -374,12 +591,13 @@ class Client(Iface):
          - port
          - source_ip
          - source_port
+         - jobId
 
         """
-        self.send_finish_write(version, filename, ip, port, source_ip, source_port)
+        self.send_finish_write(version, filename, ip, port, source_ip, source_port, jobId)
         self.recv_finish_write()
 
-    def send_finish_write(self, version, filename, ip, port, source_ip, source_port):
+    def send_finish_write(self, version, filename, ip, port, source_ip, source_port, jobId):
         self._oprot.writeMessageBegin('finish_write', TMessageType.CALL, self._seqid)
         args = finish_write_args()
         args.version = version
@@ -388,6 +606,7 @@ class Client(Iface):
         args.port = port
         args.source_ip = source_ip
         args.source_port = source_port
+        args.jobId = jobId
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
@@ -405,13 +624,21 @@ class Client(Iface):
         iprot.readMessageEnd()
         return
 
-    def finish_read(self):
-        self.send_finish_read()
+    def finish_read(self, filename, jobId):
+        """
+        Parameters:
+         - filename
+         - jobId
+
+        """
+        self.send_finish_read(filename, jobId)
         self.recv_finish_read()
 
-    def send_finish_read(self):
+    def send_finish_read(self, filename, jobId):
         self._oprot.writeMessageBegin('finish_read', TMessageType.CALL, self._seqid)
         args = finish_read_args()
+        args.filename = filename
+        args.jobId = jobId
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
@@ -429,6 +656,38 @@ class Client(Iface):
         iprot.readMessageEnd()
         return
 
+    def finish_jobs(self, completions, source):
+        """
+        Parameters:
+         - completions
+         - source
+
+        """
+        self.send_finish_jobs(completions, source)
+        self.recv_finish_jobs()
+
+    def send_finish_jobs(self, completions, source):
+        self._oprot.writeMessageBegin('finish_jobs', TMessageType.CALL, self._seqid)
+        args = finish_jobs_args()
+        args.completions = completions
+        args.source = source
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_finish_jobs(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = finish_jobs_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        return
+
     def cord_list_files(self):
         self.send_cord_list_files()
         return self.recv_cord_list_files()
@@ -523,25 +782,27 @@ class Client(Iface):
             return result.success
         raise TApplicationException(TApplicationException.MISSING_RESULT, "request_data failed: unknown result")
 
-    def copy_file(self, version, filename, ip, port):
+    def copy_file(self, version, filename, ip, port, chunk_size):
         """
         Parameters:
          - version
          - filename
          - ip
          - port
+         - chunk_size
 
         """
-        self.send_copy_file(version, filename, ip, port)
+        self.send_copy_file(version, filename, ip, port, chunk_size)
         self.recv_copy_file()
 
-    def send_copy_file(self, version, filename, ip, port):
+    def send_copy_file(self, version, filename, ip, port, chunk_size):
         self._oprot.writeMessageBegin('copy_file', TMessageType.CALL, self._seqid)
         args = copy_file_args()
         args.version = version
         args.filename = filename
         args.ip = ip
         args.port = port
+        args.chunk_size = chunk_size
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
@@ -559,100 +820,307 @@ class Client(Iface):
         iprot.readMessageEnd()
         return
 
+    def stream_file(self, filename, offset, length, receiver, streamId, chunk_size, window, deadline):
+        """
+        Parameters:
+         - filename
+         - offset
+         - length
+         - receiver
+         - streamId
+         - chunk_size
+         - window
+         - deadline
 
-class Processor(Iface, TProcessor):
-    def __init__(self, handler):
-        self._handler = handler
-        self._processMap = {}
-        self._processMap["list_files"] = Processor.process_list_files
-        self._processMap["read_file"] = Processor.process_read_file
-        self._processMap["write_file"] = Processor.process_write_file
-        self._processMap["confirm_operation"] = Processor.process_confirm_operation
-        self._processMap["get_version"] = Processor.process_get_version
-        self._processMap["get_all_files"] = Processor.process_get_all_files
-        self._processMap["node_write_file"] = Processor.process_node_write_file
-        self._processMap["insert_job"] = Processor.process_insert_job
-        self._processMap["finish_write"] = Processor.process_finish_write
-        self._processMap["finish_read"] = Processor.process_finish_read
-        self._processMap["cord_list_files"] = Processor.process_cord_list_files
-        self._processMap["get_file_size"] = Processor.process_get_file_size
-        self._processMap["request_data"] = Processor.process_request_data
-        self._processMap["copy_file"] = Processor.process_copy_file
-        self._on_message_begin = None
+        """
+        self.send_stream_file(filename, offset, length, receiver, streamId, chunk_size, window, deadline)
+        return self.recv_stream_file()
 
-    def on_message_begin(self, func):
-        self._on_message_begin = func
+    def send_stream_file(self, filename, offset, length, receiver, streamId, chunk_size, window, deadline):
+        self._oprot.writeMessageBegin('stream_file', TMessageType.CALL, self._seqid)
+        args = stream_file_args()
+        args.filename = filename
+        args.offset = offset
+        args.length = length
+        args.receiver = receiver
+        args.streamId = streamId
+        args.chunk_size = chunk_size
+        args.window = window
+        args.deadline = deadline
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
 
-    def process(self, iprot, oprot):
-        (name, type, seqid) = iprot.readMessageBegin()
-        if self._on_message_begin:
-            self._on_message_begin(name, type, seqid)
-        if name not in self._processMap:
-            iprot.skip(TType.STRUCT)
+    def recv_stream_file(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
             iprot.readMessageEnd()
-            x = TApplicationException(TApplicationException.UNKNOWN_METHOD, 'Unknown function %s' % (name))
-            oprot.writeMessageBegin(name, TMessageType.EXCEPTION, seqid)
-            x.write(oprot)
-            oprot.writeMessageEnd()
-            oprot.trans.flush()
-            return
-        else:
-            self._processMap[name](self, seqid, iprot, oprot)
-        return True
-
-    def process_list_files(self, seqid, iprot, oprot):
-        args = list_files_args()
-        args.read(iprot)
+            raise x
+        result = stream_file_result()
+        result.read(iprot)
         iprot.readMessageEnd()
-        result = list_files_result()
-        try:
-            result.success = self._handler.list_files()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("list_files", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "stream_file failed: unknown result")
 
-    def process_read_file(self, seqid, iprot, oprot):
-        args = read_file_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = read_file_result()
-        try:
-            result.success = self._handler.read_file(args.filename)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("read_file", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def stream_chunk(self, streamId, data):
+        """
+        Parameters:
+         - streamId
+         - data
 
-    def process_write_file(self, seqid, iprot, oprot):
-        args = write_file_args()
+        """
+        self.send_stream_chunk(streamId, data)
+
+    def send_stream_chunk(self, streamId, data):
+        self._oprot.writeMessageBegin('stream_chunk', TMessageType.ONEWAY, self._seqid)
+        args = stream_chunk_args()
+        args.streamId = streamId
+        args.data = data
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def stream_sync(self, streamId):
+        """
+        Parameters:
+         - streamId
+
+        """
+        self.send_stream_sync(streamId)
+        return self.recv_stream_sync()
+
+    def send_stream_sync(self, streamId):
+        self._oprot.writeMessageBegin('stream_sync', TMessageType.CALL, self._seqid)
+        args = stream_sync_args()
+        args.streamId = streamId
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_stream_sync(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = stream_sync_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "stream_sync failed: unknown result")
+
+    def open_bulk(self, filename, offset, length):
+        """
+        Parameters:
+         - filename
+         - offset
+         - length
+
+        """
+        self.send_open_bulk(filename, offset, length)
+        return self.recv_open_bulk()
+
+    def send_open_bulk(self, filename, offset, length):
+        self._oprot.writeMessageBegin('open_bulk', TMessageType.CALL, self._seqid)
+        args = open_bulk_args()
+        args.filename = filename
+        args.offset = offset
+        args.length = length
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_open_bulk(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = open_bulk_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "open_bulk failed: unknown result")
+
+    def request_delta(self, filename, block_size, signatures):
+        """
+        Parameters:
+         - filename
+         - block_size
+         - signatures
+
+        """
+        self.send_request_delta(filename, block_size, signatures)
+        return self.recv_request_delta()
+
+    def send_request_delta(self, filename, block_size, signatures):
+        self._oprot.writeMessageBegin('request_delta', TMessageType.CALL, self._seqid)
+        args = request_delta_args()
+        args.filename = filename
+        args.block_size = block_size
+        args.signatures = signatures
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_request_delta(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = request_delta_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "request_delta failed: unknown result")
+
+    def negotiate_compression(self, filename, codecs):
+        """
+        Parameters:
+         - filename
+         - codecs
+
+        """
+        self.send_negotiate_compression(filename, codecs)
+        return self.recv_negotiate_compression()
+
+    def send_negotiate_compression(self, filename, codecs):
+        self._oprot.writeMessageBegin('negotiate_compression', TMessageType.CALL, self._seqid)
+        args = negotiate_compression_args()
+        args.filename = filename
+        args.codecs = codecs
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_negotiate_compression(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = negotiate_compression_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "negotiate_compression failed: unknown result")
+
+    def request_compressed(self, filename, offset, size, codec, level):
+        """
+        Parameters:
+         - filename
+         - offset
+         - size
+         - codec
+         - level
+
+        """
+        self.send_request_compressed(filename, offset, size, codec, level)
+        return self.recv_request_compressed()
+
+    def send_request_compressed(self, filename, offset, size, codec, level):
+        self._oprot.writeMessageBegin('request_compressed', TMessageType.CALL, self._seqid)
+        args = request_compressed_args()
+        args.filename = filename
+        args.offset = offset
+        args.size = size
+        args.codec = codec
+        args.level = level
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_request_compressed(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = request_compressed_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "request_compressed failed: unknown result")
+
+
+class Processor(Iface, TProcessor):
+    def __init__(self, handler):
+        self._handler = handler
+        self._processMap = {}
+        self._processMap["list_files"] = Processor.process_list_files
+        self._processMap["read_file"] = Processor.process_read_file
+        self._processMap["read_files"] = Processor.process_read_files
+        self._processMap["write_file"] = Processor.process_write_file
+        self._processMap["confirm_operation"] = Processor.process_confirm_operation
+        self._processMap["get_stats"] = Processor.process_get_stats
+        self._processMap["get_version"] = Processor.process_get_version
+        self._processMap["get_all_files"] = Processor.process_get_all_files
+        self._processMap["node_write_file"] = Processor.process_node_write_file
+        self._processMap["insert_job"] = Processor.process_insert_job
+        self._processMap["insert_jobs"] = Processor.process_insert_jobs
+        self._processMap["finish_write"] = Processor.process_finish_write
+        self._processMap["finish_read"] = Processor.process_finish_read
+        self._processMap["finish_jobs"] = Processor.process_finish_jobs
+        self._processMap["cord_list_files"] = Processor.process_cord_list_files
+        self._processMap["get_file_size"] = Processor.process_get_file_size
+        self._processMap["request_data"] = Processor.process_request_data
+        self._processMap["copy_file"] = Processor.process_copy_file
+        self._processMap["stream_file"] = Processor.process_stream_file
+        self._processMap["stream_chunk"] = Processor.process_stream_chunk
+        self._processMap["stream_sync"] = Processor.process_stream_sync
+        self._processMap["open_bulk"] = Processor.process_open_bulk
+        self._processMap["request_delta"] = Processor.process_request_delta
+        self._processMap["negotiate_compression"] = Processor.process_negotiate_compression
+        self._processMap["request_compressed"] = Processor.process_request_compressed
+        self._on_message_begin = None
+
+    def on_message_begin(self, func):
+        self._on_message_begin = func
+
+    def process(self, iprot, oprot):
+        (name, type, seqid) = iprot.readMessageBegin()
+        if self._on_message_begin:
+            self._on_message_begin(name, type, seqid)
+        if name not in self._processMap:
+            iprot.skip(TType.STRUCT)
+            iprot.readMessageEnd()
+            x = TApplicationException(TApplicationException.UNKNOWN_METHOD, 'Unknown function %s' % (name))
+            oprot.writeMessageBegin(name, TMessageType.EXCEPTION, seqid)
+            x.write(oprot)
+            oprot.writeMessageEnd()
+            oprot.trans.flush()
+            return
+        else:
+            self._processMap[name](self, seqid, iprot, oprot)
+        return True
+
+    def process_list_files(self, seqid, iprot, oprot):
+        args = list_files_args()
         args.read(iprot)
         iprot.readMessageEnd()
-        result = write_file_result()
+        result = list_files_result()
         try:
-            self._handler.write_file(args.filename, args.filepath)
+            result.success = self._handler.list_files()
             msg_type = TMessageType.REPLY
         except TTransport.TTransportException:
             raise
@@ -664,18 +1132,18 @@ class Processor(Iface, TProcessor):
             logging.exception('Unexpected exception in handler')
             msg_type = TMessageType.EXCEPTION
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("write_file", msg_type, seqid)
+        oprot.writeMessageBegin("list_files", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_confirm_operation(self, seqid, iprot, oprot):
-        args = confirm_operation_args()
+    def process_read_file(self, seqid, iprot, oprot):
+        args = read_file_args()
         args.read(iprot)
         iprot.readMessageEnd()
-        result = confirm_operation_result()
+        result = read_file_result()
         try:
-            self._handler.confirm_operation()
+            result.success = self._handler.read_file(args.filename, args.priority, args.deadline)
             msg_type = TMessageType.REPLY
         except TTransport.TTransportException:
             raise
@@ -687,18 +1155,18 @@ class Processor(Iface, TProcessor):
             logging.exception('Unexpected exception in handler')
             msg_type = TMessageType.EXCEPTION
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("confirm_operation", msg_type, seqid)
+        oprot.writeMessageBegin("read_file", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_get_version(self, seqid, iprot, oprot):
-        args = get_version_args()
+    def process_read_files(self, seqid, iprot, oprot):
+        args = read_files_args()
         args.read(iprot)
         iprot.readMessageEnd()
-        result = get_version_result()
+        result = read_files_result()
         try:
-            result.success = self._handler.get_version(args.filename)
+            result.success = self._handler.read_files(args.filenames, args.priority, args.deadline)
             msg_type = TMessageType.REPLY
         except TTransport.TTransportException:
             raise
@@ -710,18 +1178,18 @@ class Processor(Iface, TProcessor):
             logging.exception('Unexpected exception in handler')
             msg_type = TMessageType.EXCEPTION
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("get_version", msg_type, seqid)
+        oprot.writeMessageBegin("read_files", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_get_all_files(self, seqid, iprot, oprot):
-        args = get_all_files_args()
+    def process_write_file(self, seqid, iprot, oprot):
+        args = write_file_args()
         args.read(iprot)
         iprot.readMessageEnd()
-        result = get_all_files_result()
+        result = write_file_result()
         try:
-            result.success = self._handler.get_all_files()
+            self._handler.write_file(args.filename, args.filepath, args.priority, args.deadline)
             msg_type = TMessageType.REPLY
         except TTransport.TTransportException:
             raise
@@ -733,18 +1201,18 @@ class Processor(Iface, TProcessor):
             logging.exception('Unexpected exception in handler')
             msg_type = TMessageType.EXCEPTION
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("get_all_files", msg_type, seqid)
+        oprot.writeMessageBegin("write_file", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_node_write_file(self, seqid, iprot, oprot):
-        args = node_write_file_args()
+    def process_confirm_operation(self, seqid, iprot, oprot):
+        args = confirm_operation_args()
         args.read(iprot)
         iprot.readMessageEnd()
-        result = node_write_file_result()
+        result = confirm_operation_result()
         try:
-            self._handler.node_write_file(args.filename, args.filepath, args.version)
+            self._handler.confirm_operation()
             msg_type = TMessageType.REPLY
         except TTransport.TTransportException:
             raise
@@ -756,18 +1224,18 @@ class Processor(Iface, TProcessor):
             logging.exception('Unexpected exception in handler')
             msg_type = TMessageType.EXCEPTION
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("node_write_file", msg_type, seqid)
+        oprot.writeMessageBegin("confirm_operation", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_insert_job(self, seqid, iprot, oprot):
-        args = insert_job_args()
+    def process_get_stats(self, seqid, iprot, oprot):
+        args = get_stats_args()
         args.read(iprot)
         iprot.readMessageEnd()
-        result = insert_job_result()
+        result = get_stats_result()
         try:
-            result.success = self._handler.insert_job(args.request)
+            result.success = self._handler.get_stats()
             msg_type = TMessageType.REPLY
         except TTransport.TTransportException:
             raise
@@ -779,18 +1247,18 @@ class Processor(Iface, TProcessor):
             logging.exception('Unexpected exception in handler')
             msg_type = TMessageType.EXCEPTION
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("insert_job", msg_type, seqid)
+        oprot.writeMessageBegin("get_stats", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_finish_write(self, seqid, iprot, oprot):
-        args = finish_write_args()
+    def process_get_version(self, seqid, iprot, oprot):
+        args = get_version_args()
         args.read(iprot)
         iprot.readMessageEnd()
-        result = finish_write_result()
+        result = get_version_result()
         try:
-            self._handler.finish_write(args.version, args.filename, args.ip, args.port, args.source_ip, args.source_port)
+            result.success = self._handler.get_version(args.filename)
             msg_type = TMessageType.REPLY
         except TTransport.TTransportException:
             raise
@@ -802,18 +1270,18 @@ class Processor(Iface, TProcessor):
             logging.exception('Unexpected exception in handler')
             msg_type = TMessageType.EXCEPTION
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("finish_write", msg_type, seqid)
+        oprot.writeMessageBegin("get_version", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_finish_read(self, seqid, iprot, oprot):
-        args = finish_read_args()
+    def process_get_all_files(self, seqid, iprot, oprot):
+        args = get_all_files_args()
         args.read(iprot)
         iprot.readMessageEnd()
-        result = finish_read_result()
+        result = get_all_files_result()
         try:
-            self._handler.finish_read()
+            result.success = self._handler.get_all_files()
             msg_type = TMessageType.REPLY
         except TTransport.TTransportException:
             raise
@@ -825,18 +1293,18 @@ class Processor(Iface, TProcessor):
             logging.exception('Unexpected exception in handler')
             msg_type = TMessageType.EXCEPTION
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("finish_read", msg_type, seqid)
+        oprot.writeMessageBegin("get_all_files", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_cord_list_files(self, seqid, iprot, oprot):
-        args = cord_list_files_args()
+    def process_node_write_file(self, seqid, iprot, oprot):
+        args = node_write_file_args()
         args.read(iprot)
         iprot.readMessageEnd()
-        result = cord_list_files_result()
+        result = node_write_file_result()
         try:
-            result.success = self._handler.cord_list_files()
+            self._handler.node_write_file(args.filename, args.filepath, args.version)
             msg_type = TMessageType.REPLY
         except TTransport.TTransportException:
             raise
@@ -848,18 +1316,18 @@ class Processor(Iface, TProcessor):
             logging.exception('Unexpected exception in handler')
             msg_type = TMessageType.EXCEPTION
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("cord_list_files", msg_type, seqid)
+        oprot.writeMessageBegin("node_write_file", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_get_file_size(self, seqid, iprot, oprot):
-        args = get_file_size_args()
+    def process_insert_job(self, seqid, iprot, oprot):
+        args = insert_job_args()
         args.read(iprot)
         iprot.readMessageEnd()
-        result = get_file_size_result()
+        result = insert_job_result()
         try:
-            result.success = self._handler.get_file_size(args.filename)
+            result.success = self._handler.insert_job(args.request)
             msg_type = TMessageType.REPLY
         except TTransport.TTransportException:
             raise
@@ -871,18 +1339,18 @@ class Processor(Iface, TProcessor):
             logging.exception('Unexpected exception in handler')
             msg_type = TMessageType.EXCEPTION
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("get_file_size", msg_type, seqid)
+        oprot.writeMessageBegin("insert_job", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_request_data(self, seqid, iprot, oprot):
-        args = request_data_args()
+    def process_insert_jobs(self, seqid, iprot, oprot):
+        args = insert_jobs_args()
         args.read(iprot)
         iprot.readMessageEnd()
-        result = request_data_result()
+        result = insert_jobs_result()
         try:
-            result.success = self._handler.request_data(args.filename, args.offest, args.size)
+            result.success = self._handler.insert_jobs(args.requests)
             msg_type = TMessageType.REPLY
         except TTransport.TTransportException:
             raise
@@ -894,18 +1362,156 @@ class Processor(Iface, TProcessor):
             logging.exception('Unexpected exception in handler')
             msg_type = TMessageType.EXCEPTION
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("request_data", msg_type, seqid)
+        oprot.writeMessageBegin("insert_jobs", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_copy_file(self, seqid, iprot, oprot):
-        args = copy_file_args()
+    def process_finish_write(self, seqid, iprot, oprot):
+        args = finish_write_args()
         args.read(iprot)
         iprot.readMessageEnd()
-        result = copy_file_result()
+        result = finish_write_result()
         try:
-            self._handler.copy_file(args.version, args.filename, args.ip, args.port)
+            self._handler.finish_write(args.version, args.filename, args.ip, args.port, args.source_ip, args.source_port, args.jobId)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("finish_write", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_finish_read(self, seqid, iprot, oprot):
+        args = finish_read_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = finish_read_result()
+        try:
+            self._handler.finish_read(args.filename, args.jobId)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("finish_read", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_finish_jobs(self, seqid, iprot, oprot):
+        args = finish_jobs_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = finish_jobs_result()
+        try:
+            self._handler.finish_jobs(args.completions, args.source)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("finish_jobs", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_cord_list_files(self, seqid, iprot, oprot):
+        args = cord_list_files_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = cord_list_files_result()
+        try:
+            result.success = self._handler.cord_list_files()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("cord_list_files", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_file_size(self, seqid, iprot, oprot):
+        args = get_file_size_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_file_size_result()
+        try:
+            result.success = self._handler.get_file_size(args.filename)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("get_file_size", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_request_data(self, seqid, iprot, oprot):
+        args = request_data_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = request_data_result()
+        try:
+            result.success = self._handler.request_data(args.filename, args.offest, args.size)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("request_data", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_copy_file(self, seqid, iprot, oprot):
+        args = copy_file_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = copy_file_result()
+        try:
+            self._handler.copy_file(args.version, args.filename, args.ip, args.port, args.chunk_size)
             msg_type = TMessageType.REPLY
         except TTransport.TTransportException:
             raise
@@ -922,6 +1528,155 @@ class Processor(Iface, TProcessor):
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
+    def process_stream_file(self, seqid, iprot, oprot):
+        args = stream_file_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = stream_file_result()
+        try:
+            result.success = self._handler.stream_file(args.filename, args.offset, args.length, args.receiver, args.streamId, args.chunk_size, args.window, args.deadline)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("stream_file", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_stream_chunk(self, seqid, iprot, oprot):
+        args = stream_chunk_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        try:
+            self._handler.stream_chunk(args.streamId, args.data)
+        except TTransport.TTransportException:
+            raise
+        except Exception:
+            logging.exception('Exception in oneway handler')
+
+    def process_stream_sync(self, seqid, iprot, oprot):
+        args = stream_sync_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = stream_sync_result()
+        try:
+            result.success = self._handler.stream_sync(args.streamId)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("stream_sync", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_open_bulk(self, seqid, iprot, oprot):
+        args = open_bulk_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = open_bulk_result()
+        try:
+            result.success = self._handler.open_bulk(args.filename, args.offset, args.length)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("open_bulk", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_request_delta(self, seqid, iprot, oprot):
+        args = request_delta_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = request_delta_result()
+        try:
+            result.success = self._handler.request_delta(args.filename, args.block_size, args.signatures)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("request_delta", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_negotiate_compression(self, seqid, iprot, oprot):
+        args = negotiate_compression_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = negotiate_compression_result()
+        try:
+            result.success = self._handler.negotiate_compression(args.filename, args.codecs)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("negotiate_compression", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_request_compressed(self, seqid, iprot, oprot):
+        args = request_compressed_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = request_compressed_result()
+        try:
+            result.success = self._handler.request_compressed(args.filename, args.offset, args.size, args.codec, args.level)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("request_compressed", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
 # HELPER FUNCTIONS AND STRUCTURES
 
 
@@ -991,11 +1746,11 @@ class list_files_result(object):
             if fid == 0:
                 if ftype == TType.LIST:
                     self.success = []
-                    (_etype10, _size7) = iprot.readListBegin()
-                    for _i11 in range(_size7):
-                        _elem12 = CompleteInfo()
-                        _elem12.read(iprot)
-                        self.success.append(_elem12)
+                    (_etype24, _size21) = iprot.readListBegin()
+                    for _i25 in range(_size21):
+                        _elem26 = CompleteInfo()
+                        _elem26.read(iprot)
+                        self.success.append(_elem26)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -1012,8 +1767,8 @@ class list_files_result(object):
         if self.success is not None:
             oprot.writeFieldBegin('success', TType.LIST, 0)
             oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter13 in self.success:
-                iter13.write(oprot)
+            for iter27 in self.success:
+                iter27.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -1042,12 +1797,1306 @@ class read_file_args(object):
     """
     Attributes:
      - filename
+     - priority
+     - deadline
 
     """
 
 
-    def __init__(self, filename=None,):
+    def __init__(self, filename=None, priority=None, deadline=None,):
         self.filename = filename
+        self.priority = priority
+        self.deadline = deadline
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.priority = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.DOUBLE:
+                    self.deadline = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('read_file_args')
+        if self.filename is not None:
+            oprot.writeFieldBegin('filename', TType.STRING, 1)
+            oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
+            oprot.writeFieldEnd()
+        if self.priority is not None:
+            oprot.writeFieldBegin('priority', TType.STRING, 2)
+            oprot.writeString(self.priority.encode('utf-8') if sys.version_info[0] == 2 else self.priority)
+            oprot.writeFieldEnd()
+        if self.deadline is not None:
+            oprot.writeFieldBegin('deadline', TType.DOUBLE, 3)
+            oprot.writeDouble(self.deadline)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(read_file_args)
+read_file_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
+    (2, TType.STRING, 'priority', 'UTF8', None, ),  # 2
+    (3, TType.DOUBLE, 'deadline', None, None, ),  # 3
+)
+
+
+class read_file_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('read_file_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRING, 0)
+            oprot.writeString(self.success.encode('utf-8') if sys.version_info[0] == 2 else self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(read_file_result)
+read_file_result.thrift_spec = (
+    (0, TType.STRING, 'success', 'UTF8', None, ),  # 0
+)
+
+
+class read_files_args(object):
+    """
+    Attributes:
+     - filenames
+     - priority
+     - deadline
+
+    """
+
+
+    def __init__(self, filenames=None, priority=None, deadline=None,):
+        self.filenames = filenames
+        self.priority = priority
+        self.deadline = deadline
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.filenames = []
+                    (_etype31, _size28) = iprot.readListBegin()
+                    for _i32 in range(_size28):
+                        _elem33 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        self.filenames.append(_elem33)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.priority = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.DOUBLE:
+                    self.deadline = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('read_files_args')
+        if self.filenames is not None:
+            oprot.writeFieldBegin('filenames', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.filenames))
+            for iter34 in self.filenames:
+                oprot.writeString(iter34.encode('utf-8') if sys.version_info[0] == 2 else iter34)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.priority is not None:
+            oprot.writeFieldBegin('priority', TType.STRING, 2)
+            oprot.writeString(self.priority.encode('utf-8') if sys.version_info[0] == 2 else self.priority)
+            oprot.writeFieldEnd()
+        if self.deadline is not None:
+            oprot.writeFieldBegin('deadline', TType.DOUBLE, 3)
+            oprot.writeDouble(self.deadline)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(read_files_args)
+read_files_args.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'filenames', (TType.STRING, 'UTF8', False), None, ),  # 1
+    (2, TType.STRING, 'priority', 'UTF8', None, ),  # 2
+    (3, TType.DOUBLE, 'deadline', None, None, ),  # 3
+)
+
+
+class read_files_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype38, _size35) = iprot.readListBegin()
+                    for _i39 in range(_size35):
+                        _elem40 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        self.success.append(_elem40)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('read_files_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.STRING, len(self.success))
+            for iter41 in self.success:
+                oprot.writeString(iter41.encode('utf-8') if sys.version_info[0] == 2 else iter41)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(read_files_result)
+read_files_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRING, 'UTF8', False), None, ),  # 0
+)
+
+
+class write_file_args(object):
+    """
+    Attributes:
+     - filename
+     - filepath
+     - priority
+     - deadline
+
+    """
+
+
+    def __init__(self, filename=None, filepath=None, priority=None, deadline=None,):
+        self.filename = filename
+        self.filepath = filepath
+        self.priority = priority
+        self.deadline = deadline
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.filepath = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.priority = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.DOUBLE:
+                    self.deadline = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('write_file_args')
+        if self.filename is not None:
+            oprot.writeFieldBegin('filename', TType.STRING, 1)
+            oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
+            oprot.writeFieldEnd()
+        if self.filepath is not None:
+            oprot.writeFieldBegin('filepath', TType.STRING, 2)
+            oprot.writeString(self.filepath.encode('utf-8') if sys.version_info[0] == 2 else self.filepath)
+            oprot.writeFieldEnd()
+        if self.priority is not None:
+            oprot.writeFieldBegin('priority', TType.STRING, 3)
+            oprot.writeString(self.priority.encode('utf-8') if sys.version_info[0] == 2 else self.priority)
+            oprot.writeFieldEnd()
+        if self.deadline is not None:
+            oprot.writeFieldBegin('deadline', TType.DOUBLE, 4)
+            oprot.writeDouble(self.deadline)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(write_file_args)
+write_file_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
+    (2, TType.STRING, 'filepath', 'UTF8', None, ),  # 2
+    (3, TType.STRING, 'priority', 'UTF8', None, ),  # 3
+    (4, TType.DOUBLE, 'deadline', None, None, ),  # 4
+)
+
+
+class write_file_result(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('write_file_result')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(write_file_result)
+write_file_result.thrift_spec = (
+)
+
+
+class confirm_operation_args(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('confirm_operation_args')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(confirm_operation_args)
+confirm_operation_args.thrift_spec = (
+)
+
+
+class confirm_operation_result(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('confirm_operation_result')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(confirm_operation_result)
+confirm_operation_result.thrift_spec = (
+)
+
+
+class get_stats_args(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('get_stats_args')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(get_stats_args)
+get_stats_args.thrift_spec = (
+)
+
+
+class get_stats_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype43, _vtype44, _size42) = iprot.readMapBegin()
+                    for _i46 in range(_size42):
+                        _key47 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        _val48 = iprot.readDouble()
+                        self.success[_key47] = _val48
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('get_stats_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.DOUBLE, len(self.success))
+            for kiter49, viter50 in self.success.items():
+                oprot.writeString(kiter49.encode('utf-8') if sys.version_info[0] == 2 else kiter49)
+                oprot.writeDouble(viter50)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(get_stats_result)
+get_stats_result.thrift_spec = (
+    (0, TType.MAP, 'success', (TType.STRING, 'UTF8', TType.DOUBLE, None, False), None, ),  # 0
+)
+
+
+class get_version_args(object):
+    """
+    Attributes:
+     - filename
+
+    """
+
+
+    def __init__(self, filename=None,):
+        self.filename = filename
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('get_version_args')
+        if self.filename is not None:
+            oprot.writeFieldBegin('filename', TType.STRING, 1)
+            oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(get_version_args)
+get_version_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
+)
+
+
+class get_version_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.I32:
+                    self.success = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('get_version_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.I32, 0)
+            oprot.writeI32(self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(get_version_result)
+get_version_result.thrift_spec = (
+    (0, TType.I32, 'success', None, None, ),  # 0
+)
+
+
+class get_all_files_args(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('get_all_files_args')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(get_all_files_args)
+get_all_files_args.thrift_spec = (
+)
+
+
+class get_all_files_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype54, _size51) = iprot.readListBegin()
+                    for _i55 in range(_size51):
+                        _elem56 = FileInfo()
+                        _elem56.read(iprot)
+                        self.success.append(_elem56)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('get_all_files_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter57 in self.success:
+                iter57.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(get_all_files_result)
+get_all_files_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRUCT, [FileInfo, None], False), None, ),  # 0
+)
+
+
+class node_write_file_args(object):
+    """
+    Attributes:
+     - filename
+     - filepath
+     - version
+
+    """
+
+
+    def __init__(self, filename=None, filepath=None, version=None,):
+        self.filename = filename
+        self.filepath = filepath
+        self.version = version
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.filepath = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.version = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('node_write_file_args')
+        if self.filename is not None:
+            oprot.writeFieldBegin('filename', TType.STRING, 1)
+            oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
+            oprot.writeFieldEnd()
+        if self.filepath is not None:
+            oprot.writeFieldBegin('filepath', TType.STRING, 2)
+            oprot.writeString(self.filepath.encode('utf-8') if sys.version_info[0] == 2 else self.filepath)
+            oprot.writeFieldEnd()
+        if self.version is not None:
+            oprot.writeFieldBegin('version', TType.I32, 3)
+            oprot.writeI32(self.version)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(node_write_file_args)
+node_write_file_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
+    (2, TType.STRING, 'filepath', 'UTF8', None, ),  # 2
+    (3, TType.I32, 'version', None, None, ),  # 3
+)
+
+
+class node_write_file_result(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('node_write_file_result')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(node_write_file_result)
+node_write_file_result.thrift_spec = (
+)
+
+
+class insert_job_args(object):
+    """
+    Attributes:
+     - request
+
+    """
+
+
+    def __init__(self, request=None,):
+        self.request = request
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.request = Request()
+                    self.request.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('insert_job_args')
+        if self.request is not None:
+            oprot.writeFieldBegin('request', TType.STRUCT, 1)
+            self.request.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(insert_job_args)
+insert_job_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'request', [Request, None], None, ),  # 1
+)
+
+
+class insert_job_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = Response()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('insert_job_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(insert_job_result)
+insert_job_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [Response, None], None, ),  # 0
+)
+
+
+class insert_jobs_args(object):
+    """
+    Attributes:
+     - requests
+
+    """
+
+
+    def __init__(self, requests=None,):
+        self.requests = requests
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.requests = []
+                    (_etype61, _size58) = iprot.readListBegin()
+                    for _i62 in range(_size58):
+                        _elem63 = Request()
+                        _elem63.read(iprot)
+                        self.requests.append(_elem63)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('insert_jobs_args')
+        if self.requests is not None:
+            oprot.writeFieldBegin('requests', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.requests))
+            for iter64 in self.requests:
+                iter64.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(insert_jobs_args)
+insert_jobs_args.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'requests', (TType.STRUCT, [Request, None], False), None, ),  # 1
+)
+
+
+class insert_jobs_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype68, _size65) = iprot.readListBegin()
+                    for _i69 in range(_size65):
+                        _elem70 = Response()
+                        _elem70.read(iprot)
+                        self.success.append(_elem70)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('insert_jobs_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter71 in self.success:
+                iter71.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(insert_jobs_result)
+insert_jobs_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRUCT, [Response, None], False), None, ),  # 0
+)
+
+
+class finish_write_args(object):
+    """
+    Attributes:
+     - version
+     - filename
+     - ip
+     - port
+     - source_ip
+     - source_port
+     - jobId
+
+    """
+
+
+    def __init__(self, version=None, filename=None, ip=None, port=None, source_ip=None, source_port=None, jobId=None,):
+        self.version = version
+        self.filename = filename
+        self.ip = ip
+        self.port = port
+        self.source_ip = source_ip
+        self.source_port = source_port
+        self.jobId = jobId
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1059,10 +3108,40 @@ class read_file_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
+                if ftype == TType.I32:
+                    self.version = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
                 if ftype == TType.STRING:
                     self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.ip = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I32:
+                    self.port = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRING:
+                    self.source_ip = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.I32:
+                    self.source_port = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.I64:
+                    self.jobId = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1072,11 +3151,35 @@ class read_file_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('read_file_args')
+        oprot.writeStructBegin('finish_write_args')
+        if self.version is not None:
+            oprot.writeFieldBegin('version', TType.I32, 1)
+            oprot.writeI32(self.version)
+            oprot.writeFieldEnd()
         if self.filename is not None:
-            oprot.writeFieldBegin('filename', TType.STRING, 1)
+            oprot.writeFieldBegin('filename', TType.STRING, 2)
             oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
             oprot.writeFieldEnd()
+        if self.ip is not None:
+            oprot.writeFieldBegin('ip', TType.STRING, 3)
+            oprot.writeString(self.ip.encode('utf-8') if sys.version_info[0] == 2 else self.ip)
+            oprot.writeFieldEnd()
+        if self.port is not None:
+            oprot.writeFieldBegin('port', TType.I32, 4)
+            oprot.writeI32(self.port)
+            oprot.writeFieldEnd()
+        if self.source_ip is not None:
+            oprot.writeFieldBegin('source_ip', TType.STRING, 5)
+            oprot.writeString(self.source_ip.encode('utf-8') if sys.version_info[0] == 2 else self.source_ip)
+            oprot.writeFieldEnd()
+        if self.source_port is not None:
+            oprot.writeFieldBegin('source_port', TType.I32, 6)
+            oprot.writeI32(self.source_port)
+            oprot.writeFieldEnd()
+        if self.jobId is not None:
+            oprot.writeFieldBegin('jobId', TType.I64, 7)
+            oprot.writeI64(self.jobId)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1093,23 +3196,21 @@ class read_file_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(read_file_args)
-read_file_args.thrift_spec = (
+all_structs.append(finish_write_args)
+finish_write_args.thrift_spec = (
     None,  # 0
-    (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
+    (1, TType.I32, 'version', None, None, ),  # 1
+    (2, TType.STRING, 'filename', 'UTF8', None, ),  # 2
+    (3, TType.STRING, 'ip', 'UTF8', None, ),  # 3
+    (4, TType.I32, 'port', None, None, ),  # 4
+    (5, TType.STRING, 'source_ip', 'UTF8', None, ),  # 5
+    (6, TType.I32, 'source_port', None, None, ),  # 6
+    (7, TType.I64, 'jobId', None, None, ),  # 7
 )
 
 
-class read_file_result(object):
-    """
-    Attributes:
-     - success
-
-    """
-
+class finish_write_result(object):
 
-    def __init__(self, success=None,):
-        self.success = success
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1120,11 +3221,6 @@ class read_file_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1134,11 +3230,7 @@ class read_file_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('read_file_result')
-        if self.success is not None:
-            oprot.writeFieldBegin('success', TType.STRING, 0)
-            oprot.writeString(self.success.encode('utf-8') if sys.version_info[0] == 2 else self.success)
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin('finish_write_result')
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1155,24 +3247,23 @@ class read_file_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(read_file_result)
-read_file_result.thrift_spec = (
-    (0, TType.STRING, 'success', 'UTF8', None, ),  # 0
+all_structs.append(finish_write_result)
+finish_write_result.thrift_spec = (
 )
 
 
-class write_file_args(object):
+class finish_read_args(object):
     """
     Attributes:
      - filename
-     - filepath
+     - jobId
 
     """
 
 
-    def __init__(self, filename=None, filepath=None,):
+    def __init__(self, filename=None, jobId=None,):
         self.filename = filename
-        self.filepath = filepath
+        self.jobId = jobId
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1189,8 +3280,8 @@ class write_file_args(object):
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.STRING:
-                    self.filepath = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.I64:
+                    self.jobId = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1202,14 +3293,14 @@ class write_file_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('write_file_args')
+        oprot.writeStructBegin('finish_read_args')
         if self.filename is not None:
             oprot.writeFieldBegin('filename', TType.STRING, 1)
             oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
             oprot.writeFieldEnd()
-        if self.filepath is not None:
-            oprot.writeFieldBegin('filepath', TType.STRING, 2)
-            oprot.writeString(self.filepath.encode('utf-8') if sys.version_info[0] == 2 else self.filepath)
+        if self.jobId is not None:
+            oprot.writeFieldBegin('jobId', TType.I64, 2)
+            oprot.writeI64(self.jobId)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1227,15 +3318,15 @@ class write_file_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(write_file_args)
-write_file_args.thrift_spec = (
+all_structs.append(finish_read_args)
+finish_read_args.thrift_spec = (
     None,  # 0
     (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
-    (2, TType.STRING, 'filepath', 'UTF8', None, ),  # 2
+    (2, TType.I64, 'jobId', None, None, ),  # 2
 )
 
 
-class write_file_result(object):
+class finish_read_result(object):
 
 
     def read(self, iprot):
@@ -1256,7 +3347,7 @@ class write_file_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('write_file_result')
+        oprot.writeStructBegin('finish_read_result')
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1273,13 +3364,23 @@ class write_file_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(write_file_result)
-write_file_result.thrift_spec = (
+all_structs.append(finish_read_result)
+finish_read_result.thrift_spec = (
 )
 
 
-class confirm_operation_args(object):
+class finish_jobs_args(object):
+    """
+    Attributes:
+     - completions
+     - source
+
+    """
+
 
+    def __init__(self, completions=None, source=None,):
+        self.completions = completions
+        self.source = source
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1290,6 +3391,23 @@ class confirm_operation_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.completions = []
+                    (_etype75, _size72) = iprot.readListBegin()
+                    for _i76 in range(_size72):
+                        _elem77 = Completion()
+                        _elem77.read(iprot)
+                        self.completions.append(_elem77)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.source = ContactInfo()
+                    self.source.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1299,7 +3417,18 @@ class confirm_operation_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('confirm_operation_args')
+        oprot.writeStructBegin('finish_jobs_args')
+        if self.completions is not None:
+            oprot.writeFieldBegin('completions', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.completions))
+            for iter78 in self.completions:
+                iter78.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.source is not None:
+            oprot.writeFieldBegin('source', TType.STRUCT, 2)
+            self.source.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1316,12 +3445,15 @@ class confirm_operation_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(confirm_operation_args)
-confirm_operation_args.thrift_spec = (
+all_structs.append(finish_jobs_args)
+finish_jobs_args.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'completions', (TType.STRUCT, [Completion, None], False), None, ),  # 1
+    (2, TType.STRUCT, 'source', [ContactInfo, None], None, ),  # 2
 )
 
 
-class confirm_operation_result(object):
+class finish_jobs_result(object):
 
 
     def read(self, iprot):
@@ -1342,7 +3474,7 @@ class confirm_operation_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('confirm_operation_result')
+        oprot.writeStructBegin('finish_jobs_result')
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1359,21 +3491,13 @@ class confirm_operation_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(confirm_operation_result)
-confirm_operation_result.thrift_spec = (
+all_structs.append(finish_jobs_result)
+finish_jobs_result.thrift_spec = (
 )
 
 
-class get_version_args(object):
-    """
-    Attributes:
-     - filename
-
-    """
-
+class cord_list_files_args(object):
 
-    def __init__(self, filename=None,):
-        self.filename = filename
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1384,11 +3508,6 @@ class get_version_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1398,11 +3517,7 @@ class get_version_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('get_version_args')
-        if self.filename is not None:
-            oprot.writeFieldBegin('filename', TType.STRING, 1)
-            oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin('cord_list_files_args')
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1419,14 +3534,12 @@ class get_version_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(get_version_args)
-get_version_args.thrift_spec = (
-    None,  # 0
-    (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
+all_structs.append(cord_list_files_args)
+cord_list_files_args.thrift_spec = (
 )
 
 
-class get_version_result(object):
+class cord_list_files_result(object):
     """
     Attributes:
      - success
@@ -1447,8 +3560,14 @@ class get_version_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.I32:
-                    self.success = iprot.readI32()
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype82, _size79) = iprot.readListBegin()
+                    for _i83 in range(_size79):
+                        _elem84 = CompleteInfo()
+                        _elem84.read(iprot)
+                        self.success.append(_elem84)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1460,10 +3579,13 @@ class get_version_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('get_version_result')
+        oprot.writeStructBegin('cord_list_files_result')
         if self.success is not None:
-            oprot.writeFieldBegin('success', TType.I32, 0)
-            oprot.writeI32(self.success)
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter85 in self.success:
+                iter85.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1481,15 +3603,23 @@ class get_version_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(get_version_result)
-get_version_result.thrift_spec = (
-    (0, TType.I32, 'success', None, None, ),  # 0
+all_structs.append(cord_list_files_result)
+cord_list_files_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRUCT, [CompleteInfo, None], False), None, ),  # 0
 )
 
 
-class get_all_files_args(object):
+class get_file_size_args(object):
+    """
+    Attributes:
+     - filename
+
+    """
 
 
+    def __init__(self, filename=None,):
+        self.filename = filename
+
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
             iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
@@ -1499,6 +3629,11 @@ class get_all_files_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1508,7 +3643,11 @@ class get_all_files_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('get_all_files_args')
+        oprot.writeStructBegin('get_file_size_args')
+        if self.filename is not None:
+            oprot.writeFieldBegin('filename', TType.STRING, 1)
+            oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1525,12 +3664,14 @@ class get_all_files_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(get_all_files_args)
-get_all_files_args.thrift_spec = (
+all_structs.append(get_file_size_args)
+get_file_size_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
 )
 
 
-class get_all_files_result(object):
+class get_file_size_result(object):
     """
     Attributes:
      - success
@@ -1551,14 +3692,8 @@ class get_all_files_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype17, _size14) = iprot.readListBegin()
-                    for _i18 in range(_size14):
-                        _elem19 = FileInfo()
-                        _elem19.read(iprot)
-                        self.success.append(_elem19)
-                    iprot.readListEnd()
+                if ftype == TType.I64:
+                    self.success = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1570,13 +3705,10 @@ class get_all_files_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('get_all_files_result')
+        oprot.writeStructBegin('get_file_size_result')
         if self.success is not None:
-            oprot.writeFieldBegin('success', TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter20 in self.success:
-                iter20.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin('success', TType.I64, 0)
+            oprot.writeI64(self.success)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1594,26 +3726,26 @@ class get_all_files_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(get_all_files_result)
-get_all_files_result.thrift_spec = (
-    (0, TType.LIST, 'success', (TType.STRUCT, [FileInfo, None], False), None, ),  # 0
+all_structs.append(get_file_size_result)
+get_file_size_result.thrift_spec = (
+    (0, TType.I64, 'success', None, None, ),  # 0
 )
 
 
-class node_write_file_args(object):
+class request_data_args(object):
     """
     Attributes:
      - filename
-     - filepath
-     - version
+     - offest
+     - size
 
     """
 
 
-    def __init__(self, filename=None, filepath=None, version=None,):
+    def __init__(self, filename=None, offest=None, size=None,):
         self.filename = filename
-        self.filepath = filepath
-        self.version = version
+        self.offest = offest
+        self.size = size
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1630,13 +3762,13 @@ class node_write_file_args(object):
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.STRING:
-                    self.filepath = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.I32:
+                    self.offest = iprot.readI32()
                 else:
                     iprot.skip(ftype)
             elif fid == 3:
                 if ftype == TType.I32:
-                    self.version = iprot.readI32()
+                    self.size = iprot.readI32()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1648,18 +3780,18 @@ class node_write_file_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('node_write_file_args')
+        oprot.writeStructBegin('request_data_args')
         if self.filename is not None:
             oprot.writeFieldBegin('filename', TType.STRING, 1)
             oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
             oprot.writeFieldEnd()
-        if self.filepath is not None:
-            oprot.writeFieldBegin('filepath', TType.STRING, 2)
-            oprot.writeString(self.filepath.encode('utf-8') if sys.version_info[0] == 2 else self.filepath)
+        if self.offest is not None:
+            oprot.writeFieldBegin('offest', TType.I32, 2)
+            oprot.writeI32(self.offest)
             oprot.writeFieldEnd()
-        if self.version is not None:
-            oprot.writeFieldBegin('version', TType.I32, 3)
-            oprot.writeI32(self.version)
+        if self.size is not None:
+            oprot.writeFieldBegin('size', TType.I32, 3)
+            oprot.writeI32(self.size)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1677,17 +3809,25 @@ class node_write_file_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(node_write_file_args)
-node_write_file_args.thrift_spec = (
+all_structs.append(request_data_args)
+request_data_args.thrift_spec = (
     None,  # 0
     (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
-    (2, TType.STRING, 'filepath', 'UTF8', None, ),  # 2
-    (3, TType.I32, 'version', None, None, ),  # 3
+    (2, TType.I32, 'offest', None, None, ),  # 2
+    (3, TType.I32, 'size', None, None, ),  # 3
 )
 
 
-class node_write_file_result(object):
+class request_data_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
 
+    def __init__(self, success=None,):
+        self.success = success
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1698,6 +3838,11 @@ class node_write_file_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1707,7 +3852,11 @@ class node_write_file_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('node_write_file_result')
+        oprot.writeStructBegin('request_data_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRING, 0)
+            oprot.writeBinary(self.success)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1724,21 +3873,30 @@ class node_write_file_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(node_write_file_result)
-node_write_file_result.thrift_spec = (
+all_structs.append(request_data_result)
+request_data_result.thrift_spec = (
+    (0, TType.STRING, 'success', 'BINARY', None, ),  # 0
 )
 
 
-class insert_job_args(object):
+class copy_file_args(object):
     """
     Attributes:
-     - request
+     - version
+     - filename
+     - ip
+     - port
+     - chunk_size
 
     """
 
 
-    def __init__(self, request=None,):
-        self.request = request
+    def __init__(self, version=None, filename=None, ip=None, port=None, chunk_size=None,):
+        self.version = version
+        self.filename = filename
+        self.ip = ip
+        self.port = port
+        self.chunk_size = chunk_size
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1750,9 +3908,28 @@ class insert_job_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.request = Request()
-                    self.request.read(iprot)
+                if ftype == TType.I32:
+                    self.version = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.ip = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I32:
+                    self.port = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.I32:
+                    self.chunk_size = iprot.readI32()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1764,10 +3941,26 @@ class insert_job_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('insert_job_args')
-        if self.request is not None:
-            oprot.writeFieldBegin('request', TType.STRUCT, 1)
-            self.request.write(oprot)
+        oprot.writeStructBegin('copy_file_args')
+        if self.version is not None:
+            oprot.writeFieldBegin('version', TType.I32, 1)
+            oprot.writeI32(self.version)
+            oprot.writeFieldEnd()
+        if self.filename is not None:
+            oprot.writeFieldBegin('filename', TType.STRING, 2)
+            oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
+            oprot.writeFieldEnd()
+        if self.ip is not None:
+            oprot.writeFieldBegin('ip', TType.STRING, 3)
+            oprot.writeString(self.ip.encode('utf-8') if sys.version_info[0] == 2 else self.ip)
+            oprot.writeFieldEnd()
+        if self.port is not None:
+            oprot.writeFieldBegin('port', TType.I32, 4)
+            oprot.writeI32(self.port)
+            oprot.writeFieldEnd()
+        if self.chunk_size is not None:
+            oprot.writeFieldBegin('chunk_size', TType.I32, 5)
+            oprot.writeI32(self.chunk_size)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1785,23 +3978,19 @@ class insert_job_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(insert_job_args)
-insert_job_args.thrift_spec = (
+all_structs.append(copy_file_args)
+copy_file_args.thrift_spec = (
     None,  # 0
-    (1, TType.STRUCT, 'request', [Request, None], None, ),  # 1
+    (1, TType.I32, 'version', None, None, ),  # 1
+    (2, TType.STRING, 'filename', 'UTF8', None, ),  # 2
+    (3, TType.STRING, 'ip', 'UTF8', None, ),  # 3
+    (4, TType.I32, 'port', None, None, ),  # 4
+    (5, TType.I32, 'chunk_size', None, None, ),  # 5
 )
 
 
-class insert_job_result(object):
-    """
-    Attributes:
-     - success
-
-    """
-
+class copy_file_result(object):
 
-    def __init__(self, success=None,):
-        self.success = success
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1812,12 +4001,6 @@ class insert_job_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = Response()
-                    self.success.read(iprot)
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1827,11 +4010,7 @@ class insert_job_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('insert_job_result')
-        if self.success is not None:
-            oprot.writeFieldBegin('success', TType.STRUCT, 0)
-            self.success.write(oprot)
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin('copy_file_result')
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1848,32 +4027,35 @@ class insert_job_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(insert_job_result)
-insert_job_result.thrift_spec = (
-    (0, TType.STRUCT, 'success', [Response, None], None, ),  # 0
+all_structs.append(copy_file_result)
+copy_file_result.thrift_spec = (
 )
 
 
-class finish_write_args(object):
+class stream_file_args(object):
     """
     Attributes:
-     - version
      - filename
-     - ip
-     - port
-     - source_ip
-     - source_port
+     - offset
+     - length
+     - receiver
+     - streamId
+     - chunk_size
+     - window
+     - deadline
 
     """
 
 
-    def __init__(self, version=None, filename=None, ip=None, port=None, source_ip=None, source_port=None,):
-        self.version = version
+    def __init__(self, filename=None, offset=None, length=None, receiver=None, streamId=None, chunk_size=None, window=None, deadline=None,):
         self.filename = filename
-        self.ip = ip
-        self.port = port
-        self.source_ip = source_ip
-        self.source_port = source_port
+        self.offset = offset
+        self.length = length
+        self.receiver = receiver
+        self.streamId = streamId
+        self.chunk_size = chunk_size
+        self.window = window
+        self.deadline = deadline
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1885,33 +4067,44 @@ class finish_write_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I32:
-                    self.version = iprot.readI32()
+                if ftype == TType.STRING:
+                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.STRING:
-                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.I64:
+                    self.offset = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             elif fid == 3:
-                if ftype == TType.STRING:
-                    self.ip = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.I64:
+                    self.length = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             elif fid == 4:
-                if ftype == TType.I32:
-                    self.port = iprot.readI32()
+                if ftype == TType.STRUCT:
+                    self.receiver = ContactInfo()
+                    self.receiver.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 5:
-                if ftype == TType.STRING:
-                    self.source_ip = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.I64:
+                    self.streamId = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             elif fid == 6:
                 if ftype == TType.I32:
-                    self.source_port = iprot.readI32()
+                    self.chunk_size = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.I32:
+                    self.window = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.DOUBLE:
+                    self.deadline = iprot.readDouble()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1923,30 +4116,38 @@ class finish_write_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('finish_write_args')
-        if self.version is not None:
-            oprot.writeFieldBegin('version', TType.I32, 1)
-            oprot.writeI32(self.version)
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin('stream_file_args')
         if self.filename is not None:
-            oprot.writeFieldBegin('filename', TType.STRING, 2)
+            oprot.writeFieldBegin('filename', TType.STRING, 1)
             oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
             oprot.writeFieldEnd()
-        if self.ip is not None:
-            oprot.writeFieldBegin('ip', TType.STRING, 3)
-            oprot.writeString(self.ip.encode('utf-8') if sys.version_info[0] == 2 else self.ip)
+        if self.offset is not None:
+            oprot.writeFieldBegin('offset', TType.I64, 2)
+            oprot.writeI64(self.offset)
             oprot.writeFieldEnd()
-        if self.port is not None:
-            oprot.writeFieldBegin('port', TType.I32, 4)
-            oprot.writeI32(self.port)
+        if self.length is not None:
+            oprot.writeFieldBegin('length', TType.I64, 3)
+            oprot.writeI64(self.length)
             oprot.writeFieldEnd()
-        if self.source_ip is not None:
-            oprot.writeFieldBegin('source_ip', TType.STRING, 5)
-            oprot.writeString(self.source_ip.encode('utf-8') if sys.version_info[0] == 2 else self.source_ip)
+        if self.receiver is not None:
+            oprot.writeFieldBegin('receiver', TType.STRUCT, 4)
+            self.receiver.write(oprot)
             oprot.writeFieldEnd()
-        if self.source_port is not None:
-            oprot.writeFieldBegin('source_port', TType.I32, 6)
-            oprot.writeI32(self.source_port)
+        if self.streamId is not None:
+            oprot.writeFieldBegin('streamId', TType.I64, 5)
+            oprot.writeI64(self.streamId)
+            oprot.writeFieldEnd()
+        if self.chunk_size is not None:
+            oprot.writeFieldBegin('chunk_size', TType.I32, 6)
+            oprot.writeI32(self.chunk_size)
+            oprot.writeFieldEnd()
+        if self.window is not None:
+            oprot.writeFieldBegin('window', TType.I32, 7)
+            oprot.writeI32(self.window)
+            oprot.writeFieldEnd()
+        if self.deadline is not None:
+            oprot.writeFieldBegin('deadline', TType.DOUBLE, 8)
+            oprot.writeDouble(self.deadline)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1964,21 +4165,94 @@ class finish_write_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(finish_write_args)
-finish_write_args.thrift_spec = (
+all_structs.append(stream_file_args)
+stream_file_args.thrift_spec = (
     None,  # 0
-    (1, TType.I32, 'version', None, None, ),  # 1
-    (2, TType.STRING, 'filename', 'UTF8', None, ),  # 2
-    (3, TType.STRING, 'ip', 'UTF8', None, ),  # 3
-    (4, TType.I32, 'port', None, None, ),  # 4
-    (5, TType.STRING, 'source_ip', 'UTF8', None, ),  # 5
-    (6, TType.I32, 'source_port', None, None, ),  # 6
+    (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
+    (2, TType.I64, 'offset', None, None, ),  # 2
+    (3, TType.I64, 'length', None, None, ),  # 3
+    (4, TType.STRUCT, 'receiver', [ContactInfo, None], None, ),  # 4
+    (5, TType.I64, 'streamId', None, None, ),  # 5
+    (6, TType.I32, 'chunk_size', None, None, ),  # 6
+    (7, TType.I32, 'window', None, None, ),  # 7
+    (8, TType.DOUBLE, 'deadline', None, None, ),  # 8
+)
+
+
+class stream_file_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.I64:
+                    self.success = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('stream_file_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.I64, 0)
+            oprot.writeI64(self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(stream_file_result)
+stream_file_result.thrift_spec = (
+    (0, TType.I64, 'success', None, None, ),  # 0
 )
 
 
-class finish_write_result(object):
+class stream_chunk_args(object):
+    """
+    Attributes:
+     - streamId
+     - data
+
+    """
 
 
+    def __init__(self, streamId=None, data=None,):
+        self.streamId = streamId
+        self.data = data
+
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
             iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
@@ -1988,6 +4262,16 @@ class finish_write_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.streamId = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.data = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1997,7 +4281,15 @@ class finish_write_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('finish_write_result')
+        oprot.writeStructBegin('stream_chunk_args')
+        if self.streamId is not None:
+            oprot.writeFieldBegin('streamId', TType.I64, 1)
+            oprot.writeI64(self.streamId)
+            oprot.writeFieldEnd()
+        if self.data is not None:
+            oprot.writeFieldBegin('data', TType.STRING, 2)
+            oprot.writeBinary(self.data)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -2014,14 +4306,25 @@ class finish_write_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(finish_write_result)
-finish_write_result.thrift_spec = (
+all_structs.append(stream_chunk_args)
+stream_chunk_args.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'streamId', None, None, ),  # 1
+    (2, TType.STRING, 'data', 'BINARY', None, ),  # 2
 )
 
 
-class finish_read_args(object):
+class stream_sync_args(object):
+    """
+    Attributes:
+     - streamId
+
+    """
 
 
+    def __init__(self, streamId=None,):
+        self.streamId = streamId
+
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
             iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
@@ -2031,6 +4334,11 @@ class finish_read_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.streamId = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -2040,7 +4348,11 @@ class finish_read_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('finish_read_args')
+        oprot.writeStructBegin('stream_sync_args')
+        if self.streamId is not None:
+            oprot.writeFieldBegin('streamId', TType.I64, 1)
+            oprot.writeI64(self.streamId)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -2057,13 +4369,23 @@ class finish_read_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(finish_read_args)
-finish_read_args.thrift_spec = (
+all_structs.append(stream_sync_args)
+stream_sync_args.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'streamId', None, None, ),  # 1
 )
 
 
-class finish_read_result(object):
+class stream_sync_result(object):
+    """
+    Attributes:
+     - success
 
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2074,6 +4396,11 @@ class finish_read_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 0:
+                if ftype == TType.I64:
+                    self.success = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -2083,7 +4410,11 @@ class finish_read_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('finish_read_result')
+        oprot.writeStructBegin('stream_sync_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.I64, 0)
+            oprot.writeI64(self.success)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -2100,14 +4431,27 @@ class finish_read_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(finish_read_result)
-finish_read_result.thrift_spec = (
+all_structs.append(stream_sync_result)
+stream_sync_result.thrift_spec = (
+    (0, TType.I64, 'success', None, None, ),  # 0
 )
 
 
-class cord_list_files_args(object):
+class open_bulk_args(object):
+    """
+    Attributes:
+     - filename
+     - offset
+     - length
+
+    """
 
 
+    def __init__(self, filename=None, offset=None, length=None,):
+        self.filename = filename
+        self.offset = offset
+        self.length = length
+
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
             iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
@@ -2117,6 +4461,21 @@ class cord_list_files_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.offset = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I64:
+                    self.length = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -2126,7 +4485,19 @@ class cord_list_files_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('cord_list_files_args')
+        oprot.writeStructBegin('open_bulk_args')
+        if self.filename is not None:
+            oprot.writeFieldBegin('filename', TType.STRING, 1)
+            oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
+            oprot.writeFieldEnd()
+        if self.offset is not None:
+            oprot.writeFieldBegin('offset', TType.I64, 2)
+            oprot.writeI64(self.offset)
+            oprot.writeFieldEnd()
+        if self.length is not None:
+            oprot.writeFieldBegin('length', TType.I64, 3)
+            oprot.writeI64(self.length)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -2143,12 +4514,16 @@ class cord_list_files_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(cord_list_files_args)
-cord_list_files_args.thrift_spec = (
+all_structs.append(open_bulk_args)
+open_bulk_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
+    (2, TType.I64, 'offset', None, None, ),  # 2
+    (3, TType.I64, 'length', None, None, ),  # 3
 )
 
 
-class cord_list_files_result(object):
+class open_bulk_result(object):
     """
     Attributes:
      - success
@@ -2169,14 +4544,9 @@ class cord_list_files_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype24, _size21) = iprot.readListBegin()
-                    for _i25 in range(_size21):
-                        _elem26 = CompleteInfo()
-                        _elem26.read(iprot)
-                        self.success.append(_elem26)
-                    iprot.readListEnd()
+                if ftype == TType.STRUCT:
+                    self.success = BulkTicket()
+                    self.success.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -2188,13 +4558,10 @@ class cord_list_files_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('cord_list_files_result')
+        oprot.writeStructBegin('open_bulk_result')
         if self.success is not None:
-            oprot.writeFieldBegin('success', TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter27 in self.success:
-                iter27.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -2212,22 +4579,26 @@ class cord_list_files_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(cord_list_files_result)
-cord_list_files_result.thrift_spec = (
-    (0, TType.LIST, 'success', (TType.STRUCT, [CompleteInfo, None], False), None, ),  # 0
+all_structs.append(open_bulk_result)
+open_bulk_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [BulkTicket, None], None, ),  # 0
 )
 
 
-class get_file_size_args(object):
+class request_delta_args(object):
     """
     Attributes:
      - filename
+     - block_size
+     - signatures
 
     """
 
 
-    def __init__(self, filename=None,):
+    def __init__(self, filename=None, block_size=None, signatures=None,):
         self.filename = filename
+        self.block_size = block_size
+        self.signatures = signatures
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2243,6 +4614,22 @@ class get_file_size_args(object):
                     self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.block_size = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.LIST:
+                    self.signatures = []
+                    (_etype89, _size86) = iprot.readListBegin()
+                    for _i90 in range(_size86):
+                        _elem91 = BlockSignature()
+                        _elem91.read(iprot)
+                        self.signatures.append(_elem91)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -2252,11 +4639,22 @@ class get_file_size_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('get_file_size_args')
+        oprot.writeStructBegin('request_delta_args')
         if self.filename is not None:
             oprot.writeFieldBegin('filename', TType.STRING, 1)
             oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
             oprot.writeFieldEnd()
+        if self.block_size is not None:
+            oprot.writeFieldBegin('block_size', TType.I32, 2)
+            oprot.writeI32(self.block_size)
+            oprot.writeFieldEnd()
+        if self.signatures is not None:
+            oprot.writeFieldBegin('signatures', TType.LIST, 3)
+            oprot.writeListBegin(TType.STRUCT, len(self.signatures))
+            for iter92 in self.signatures:
+                iter92.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -2273,14 +4671,16 @@ class get_file_size_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(get_file_size_args)
-get_file_size_args.thrift_spec = (
+all_structs.append(request_delta_args)
+request_delta_args.thrift_spec = (
     None,  # 0
     (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
+    (2, TType.I32, 'block_size', None, None, ),  # 2
+    (3, TType.LIST, 'signatures', (TType.STRUCT, [BlockSignature, None], False), None, ),  # 3
 )
 
 
-class get_file_size_result(object):
+class request_delta_result(object):
     """
     Attributes:
      - success
@@ -2301,8 +4701,9 @@ class get_file_size_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.I64:
-                    self.success = iprot.readI64()
+                if ftype == TType.STRUCT:
+                    self.success = Delta()
+                    self.success.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -2314,10 +4715,10 @@ class get_file_size_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('get_file_size_result')
+        oprot.writeStructBegin('request_delta_result')
         if self.success is not None:
-            oprot.writeFieldBegin('success', TType.I64, 0)
-            oprot.writeI64(self.success)
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -2335,26 +4736,24 @@ class get_file_size_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(get_file_size_result)
-get_file_size_result.thrift_spec = (
-    (0, TType.I64, 'success', None, None, ),  # 0
+all_structs.append(request_delta_result)
+request_delta_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [Delta, None], None, ),  # 0
 )
 
 
-class request_data_args(object):
+class negotiate_compression_args(object):
     """
     Attributes:
      - filename
-     - offest
-     - size
+     - codecs
 
     """
 
 
-    def __init__(self, filename=None, offest=None, size=None,):
+    def __init__(self, filename=None, codecs=None,):
         self.filename = filename
-        self.offest = offest
-        self.size = size
+        self.codecs = codecs
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2371,13 +4770,13 @@ class request_data_args(object):
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.I32:
-                    self.offest = iprot.readI32()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.I32:
-                    self.size = iprot.readI32()
+                if ftype == TType.LIST:
+                    self.codecs = []
+                    (_etype96, _size93) = iprot.readListBegin()
+                    for _i97 in range(_size93):
+                        _elem98 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        self.codecs.append(_elem98)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -2389,18 +4788,17 @@ class request_data_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('request_data_args')
+        oprot.writeStructBegin('negotiate_compression_args')
         if self.filename is not None:
             oprot.writeFieldBegin('filename', TType.STRING, 1)
             oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
             oprot.writeFieldEnd()
-        if self.offest is not None:
-            oprot.writeFieldBegin('offest', TType.I32, 2)
-            oprot.writeI32(self.offest)
-            oprot.writeFieldEnd()
-        if self.size is not None:
-            oprot.writeFieldBegin('size', TType.I32, 3)
-            oprot.writeI32(self.size)
+        if self.codecs is not None:
+            oprot.writeFieldBegin('codecs', TType.LIST, 2)
+            oprot.writeListBegin(TType.STRING, len(self.codecs))
+            for iter99 in self.codecs:
+                oprot.writeString(iter99.encode('utf-8') if sys.version_info[0] == 2 else iter99)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -2418,16 +4816,15 @@ class request_data_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(request_data_args)
-request_data_args.thrift_spec = (
+all_structs.append(negotiate_compression_args)
+negotiate_compression_args.thrift_spec = (
     None,  # 0
     (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
-    (2, TType.I32, 'offest', None, None, ),  # 2
-    (3, TType.I32, 'size', None, None, ),  # 3
+    (2, TType.LIST, 'codecs', (TType.STRING, 'UTF8', False), None, ),  # 2
 )
 
 
-class request_data_result(object):
+class negotiate_compression_result(object):
     """
     Attributes:
      - success
@@ -2449,7 +4846,7 @@ class request_data_result(object):
                 break
             if fid == 0:
                 if ftype == TType.STRING:
-                    self.success = iprot.readBinary()
+                    self.success = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
             else:
@@ -2461,10 +4858,10 @@ class request_data_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('request_data_result')
+        oprot.writeStructBegin('negotiate_compression_result')
         if self.success is not None:
             oprot.writeFieldBegin('success', TType.STRING, 0)
-            oprot.writeBinary(self.success)
+            oprot.writeString(self.success.encode('utf-8') if sys.version_info[0] == 2 else self.success)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -2482,28 +4879,30 @@ class request_data_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(request_data_result)
-request_data_result.thrift_spec = (
-    (0, TType.STRING, 'success', 'BINARY', None, ),  # 0
+all_structs.append(negotiate_compression_result)
+negotiate_compression_result.thrift_spec = (
+    (0, TType.STRING, 'success', 'UTF8', None, ),  # 0
 )
 
 
-class copy_file_args(object):
+class request_compressed_args(object):
     """
     Attributes:
-     - version
      - filename
-     - ip
-     - port
+     - offset
+     - size
+     - codec
+     - level
 
     """
 
 
-    def __init__(self, version=None, filename=None, ip=None, port=None,):
-        self.version = version
+    def __init__(self, filename=None, offset=None, size=None, codec=None, level=None,):
         self.filename = filename
-        self.ip = ip
-        self.port = port
+        self.offset = offset
+        self.size = size
+        self.codec = codec
+        self.level = level
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2515,23 +4914,28 @@ class copy_file_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I32:
-                    self.version = iprot.readI32()
+                if ftype == TType.STRING:
+                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.STRING:
-                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.I64:
+                    self.offset = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             elif fid == 3:
-                if ftype == TType.STRING:
-                    self.ip = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.I32:
+                    self.size = iprot.readI32()
                 else:
                     iprot.skip(ftype)
             elif fid == 4:
+                if ftype == TType.STRING:
+                    self.codec = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
                 if ftype == TType.I32:
-                    self.port = iprot.readI32()
+                    self.level = iprot.readI32()
                 else:
                     iprot.skip(ftype)
             else:
@@ -2543,22 +4947,26 @@ class copy_file_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('copy_file_args')
-        if self.version is not None:
-            oprot.writeFieldBegin('version', TType.I32, 1)
-            oprot.writeI32(self.version)
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin('request_compressed_args')
         if self.filename is not None:
-            oprot.writeFieldBegin('filename', TType.STRING, 2)
+            oprot.writeFieldBegin('filename', TType.STRING, 1)
             oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
             oprot.writeFieldEnd()
-        if self.ip is not None:
-            oprot.writeFieldBegin('ip', TType.STRING, 3)
-            oprot.writeString(self.ip.encode('utf-8') if sys.version_info[0] == 2 else self.ip)
+        if self.offset is not None:
+            oprot.writeFieldBegin('offset', TType.I64, 2)
+            oprot.writeI64(self.offset)
             oprot.writeFieldEnd()
-        if self.port is not None:
-            oprot.writeFieldBegin('port', TType.I32, 4)
-            oprot.writeI32(self.port)
+        if self.size is not None:
+            oprot.writeFieldBegin('size', TType.I32, 3)
+            oprot.writeI32(self.size)
+            oprot.writeFieldEnd()
+        if self.codec is not None:
+            oprot.writeFieldBegin('codec', TType.STRING, 4)
+            oprot.writeString(self.codec.encode('utf-8') if sys.version_info[0] == 2 else self.codec)
+            oprot.writeFieldEnd()
+        if self.level is not None:
+            oprot.writeFieldBegin('level', TType.I32, 5)
+            oprot.writeI32(self.level)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -2576,18 +4984,27 @@ class copy_file_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(copy_file_args)
-copy_file_args.thrift_spec = (
+all_structs.append(request_compressed_args)
+request_compressed_args.thrift_spec = (
     None,  # 0
-    (1, TType.I32, 'version', None, None, ),  # 1
-    (2, TType.STRING, 'filename', 'UTF8', None, ),  # 2
-    (3, TType.STRING, 'ip', 'UTF8', None, ),  # 3
-    (4, TType.I32, 'port', None, None, ),  # 4
+    (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
+    (2, TType.I64, 'offset', None, None, ),  # 2
+    (3, TType.I32, 'size', None, None, ),  # 3
+    (4, TType.STRING, 'codec', 'UTF8', None, ),  # 4
+    (5, TType.I32, 'level', None, None, ),  # 5
 )
 
 
-class copy_file_result(object):
+class request_compressed_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
 
+    def __init__(self, success=None,):
+        self.success = success
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2598,6 +5015,12 @@ class copy_file_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = CompressedChunk()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -2607,7 +5030,11 @@ class copy_file_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('copy_file_result')
+        oprot.writeStructBegin('request_compressed_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -2624,8 +5051,9 @@ class copy_file_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(copy_file_result)
-copy_file_result.thrift_spec = (
+all_structs.append(request_compressed_result)
+request_compressed_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [CompressedChunk, None], None, ),  # 0
 )
 fix_spec(all_structs)
 del all_structs
@@ -235,13 +235,19 @@ class Request(object):
     Attributes:
      - type
      - filename
+     - requester
+     - priority
+     - deadline
 
     """
 
 
-    def __init__(self, type=None, filename=None,):
+    def __init__(self, type=None, filename=None, requester=None, priority=None, deadline=None,):
         self.type = type
         self.filename = filename
+        self.requester = requester
+        self.priority = priority
+        self.deadline = deadline
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -262,6 +268,22 @@ class Request(object):
                     self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.requester = ContactInfo()
+                    self.requester.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.priority = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.DOUBLE:
+                    self.deadline = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -280,6 +302,490 @@ class Request(object):
             oprot.writeFieldBegin('filename', TType.STRING, 2)
             oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
             oprot.writeFieldEnd()
+        if self.requester is not None:
+            oprot.writeFieldBegin('requester', TType.STRUCT, 3)
+            self.requester.write(oprot)
+            oprot.writeFieldEnd()
+        if self.priority is not None:
+            oprot.writeFieldBegin('priority', TType.STRING, 4)
+            oprot.writeString(self.priority.encode('utf-8') if sys.version_info[0] == 2 else self.priority)
+            oprot.writeFieldEnd()
+        if self.deadline is not None:
+            oprot.writeFieldBegin('deadline', TType.DOUBLE, 5)
+            oprot.writeDouble(self.deadline)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class Completion(object):
+    """
+    Attributes:
+     - jobId
+     - filename
+     - version
+     - type
+
+    """
+
+
+    def __init__(self, jobId=None, filename=None, version=None, type=None,):
+        self.jobId = jobId
+        self.filename = filename
+        self.version = version
+        self.type = type
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.jobId = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.version = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.type = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('Completion')
+        if self.jobId is not None:
+            oprot.writeFieldBegin('jobId', TType.I64, 1)
+            oprot.writeI64(self.jobId)
+            oprot.writeFieldEnd()
+        if self.filename is not None:
+            oprot.writeFieldBegin('filename', TType.STRING, 2)
+            oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
+            oprot.writeFieldEnd()
+        if self.version is not None:
+            oprot.writeFieldBegin('version', TType.I32, 3)
+            oprot.writeI32(self.version)
+            oprot.writeFieldEnd()
+        if self.type is not None:
+            oprot.writeFieldBegin('type', TType.STRING, 4)
+            oprot.writeString(self.type.encode('utf-8') if sys.version_info[0] == 2 else self.type)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class BulkTicket(object):
+    """
+    Attributes:
+     - token
+     - port
+     - size
+
+    """
+
+
+    def __init__(self, token=None, port=None, size=None,):
+        self.token = token
+        self.port = port
+        self.size = size
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.token = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.port = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I64:
+                    self.size = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('BulkTicket')
+        if self.token is not None:
+            oprot.writeFieldBegin('token', TType.I64, 1)
+            oprot.writeI64(self.token)
+            oprot.writeFieldEnd()
+        if self.port is not None:
+            oprot.writeFieldBegin('port', TType.I32, 2)
+            oprot.writeI32(self.port)
+            oprot.writeFieldEnd()
+        if self.size is not None:
+            oprot.writeFieldBegin('size', TType.I64, 3)
+            oprot.writeI64(self.size)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class BlockSignature(object):
+    """
+    Attributes:
+     - weak
+     - strong
+
+    """
+
+
+    def __init__(self, weak=None, strong=None,):
+        self.weak = weak
+        self.strong = strong
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.weak = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.strong = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('BlockSignature')
+        if self.weak is not None:
+            oprot.writeFieldBegin('weak', TType.I64, 1)
+            oprot.writeI64(self.weak)
+            oprot.writeFieldEnd()
+        if self.strong is not None:
+            oprot.writeFieldBegin('strong', TType.STRING, 2)
+            oprot.writeBinary(self.strong)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class DeltaOp(object):
+    """
+    Attributes:
+     - block
+     - offset
+     - length
+     - data
+
+    """
+
+
+    def __init__(self, block=None, offset=None, length=None, data=None,):
+        self.block = block
+        self.offset = offset
+        self.length = length
+        self.data = data
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I32:
+                    self.block = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.offset = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I64:
+                    self.length = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.data = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('DeltaOp')
+        if self.block is not None:
+            oprot.writeFieldBegin('block', TType.I32, 1)
+            oprot.writeI32(self.block)
+            oprot.writeFieldEnd()
+        if self.offset is not None:
+            oprot.writeFieldBegin('offset', TType.I64, 2)
+            oprot.writeI64(self.offset)
+            oprot.writeFieldEnd()
+        if self.length is not None:
+            oprot.writeFieldBegin('length', TType.I64, 3)
+            oprot.writeI64(self.length)
+            oprot.writeFieldEnd()
+        if self.data is not None:
+            oprot.writeFieldBegin('data', TType.STRING, 4)
+            oprot.writeBinary(self.data)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class Delta(object):
+    """
+    Attributes:
+     - ops
+     - checksum
+
+    """
+
+
+    def __init__(self, ops=None, checksum=None,):
+        self.ops = ops
+        self.checksum = checksum
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.ops = []
+                    (_etype10, _size7) = iprot.readListBegin()
+                    for _i11 in range(_size7):
+                        _elem12 = DeltaOp()
+                        _elem12.read(iprot)
+                        self.ops.append(_elem12)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.checksum = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('Delta')
+        if self.ops is not None:
+            oprot.writeFieldBegin('ops', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.ops))
+            for iter13 in self.ops:
+                iter13.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.checksum is not None:
+            oprot.writeFieldBegin('checksum', TType.I64, 2)
+            oprot.writeI64(self.checksum)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class CompressedChunk(object):
+    """
+    Attributes:
+     - codec
+     - data
+
+    """
+
+
+    def __init__(self, codec=None, data=None,):
+        self.codec = codec
+        self.data = data
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.codec = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.data = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('CompressedChunk')
+        if self.codec is not None:
+            oprot.writeFieldBegin('codec', TType.STRING, 1)
+            oprot.writeString(self.codec.encode('utf-8') if sys.version_info[0] == 2 else self.codec)
+            oprot.writeFieldEnd()
+        if self.data is not None:
+            oprot.writeFieldBegin('data', TType.STRING, 2)
+            oprot.writeBinary(self.data)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -303,13 +809,19 @@ class Response(object):
     Attributes:
      - version
      - contact
+     - jobId
+     - retryAfter
+     - holders
 
     """
 
 
-    def __init__(self, version=None, contact=None,):
+    def __init__(self, version=None, contact=None, jobId=None, retryAfter=None, holders=None,):
         self.version = version
         self.contact = contact
+        self.jobId = jobId
+        self.retryAfter = retryAfter
+        self.holders = holders
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -331,6 +843,27 @@ class Response(object):
                     self.contact.read(iprot)
                 else:
                     iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I64:
+                    self.jobId = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.DOUBLE:
+                    self.retryAfter = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.LIST:
+                    self.holders = []
+                    (_etype17, _size14) = iprot.readListBegin()
+                    for _i18 in range(_size14):
+                        _elem19 = ContactInfo()
+                        _elem19.read(iprot)
+                        self.holders.append(_elem19)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -349,6 +882,21 @@ class Response(object):
             oprot.writeFieldBegin('contact', TType.STRUCT, 2)
             self.contact.write(oprot)
             oprot.writeFieldEnd()
+        if self.jobId is not None:
+            oprot.writeFieldBegin('jobId', TType.I64, 3)
+            oprot.writeI64(self.jobId)
+            oprot.writeFieldEnd()
+        if self.retryAfter is not None:
+            oprot.writeFieldBegin('retryAfter', TType.DOUBLE, 4)
+            oprot.writeDouble(self.retryAfter)
+            oprot.writeFieldEnd()
+        if self.holders is not None:
+            oprot.writeFieldBegin('holders', TType.LIST, 5)
+            oprot.writeListBegin(TType.STRUCT, len(self.holders))
+            for iter20 in self.holders:
+                iter20.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -388,12 +936,59 @@ Request.thrift_spec = (
     None,  # 0
     (1, TType.STRING, 'type', 'UTF8', None, ),  # 1
     (2, TType.STRING, 'filename', 'UTF8', None, ),  # 2
+    (3, TType.STRUCT, 'requester', [ContactInfo, None], None, ),  # 3
+    (4, TType.STRING, 'priority', 'UTF8', None, ),  # 4
+    (5, TType.DOUBLE, 'deadline', None, None, ),  # 5
+)
+all_structs.append(Completion)
+Completion.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'jobId', None, None, ),  # 1
+    (2, TType.STRING, 'filename', 'UTF8', None, ),  # 2
+    (3, TType.I32, 'version', None, None, ),  # 3
+    (4, TType.STRING, 'type', 'UTF8', None, ),  # 4
+)
+all_structs.append(BulkTicket)
+BulkTicket.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'token', None, None, ),  # 1
+    (2, TType.I32, 'port', None, None, ),  # 2
+    (3, TType.I64, 'size', None, None, ),  # 3
+)
+all_structs.append(BlockSignature)
+BlockSignature.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'weak', None, None, ),  # 1
+    (2, TType.STRING, 'strong', 'BINARY', None, ),  # 2
+)
+all_structs.append(DeltaOp)
+DeltaOp.thrift_spec = (
+    None,  # 0
+    (1, TType.I32, 'block', None, None, ),  # 1
+    (2, TType.I64, 'offset', None, None, ),  # 2
+    (3, TType.I64, 'length', None, None, ),  # 3
+    (4, TType.STRING, 'data', 'BINARY', None, ),  # 4
+)
+all_structs.append(Delta)
+Delta.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'ops', (TType.STRUCT, [DeltaOp, None], False), None, ),  # 1
+    (2, TType.I64, 'checksum', None, None, ),  # 2
+)
+all_structs.append(CompressedChunk)
+CompressedChunk.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'codec', 'UTF8', None, ),  # 1
+    (2, TType.STRING, 'data', 'BINARY', None, ),  # 2
 )
 all_structs.append(Response)
 Response.thrift_spec = (
     None,  # 0
     (1, TType.I32, 'version', None, None, ),  # 1
     (2, TType.STRUCT, 'contact', [ContactInfo, None], None, ),  # 2
+    (3, TType.I64, 'jobId', None, None, ),  # 3
+    (4, TType.DOUBLE, 'retryAfter', None, None, ),  # 4
+    (5, TType.LIST, 'holders', (TType.STRUCT, [ContactInfo, None], False), None, ),  # 5
 )
 fix_spec(all_structs)
 del all_structs
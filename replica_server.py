@@ -17,6 +17,32 @@ Usage:
     Options:
         -h, --help    show this help message and exit
         -d, --debug   Enable debug output
+        --hedge-extra N   Spare replicas to query on top of NR/NW (coordinator)
+        --hedge-delay MS  Milliseconds to wait before querying the spares
+        --push-workers N  Replicas a write is pushed to at once (coordinator)
+        --version-directory  Answer version lookups from committed writes (coordinator)
+        --lease-timeout S Seconds a job may hold its file before it is reclaimed (coordinator)
+        --coalesce-writes Propagate bursts of queued writes to a file once (coordinator)
+        --quorum-policy P How quorum members are picked: random, p2c, least-outstanding,
+                          latency-weighted (coordinator)
+        --class-weights W Fair queuing weights, e.g. interactive=4,bulk=1,background=0.5 (coordinator)
+        --reserved-threads N  Server threads client operations and job admission leave free
+                              for completion and transfer calls
+        --pool-size N     Open connections kept per peer, 0 opens one per call
+        --pool-idle S     Seconds a pooled connection may sit idle before it is closed
+        --chunk-size B    Bytes fetched per request_data call
+        --adaptive-chunks Grow the chunk size while throughput keeps improving
+        --chunk-cap B     Largest chunk an adaptive transfer may use
+        --transfer MODE   chunked (request_data calls), stream (the source pushes the file)
+                          or sendfile (raw side channel fed by os.sendfile)
+        --stream-window N Frames a streaming source may send before waiting for this node
+        --fetch-window N  request_data calls a chunked copy keeps outstanding
+        --fetch-connections C  Connections a pipelined copy spreads its window over
+        --max-sources N   Replicas holding the newest version a read's copy pulls from at once
+        --file-cache N    Files kept memory mapped for request_data, 0 opens the file on every call
+        --delta-sync      Update an older local copy by fetching only the blocks that changed
+        --compress CODEC  Codecs (zlib, lzma) chunked copies ask their source for, in order of preference
+        --compress-level N  Compression level the source is asked to use (0-9)
 """
 
 #  ██████╗ ██████╗ ███╗   ██╗███████╗██╗ ██████╗ 
@@ -27,17 +53,27 @@ Usage:
 #  ╚═════╝ ╚═════╝ ╚═╝  ╚═══╝╚═╝     ╚═╝ ╚═════╝                          
 
 # Imports
-import sys, glob, queue, os, random, shutil, threading, argparse, time
+import sys, glob, os, random, shutil, socket, threading, argparse, time, itertools, hashlib, bisect, contextlib, zlib, mmap
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 # Thrift setup 
 sys.path.append('gen-py')
 sys.path.insert(0, glob.glob('../thrift/thrift-0.19.0/lib/py/build/lib*')[0])
 
 from PA3 import replicaServer
-from PA3.ttypes import FileInfo, ContactInfo, Request, Response, CompleteInfo
+from PA3.ttypes import FileInfo, ContactInfo, Request, Response, CompleteInfo, Completion, BulkTicket, BlockSignature, DeltaOp, Delta, CompressedChunk
+from thrift.Thrift import TApplicationException
 from thrift.transport import TSocket, TTransport
 from thrift.protocol import TBinaryProtocol
 from thrift.server import TServer
+from connection_pool import ConnectionPool, POOL_SIZE, IDLE_TIMEOUT
+
+# lzma is optional in some Python builds, without it only zlib is offered
+try:
+    import lzma
+except ImportError:
+    lzma = None
 
 # Debug printing
 DEBUG = 0
@@ -45,8 +81,572 @@ def dprint(msg: str):
     if DEBUG:
         print(msg, flush=True)
 
+# Deadlines are Unix times, 0/None means the caller will wait forever
+def deadline_passed(deadline):
+    return bool(deadline) and time.time() > deadline
+
+def deadline_unreachable(deadline, start, done, total):
+    """True once the rate of a transfer so far says the rest won't arrive before its deadline"""
+    return bool(deadline and done) and start + (time.time() - start) * total / done > deadline
+
 # Constants
-MAX_CHUNK = 2048
+CHUNK_SIZE = 64 * 1024 # Default bytes per request_data call
+CHUNK_CAP = 8 * 1024 * 1024 # Largest chunk an adaptive transfer grows to or a server hands out at once
+CHUNK_GAIN = 1.1 # Adaptive transfers keep doubling while each step is at least this much faster
+TRANSFER_MODES = ("chunked", "stream", "sendfile") # How copy_file pulls a file, see --transfer
+STREAM_WINDOW = 8 # Default stream frames a source may send before waiting for the copier to catch up
+FETCH_WINDOW = 1 # Default request_data calls a chunked copy keeps outstanding, 1 waits for each reply
+FETCH_WORKERS = 8 # Threads driving the extra connections of pipelined copies
+MAX_SOURCES = 4 # Default holders of the newest version a read's copy pulls from at once
+FILE_CACHE_SIZE = 64 # Default files kept memory mapped for request_data, 0 opens the file on every call
+BULK_TOKEN_TTL = 30.0 # Seconds a bulk transfer token stays valid if the copier never connects
+BULK_TIMEOUT = 10.0 # Seconds either end of the side channel waits on a stalled peer before giving up
+DELTA_BLOCK = 4096 # Block size of delta sync signatures
+DELTA_MAX_LITERAL = 0.5 # Fraction of a file a delta may send as new bytes before a full copy is cheaper
+DELTA_INLINE = 1024 * 1024 # New bytes a delta carries in its reply, the rest is fetched with request_data
+DELTA_SCAN = 16 # Blocks past each match searched byte by byte before the search skips whole blocks
+DELTA_SWEEP = 64 # Whole block skips between byte by byte sweeps of one block, which catch content at any shift
+DELTA_MIN_SIZE = 16 * DELTA_BLOCK # Local copies smaller than this are replaced whole, a delta wouldn't save a round trip
+DELTA_PROBES = 64 # Aligned blocks checked before a full delta scan, a file sharing none of them is sent whole
+ADLER_MOD = 65521 # Modulus of adler32, the rolling weak hash of delta sync
+COMPRESS_LEVEL = 1 # Default level compressed transfers ask for, the fastest setting of both codecs
+COMPRESS_SAMPLES = 8 # Slices of a file compressed to decide whether compressing it pays off
+COMPRESS_SAMPLE = 4096 # Bytes per sample slice
+COMPRESS_MAX_RATIO = 0.9 # Files whose samples don't shrink below this fraction are sent raw
+WRITER_BYPASS_LIMIT = 16 # Max readers admitted past a waiting writer before it gets its turn
+POLL_WORKERS = 16 # Threads the coordinator uses to query quorum members in parallel
+PUSH_WORKERS = 8 # Default number of quorum members a write is pushed to at once
+SERVER_THREADS = 16 # Thrift worker threads per node
+RESERVED_THREADS = 4 # Default threads job admission may never occupy, kept free for finish_* calls
+RETRY_AFTER_MIN = 0.05 # Bounds on the back-off an overloaded coordinator asks for, in seconds
+RETRY_AFTER_MAX = 2.0
+ADMISSION_RETRIES = 6 # Times a replica retries an overloaded coordinator before failing the operation
+OVERLOADED = 64 # TApplicationException type a replica answers with when it has no thread to spare
+DEADLINE_EXCEEDED = 65 # TApplicationException type of operations dropped because their deadline passed
+LEASE_EXPIRED = 66 # TApplicationException type of a write the coordinator fenced off, it was never committed
+LEASE_TIMEOUT = 30.0 # Default seconds a granted job may hold its file before the coordinator reclaims it
+LATENCY_ALPHA = 0.2 # Weight of the newest sample in each replica's moving latency estimate
+CLASS_WEIGHTS = {"interactive": 4.0, "bulk": 1.0, "background": 0.5} # Default fair queuing share of each scheduling class
+DEFAULT_CLASS = {"read": "interactive", "write": "bulk"} # Class of jobs that don't name one
+RING_VNODES = 64 # Points each coordinator places on the hash ring, evens out partition sizes
+
+# Coordinator partitioning
+class CoordinatorRing():
+    """Consistent hash ring assigning every filename to exactly one coordinator
+
+    Hashes are md5 based so every node computes the same ring from compute_nodes.txt.
+    """
+
+    def __init__(self, coordinators, vnodes=RING_VNODES):
+        self.coordinators = coordinators
+        points = sorted((self.hash(f"{c.ip}:{c.port}#{i}"), n) for n, c in enumerate(coordinators) for i in range(vnodes))
+        self.keys = [key for key, _ in points]
+        self.owners = [n for _, n in points]
+
+    @staticmethod
+    def hash(text):
+        return int.from_bytes(hashlib.md5(text.encode()).digest()[:8], "big")
+
+    def index(self, filename):
+        """Position of the owning coordinator in self.coordinators"""
+        slot = bisect.bisect(self.keys, self.hash(filename)) % len(self.keys)
+        return self.owners[slot]
+
+    def owner(self, filename):
+        return self.coordinators[self.index(filename)]
+
+# Transfer chunk sizing
+class ChunkSizer():
+    """Chunk size for one transfer, optionally growing with measured throughput
+
+    Adaptive transfers double the chunk while a doubling raises throughput by CHUNK_GAIN,
+    then settle on the best size seen. The cap bounds the memory a single chunk takes.
+    """
+
+    def __init__(self, size, adaptive=False, cap=CHUNK_CAP):
+        self.size = min(size, cap)
+        self.adaptive = adaptive
+        self.cap = cap
+        self.best = (0.0, self.size) # (bytes per second, chunk size)
+
+    def observe(self, nbytes, elapsed):
+        if not self.adaptive or elapsed <= 0:
+            return
+        rate = nbytes / elapsed
+        if rate >= self.best[0] * CHUNK_GAIN and self.size < self.cap:
+            self.best = (rate, self.size)
+            self.size = min(self.size * 2, self.cap)
+        else:
+            # No worthwhile gain, fall back to the best size and stop probing
+            self.best = max(self.best, (rate, self.size))
+            self.size = self.best[1]
+            self.adaptive = False
+
+# Receiving end of a streamed transfer
+class StreamSink():
+    """File and running checksum a stream's frames are written into, frames of one stream arrive in order"""
+
+    def __init__(self, fout):
+        self.fout = fout
+        self.crc = 0
+        self.received = 0
+
+    def write(self, data):
+        self.fout.write(data)
+        self.crc = zlib.crc32(data, self.crc)
+        self.received += len(data)
+
+# Served file cache
+class MappedFile():
+    """Read-only memory map of one stored file, shared by every request_data call on it"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as fp:
+            self.size = os.fstat(fp.fileno()).st_size
+            self.map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None # empty files can't be mapped
+        self.users = 0
+        self.retired = False
+        self.ratio = None # Sampled compression ratio, the file never changes under a map
+
+    def read(self, offset, size):
+        return self.map[offset:offset + size] if self.map else b""
+
+    def contents(self):
+        return self.map or b""
+
+    def close(self):
+        if self.map:
+            self.map.close()
+
+class PlainFile():
+    """Stored file read with plain reads, what a FileCache that keeps nothing mapped hands out"""
+
+    def __init__(self, path):
+        self.fp = open(path, 'rb')
+        self.size = os.fstat(self.fp.fileno()).st_size
+        self.ratio = None
+
+    def read(self, offset, size):
+        return os.pread(self.fp.fileno(), max(0, min(size, self.size - offset)), offset)
+
+    def contents(self):
+        return self.read(0, self.size)
+
+    def close(self):
+        self.fp.close()
+
+class FileCache():
+    """Bounded LRU of MappedFiles, keyed by path
+
+    Files are replaced with os.replace, so a stale map still reads the old version intact, the
+    callers invalidate a path whenever they replace it. Maps dropped while in use are closed by
+    their last user.
+    """
+
+    def __init__(self, capacity=FILE_CACHE_SIZE):
+        self.capacity = capacity
+        self.entries = OrderedDict() # path -> MappedFile, least recently used first
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @contextlib.contextmanager
+    def open(self, path):
+        """Yields the MappedFile for path, mapping it first if it isn't cached
+
+        With a capacity of 0 nothing is mapped, the file is opened and read for this call only.
+        """
+        if self.capacity <= 0:
+            plain = PlainFile(path)
+            try:
+                yield plain
+            finally:
+                plain.close()
+            return
+        retired = []
+        with self._lock:
+            entry = self.entries.get(path)
+            if entry is not None:
+                self.entries.move_to_end(path)
+                self.stats["hits"] += 1
+            else:
+                # Mapped under the lock so an invalidate can't slip in between the open and the insert
+                entry = MappedFile(path)
+                self.stats["misses"] += 1
+                self.entries[path] = entry
+                while len(self.entries) > self.capacity:
+                    _, old = self.entries.popitem(last=False)
+                    old.retired = True
+                    self.stats["evictions"] += 1
+                    retired.append(old)
+            entry.users += 1
+            retired = [old for old in retired if not old.users]
+        for old in retired:
+            old.close()
+        try:
+            yield entry
+        finally:
+            with self._lock:
+                entry.users -= 1
+                done = entry.retired and not entry.users
+            if done:
+                entry.close()
+
+    def invalidate(self, path):
+        """Drops path's map, called after the file is replaced"""
+        with self._lock:
+            entry = self.entries.pop(path, None)
+            if entry is None:
+                return
+            entry.retired = True
+            self.stats["invalidations"] += 1
+            done = not entry.users
+        if done:
+            entry.close()
+
+# Delta sync, rsync style: adler32 is the weak hash that rolls one byte at a time, md5 the strong one
+def block_signatures(fp, block_size):
+    """Weak and strong hash of every full block of an open file"""
+    signatures = []
+    while True:
+        block = fp.read(block_size)
+        if len(block) < block_size:
+            return signatures
+        signatures.append(BlockSignature(zlib.adler32(block), hashlib.md5(block).digest()))
+
+def probe_blocks(data, block_size, table):
+    """Cheap check whether data shares anything with the copy table was built from, ahead of the full scan
+
+    Up to DELTA_PROBES aligned blocks spread over data catch content an edit left in place, then one
+    block's worth of offsets at the start and in the middle are rolled through to catch content an
+    insert or delete shifted. A rewritten file fails both in milliseconds. Only weak hashes are
+    compared, a rare false hit just means the full scan runs.
+    """
+    blocks = len(data) // block_size
+    for block in range(0, blocks, max(1, blocks // DELTA_PROBES)):
+        if zlib.adler32(data[block * block_size:(block + 1) * block_size]) in table:
+            return True
+    for start in {0, blocks // 2 * block_size}:
+        end = min(start + block_size, len(data) - block_size) # last window start rolled to
+        if end < start:
+            continue
+        weak = zlib.adler32(data[start:start + block_size])
+        a, b = weak & 0xffff, weak >> 16
+        for pos in range(start, end):
+            if (b << 16) | a in table:
+                return True
+            out, new = data[pos], data[pos + block_size]
+            a = (a - out + new) % ADLER_MOD
+            b = (b - block_size * out + a - 1) % ADLER_MOD
+        if (b << 16) | a in table:
+            return True
+    return False
+
+def diff_blocks(data, block_size, signatures, max_literal):
+    """Matches data against the block signatures of another copy
+
+    Returns (block, offset, length) runs covering data, block -1 for bytes the other copy lacks
+    and otherwise the first of length // block_size consecutive blocks it can reuse. Returns None
+    as soon as more than max_literal bytes would have to be sent.
+
+    Rolling byte by byte is slow in Python, so far from the last match the search skips a block
+    at a time and only sweeps one block's worth of offsets every DELTA_SWEEP blocks. Moved content
+    is still found, up to DELTA_SWEEP blocks late. Data that fails probe_blocks isn't scanned at all.
+    """
+    table = {} # weak hash -> [(strong hash, block)]
+    for block, signature in enumerate(signatures):
+        table.setdefault(signature.weak, []).append((signature.strong, block))
+    if not probe_blocks(data, block_size, table):
+        return None
+
+    runs = []
+    size = len(data)
+    literal = 0 # bytes of closed literal runs
+    start = pos = 0 # start of the open literal run, start of the window
+    fine = DELTA_SCAN * block_size # roll byte by byte until here
+    skips = 0
+    weak = None
+    while pos + block_size <= size:
+        if weak is None:
+            weak = zlib.adler32(data[pos:pos + block_size])
+            a, b = weak & 0xffff, weak >> 16
+        if weak in table:
+            strong = hashlib.md5(data[pos:pos + block_size]).digest()
+            match = next((block for other, block in table[weak] if other == strong), None)
+            if match is not None:
+                if start < pos:
+                    runs.append((-1, start, pos - start))
+                    literal += pos - start
+                last = runs[-1] if runs else None
+                if last and last[0] >= 0 and last[0] + last[2] // block_size == match:
+                    runs[-1] = (last[0], last[1], last[2] + block_size)
+                else:
+                    runs.append((match, pos, block_size))
+                pos = start = pos + block_size
+                fine = pos + DELTA_SCAN * block_size
+                weak = None
+                continue
+        if pos >= fine:
+            # Skip the whole block, every so often sweep the next one byte by byte
+            pos += block_size
+            weak = None
+            skips += 1
+            if skips % DELTA_SWEEP == 0:
+                fine = pos + block_size
+        elif pos + block_size == size:
+            break
+        else:
+            # Roll the window one byte forward
+            out, new = data[pos], data[pos + block_size]
+            a = (a - out + new) % ADLER_MOD
+            b = (b - block_size * out + a - 1) % ADLER_MOD
+            weak = (b << 16) | a
+            pos += 1
+        if literal + pos - start > max_literal:
+            return None
+    if start < size:
+        runs.append((-1, start, size - start))
+        literal += size - start
+    return runs if literal <= max_literal else None
+
+# Compressed transfers: codec name -> (compress(data, level), decompress(data))
+COMPRESSORS = {"zlib": (lambda data, level: zlib.compress(data, level), zlib.decompress)}
+if lzma:
+    COMPRESSORS["lzma"] = (lambda data, level: lzma.compress(data, preset=level), lzma.decompress)
+
+def sample_ratio(size, read):
+    """Compressed size over raw size of COMPRESS_SAMPLES slices spread over size bytes, read(offset, size) returns one
+
+    The probe is always zlib at level 1, whatever codec the transfer uses: it only has to tell
+    text from already compressed content (JPEGs, archives come out at about 1.0) and lzma would
+    cost more than the transfer of a small file.
+    """
+    if not size:
+        return 1.0
+    step = max(COMPRESS_SAMPLE, size // COMPRESS_SAMPLES)
+    raw = packed = 0
+    for offset in range(0, size, step):
+        piece = read(offset, COMPRESS_SAMPLE)
+        raw += len(piece)
+        packed += len(zlib.compress(piece, 1))
+    return packed / raw
+
+# Replica load tracking
+class ReplicaLoad():
+    """Moving latency estimate and in-flight RPC count for one replica, as seen by the coordinator"""
+
+    def __init__(self):
+        self.latency = None
+        self.inflight = 0
+
+    def observe(self, elapsed):
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency += LATENCY_ALPHA * (elapsed - self.latency)
+
+    def expected(self):
+        """Rough wait for a new request: queued requests plus ours at the current latency"""
+        return (self.latency or 0.0) * (self.inflight + 1)
+
+# Quorum selection policies: pick k of servers, most preferred first, given each one's ReplicaLoad
+def pick_random(servers, loads, k):
+    return random.sample(servers, k)
+
+def pick_two_choices(servers, loads, k):
+    """Power of two choices: for every slot, sample two candidates and keep the less loaded one"""
+    candidates = list(range(len(servers)))
+    chosen = []
+    for _ in range(k):
+        pair = random.sample(candidates, min(2, len(candidates)))
+        best = min(pair, key=lambda i: loads[i].expected())
+        candidates.remove(best)
+        chosen.append(servers[best])
+    return chosen
+
+def pick_least_outstanding(servers, loads, k):
+    order = sorted(range(len(servers)), key=lambda i: (loads[i].inflight, random.random()))
+    return [servers[i] for i in order[:k]]
+
+def pick_latency_weighted(servers, loads, k):
+    """Sample without replacement, weighting each replica by the inverse of its latency estimate"""
+    known = [load.latency for load in loads if load.latency]
+    default = sum(known) / len(known) if known else 1.0 # unmeasured replicas look average
+    candidates = list(range(len(servers)))
+    chosen = []
+    for _ in range(k):
+        weights = [1 / (loads[i].latency or default) for i in candidates]
+        pick = random.choices(candidates, weights)[0]
+        candidates.remove(pick)
+        chosen.append(servers[pick])
+    return chosen
+
+QUORUM_POLICIES = {
+    "random": pick_random,
+    "p2c": pick_two_choices,
+    "least-outstanding": pick_least_outstanding,
+    "latency-weighted": pick_latency_weighted,
+}
+
+# Per-file job queue
+class FileJobQueue():
+    """Reader/writer queue for a single file, keeps operations on that file sequentially consistent
+
+    Reads share the file with each other, writes get it to themselves. All methods
+    must be called while holding the coordinator's queue lock.
+    """
+
+    def __init__(self):
+        self.waiting = deque() # FIFO of (type, event) waiting for their turn
+        self.chosenServers = None
+        self.activeReaders = 0
+        self.writerActive = False
+        self.writerBypassed = 0 # readers that jumped the writer at the head of waiting
+
+        # Version poll shared by every reader in the current batch
+        self.pollLock = threading.Lock()
+        self.readResult = None
+
+        # Write coalescing: the burst of writes waiting on one propagation round, and
+        # the uncommitted version the next queued writer should build on
+        self.writeGroup = None
+        self.nextWrite = None
+
+    def peek(self):
+        """Entry of the job at the front of the queue, or None"""
+        return self.waiting[0] if self.waiting else None
+
+    def admit(self, type, turn):
+        """Let a new job in right away if it doesn't conflict, otherwise queue it"""
+        if type == "read" and not self.writerActive:
+            if not self.waiting:
+                self.activeReaders += 1
+                turn.set()
+                return
+            if self.waiting[0][0] == "write" and self.activeReaders and self.writerBypassed < WRITER_BYPASS_LIMIT:
+                # Join the running read batch, the writer waits on it anyway
+                self.writerBypassed += 1
+                self.activeReaders += 1
+                turn.set()
+                return
+        elif type == "write" and not self.writerActive and not self.activeReaders and not self.waiting:
+            self.writerActive = True
+            turn.set()
+            return
+        self.waiting.append((type, turn))
+
+    def release(self, type):
+        """Finish a job, then admit the next write or run of reads from the front of the queue"""
+        if type == "read":
+            self.activeReaders -= 1
+        else:
+            self.writerActive = False
+            self.chosenServers = None
+        if not self.activeReaders:
+            self.readResult = None
+
+        while self.waiting and not self.writerActive:
+            type, turn = self.waiting[0]
+            if type == "write":
+                if not self.activeReaders:
+                    self.waiting.popleft()
+                    self.writerActive = True
+                    self.writerBypassed = 0
+                    turn.set()
+                break
+            self.waiting.popleft()
+            self.activeReaders += 1
+            turn.set()
+
+    def idle(self):
+        return not (self.waiting or self.activeReaders or self.writerActive)
+
+# Shared coordinator capacity
+class FairGate():
+    """Slots of one resource the coordinator shares across files, handed out by weighted fair queuing
+
+    Jobs waiting for a slot are kept FIFO per scheduling class. Each is tagged with a virtual
+    finish time of 1/weight past its class's previous job, and the smallest tag gets the next
+    free slot, so a backlog of bulk jobs on other files cannot starve interactive ones.
+    """
+
+    def __init__(self, slots, weights):
+        self.slots = slots
+        self.weights = weights
+        self.busy = 0
+        self.waiting = {} # class -> FIFO of (event, tag) waiting for a slot
+        self.virtualTime = 0.0 # tag of the job served last
+        self.lastTag = {} # class -> tag of its newest job
+        self._lock = threading.Lock()
+
+    def tag(self, cls):
+        tag = max(self.virtualTime, self.lastTag.get(cls, 0.0)) + 1 / self.weights[cls]
+        self.lastTag[cls] = tag
+        return tag
+
+    @contextlib.contextmanager
+    def slot(self, cls):
+        """Holds a slot for a job of class cls, waiting for its turn while all of them are taken"""
+        turn = threading.Event()
+        with self._lock:
+            tag = self.tag(cls)
+            if self.busy < self.slots and not self.waiting:
+                self.busy += 1
+                self.virtualTime = tag
+                turn.set()
+            else:
+                self.waiting.setdefault(cls, deque()).append((turn, tag))
+        turn.wait()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def release(self):
+        with self._lock:
+            if not self.waiting:
+                self.busy -= 1
+                return
+            # Hand the slot straight to the smallest tag
+            cls = min(self.waiting, key=lambda c: self.waiting[c][0][1])
+            turn, tag = self.waiting[cls].popleft()
+            if not self.waiting[cls]:
+                del self.waiting[cls]
+            self.virtualTime = tag
+            turn.set()
+
+# Coalesced writes
+class WriteGroup():
+    """Consecutive writes to one file that are acknowledged by a single propagation round"""
+
+    def __init__(self, quorum):
+        self.quorum = quorum
+        self.done = threading.Event()
+        self.error = None
+        self.carrier = None # jobId of the write that will propagate the group, None until one is granted
+
+    def finish(self, error=None):
+        if not self.done.is_set():
+            self.error = error
+            self.done.set()
+
+# Granted job
+class JobLease():
+    """A job holding its file, reclaimed by the coordinator if it isn't finished before it expires"""
+
+    def __init__(self, jobId, filename, type, cls, timeout):
+        self.jobId = jobId
+        self.filename = filename
+        self.type = type
+        self.cls = cls # scheduling class, the write's propagation queues for pushGate under it
+        self.timeout = timeout
+        self.committing = False # finish_write is pushing the new version, however long that takes
+        self.renew()
+
+    def renew(self):
+        self.expires = time.time() + self.timeout
+
+    def expired(self, now):
+        return not self.committing and now >= self.expires
 
 # Replica Server Class
 class ReplicaServerHandler():
@@ -58,10 +658,82 @@ class ReplicaServerHandler():
     # ██║██║ ╚████║██║   ██║   
     # ╚═╝╚═╝  ╚═══╝╚═╝   ╚═╝   
 
-    def __init__(self, node_ip, node_port, storage_path):
+    def __init__(self, node_ip, node_port, storage_path, hedge_extra=0, hedge_delay=0.0, push_workers=PUSH_WORKERS,
+                 version_directory=False, lease_timeout=LEASE_TIMEOUT, coalesce_writes=False, quorum_policy="random",
+                 class_weights=CLASS_WEIGHTS, reserved_threads=RESERVED_THREADS, pool_size=POOL_SIZE,
+                 pool_idle=IDLE_TIMEOUT, chunk_size=CHUNK_SIZE, adaptive_chunks=False, chunk_cap=CHUNK_CAP,
+                 transfer="chunked", stream_window=STREAM_WINDOW, fetch_window=FETCH_WINDOW, fetch_connections=1,
+                 max_sources=MAX_SOURCES, file_cache=FILE_CACHE_SIZE, delta_sync=False, compress=(),
+                 compress_level=COMPRESS_LEVEL):
         self.info = ContactInfo(node_ip, node_port)
         self.storage_path = storage_path
 
+        # Hedged quorum polling: query hedge_extra spare replicas, hedge_delay seconds after the quorum
+        self.hedgeExtra = hedge_extra
+        self.hedgeDelay = hedge_delay
+
+        # Number of write quorum members a finished write is copied to at once
+        self.pushWorkers = push_workers
+
+        # Answer version lookups from the coordinator's own record of committed writes
+        self.useDirectory = version_directory
+
+        # Seconds a granted job may go without finishing before its file is taken back
+        self.leaseTimeout = lease_timeout
+
+        # Fold bursts of queued writes to the same file into one propagation round
+        self.coalesceWrites = coalesce_writes
+
+        # How quorum members are picked, see QUORUM_POLICIES
+        self.pickServers = QUORUM_POLICIES[quorum_policy]
+
+        # Fair queuing weight of each scheduling class a job may ask for
+        self.classWeights = class_weights
+
+        # Calls that may block a server thread on a queued job (client operations and insert_job(s)
+        # from other replicas) allowed at once, the rest are turned away
+        self.admissionLimit = max(1, SERVER_THREADS - reserved_threads)
+        self.admitting = 0
+
+        # Open connections to other nodes, reused across calls
+        self.pool = ConnectionPool(pool_size, pool_idle)
+
+        # request_data chunking for copies this node makes
+        self.chunkSize = chunk_size
+        self.adaptiveChunks = adaptive_chunks
+        self.chunkCap = chunk_cap
+
+        # Pull files chunk by chunk or have the source stream them, and the stream's flow control window
+        self.transfer = transfer
+        self.streamWindow = stream_window
+        self.streamIds = itertools.count(1)
+        self.streams = {} # streamId -> StreamSink for copies this node is receiving
+        self._stream_lock = threading.Lock()
+
+        # Pipelined chunked copies: request_data calls kept outstanding, spread over this many connections
+        self.fetchWindow = fetch_window
+        self.fetchConnections = fetch_connections
+        self.fetchPool = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="fetch")
+
+        # Replicas holding the version being read that one copy may pull from at once
+        self.maxSources = max_sources
+
+        # Memory maps of the files request_data serves chunks from
+        self.fileCache = FileCache(file_cache)
+
+        # Update an older local copy by fetching only the blocks that changed
+        self.deltaSync = delta_sync
+
+        # Codecs chunked copies ask their sources for, most preferred first (none = raw transfers), and their level
+        self.compress = list(compress)
+        self.compressLevel = compress_level
+
+        # Side channel for sendfile transfers, open_bulk hands out single use tokens for it
+        self.bulkTickets = {} # token -> (path, offset, size, expiry)
+        self._bulk_lock = threading.Lock()
+        self.bulkListener = socket.create_server(("", 0))
+        threading.Thread(target=self.accept_bulk, daemon=True).start()
+
         # Ensure storage_path exists
         os.makedirs(self.storage_path, exist_ok=True)
 
@@ -69,13 +741,17 @@ class ReplicaServerHandler():
         self.server_list = []
         self.NR = 0
         self.NW = 0
-        self.coordinatorContact = None 
+        self.coordinators = []
+        self.coordinatorRing = None
         self.role = None
 
-        # Setup lock for coordinator to ensure sequential consistency
-        self._coord_lock = threading.Lock()
+        # Setup lock for coordinator to guard the per-file job queues
         self._queue_lock = threading.Lock()
 
+        # Counters exported through get_stats
+        self.stats = {}
+        self._stats_lock = threading.Lock()
+
         # Import compute nodes from compute_nodes.txt
         self.import_compute_nodes()
 
@@ -93,10 +769,13 @@ class ReplicaServerHandler():
                 info = ContactInfo(ip, int(port))
                 self.server_list.append(info)
                 if role == '1':
-                    self.coordinatorContact = info
+                    self.coordinators.append(info)
 
-        # This is the coordinator
-        if self.info == self.coordinatorContact:
+        # Every node flagged 1 coordinates its own partition of the filename space
+        if not self.coordinators:
+            raise ValueError("compute_nodes.txt does not name a coordinator")
+        self.coordinatorRing = CoordinatorRing(self.coordinators)
+        if self.info in self.coordinators:
             self.role = 1
 
         # quorum validation --> Raise exception if invalid
@@ -106,11 +785,26 @@ class ReplicaServerHandler():
 
     def setup_coordinator(self):
         dprint(f"Initializing Server as Coordinator")
-        self.jobQueue = queue.Queue()
-        self.chosenServers = None
-        self.currentTask = None
-        self.taskNumberAssigned = 0
-        self.taskNumberProcessing = 0
+        self.jobQueues = {} # filename -> FileJobQueue, operations on different files run concurrently
+        self.pollPool = ThreadPoolExecutor(max_workers=POLL_WORKERS, thread_name_prefix="poll")
+        self.replicaLoads = [ReplicaLoad() for _ in self.server_list] # lines up with server_list
+        self._load_lock = threading.Lock()
+        self.pushPool = ThreadPoolExecutor(max_workers=self.pushWorkers, thread_name_prefix="push")
+
+        # Grants (quorum polls) and propagations running at once, taken in fair queuing order by class
+        pollSize = min(len(self.server_list), max(self.NR, self.NW) + self.hedgeExtra)
+        self.pollGate = FairGate(max(1, POLL_WORKERS // pollSize), self.classWeights)
+        self.pushGate = FairGate(max(1, self.pushWorkers // max(1, self.NW - 1)), self.classWeights)
+        self.batchPool = ThreadPoolExecutor(max_workers=POLL_WORKERS, thread_name_prefix="batch")
+
+        # filename -> (latest committed version, servers holding it), empty after a restart
+        self.versionDirectory = {}
+        self._directory_lock = threading.Lock()
+
+        # jobId -> JobLease for every job currently holding its file
+        self.jobIds = itertools.count(1)
+        self.leases = {}
+        threading.Thread(target=self.reap_leases, daemon=True).start()
 
     # ██╗  ██╗███████╗██╗     ██████╗ ███████╗██████╗ 
     # ██║  ██║██╔════╝██║     ██╔══██╗██╔════╝██╔══██╗
@@ -126,17 +820,10 @@ class ReplicaServerHandler():
     # ██║     ╚██████╔╝██║ ╚████║╚██████╗   ██║   ██║╚██████╔╝██║ ╚████║███████║
     # ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝   ╚═╝   ╚═╝ ╚═════╝ ╚═╝  ╚═══╝╚══════╝
 
-    def open_client(self, ip, port):
-        """ Create thrift client by calling self.open_client to simplify thrift interaction """
-        dprint(f"Opening connection to {ip}:{port}")
-        sock = TSocket.TSocket(ip, port)
-        # sock.setTimeout(2000) # 2s timeout
-        transport = TTransport.TBufferedTransport(sock)
-        protocol = TBinaryProtocol.TBinaryProtocol(transport)
-        client = replicaServer.Client(protocol)
-        transport.open()
-        return client, transport
-    
+    def coordinator_for(self, filename):
+        """Coordinator owning filename's partition"""
+        return self.coordinatorRing.owner(filename)
+
     def update_file_metadata(self, name, version):
         """ Update version number of a file """
         dprint(f"Updating file {name} to version {version}")
@@ -149,6 +836,26 @@ class ReplicaServerHandler():
         dprint(f"File {name} not currently in files")
         self.contained_files.append(FileInfo(name, version))
 
+    def bump_stat(self, name, amount=1):
+        """ Add amount to a counter exported through get_stats """
+        with self._stats_lock:
+            self.stats[name] = self.stats.get(name, 0) + amount
+
+    def max_stat(self, name, value):
+        """ Keep the largest value seen for a stat exported through get_stats """
+        with self._stats_lock:
+            self.stats[name] = max(self.stats.get(name, 0), value)
+
+    def get_stats(self):
+        """Externally Called From Client, returns this node's counters"""
+        with self._stats_lock:
+            stats = {name: float(value) for name, value in self.stats.items()}
+        with self.pool._lock:
+            stats.update((f"pool_{name}", float(value)) for name, value in self.pool.stats.items())
+        with self.fileCache._lock:
+            stats.update((f"file_cache_{name}", float(value)) for name, value in self.fileCache.stats.items())
+        return stats
+
     def get_all_files(self):
         """Called by coordinator onto node to get all files"""
         return self.contained_files
@@ -162,27 +869,481 @@ class ReplicaServerHandler():
     
     def get_file_size(self, filename):
         """Externally Called From Another Server (not nessecarily coordinator)"""
-        return os.path.getsize(f'{self.storage_path}/{filename}')
+        with self.fileCache.open(f'{self.storage_path}/{filename}') as cached:
+            return cached.size
     
     def request_data(self, filename, offset, size):
         """Externally Called from Another Server (not nessecarily coordinator)"""
-        with open(f'{self.storage_path}/{filename}', 'rb') as fp:
-            fp.seek(offset)
-            return fp.read(size)
+        self.bump_stat("chunks_served")
+        with self.fileCache.open(f'{self.storage_path}/{filename}') as cached:
+            return cached.read(offset, min(size, CHUNK_CAP))
+
+    def negotiate_compression(self, filename, codecs):
+        """Externally Called from Another Server, picks the first of codecs this node supports for a transfer of
+        filename, or none ("") when no codec is shared or a sample of the file barely shrinks"""
+        codec = next((codec for codec in codecs if codec in COMPRESSORS), "")
+        if not codec:
+            return ""
+        with self.fileCache.open(f'{self.storage_path}/{filename}') as cached:
+            ratio = cached.ratio
+            if ratio is None:
+                start = time.thread_time()
+                ratio = cached.ratio = sample_ratio(cached.size, cached.read)
+                self.bump_stat("compress_seconds", time.thread_time() - start)
+        if ratio > COMPRESS_MAX_RATIO:
+            dprint(f"Sending {filename} raw, a sample only compresses to {ratio:.2f} with {codec}")
+            self.bump_stat("compress_bypasses")
+            return ""
+        self.bump_stat("compress_negotiations")
+        return codec
+
+    def request_compressed(self, filename, offset, size, codec, level):
+        """Externally Called from Another Server, request_data compressed with codec, raw if it doesn't shrink"""
+        self.bump_stat("chunks_served")
+        with self.fileCache.open(f'{self.storage_path}/{filename}') as cached:
+            data = cached.read(offset, min(size, CHUNK_CAP))
+        if codec not in COMPRESSORS:
+            return CompressedChunk("", data)
+        start = time.thread_time() # CPU time of this thread, other transfers don't count
+        packed = COMPRESSORS[codec][0](data, min(max(level, 0), 9))
+        self.bump_stat("compress_seconds", time.thread_time() - start)
+        if len(packed) >= len(data):
+            self.bump_stat("chunks_sent_raw")
+            return CompressedChunk("", data)
+        self.bump_stat("chunks_compressed")
+        return CompressedChunk(codec, packed)
+
+    def negotiate_codec(self, client, filename):
+        """Internal Function, agrees on a codec for one transfer with the source behind client, "" for raw chunks"""
+        if not self.compress:
+            return ""
+        try:
+            return client.negotiate_compression(filename, self.compress)
+        except TApplicationException as e:
+            if e.type != TApplicationException.UNKNOWN_METHOD: # a source that predates compression
+                raise
+            self.bump_stat("compression_fallbacks")
+            return ""
+
+    def send_chunk_request(self, client, filename, offset, size, codec):
+        """Internal Function, asks for one chunk, compressed if a codec was agreed on"""
+        if codec:
+            client.send_request_compressed(filename, offset, size, codec, self.compressLevel)
+        else:
+            client.send_request_data(filename, offset, size)
+
+    def recv_chunk(self, client, codec):
+        """Internal Function, reads the reply to send_chunk_request and returns the raw bytes"""
+        if not codec:
+            return client.recv_request_data()
+        chunk = client.recv_request_compressed()
+        data = chunk.data
+        if chunk.codec:
+            start = time.thread_time()
+            data = COMPRESSORS[chunk.codec][1](chunk.data)
+            self.bump_stat("decompress_seconds", time.thread_time() - start)
+        self.bump_stat("compressed_bytes_wire", len(chunk.data))
+        self.bump_stat("compressed_bytes_raw", len(data))
+        return data
         
-    def copy_file(self, version, filename, ip, port):
-        """Copies a given file from a another given node"""
-        # Note: Used chatgpt to figure out how the thrift binary and binary read/write works (there is no thrift binary documentation)
-        client, trans = self.open_client(ip, port)
+    def copy_file(self, version, filename, ip, port, chunk_size=0, deadline=None, sources=None):
+        """Copies a given file from a another given node
+
+        chunk_size overrides this node's chunk size for this transfer (0 keeps the default).
+        sources lists other nodes holding the same version, a chunked copy pulls from them too.
+        The copy lands in a temporary file first, so one abandoned because it could no longer
+        make its deadline leaves the old version intact.
+        """
+        partial = f'{self.storage_path}/.{filename}.{threading.get_ident()}.part' # readers may copy the same file at once
+        first = ContactInfo(ip, port)
+        sources = [first] + [source for source in sources or [] if source != first and source != self.info]
+        sources = sources[:max(1, self.maxSources)]
+        if len(sources) > 1:
+            self.bump_stat("multi_source_copies")
+        start = time.time()
         try:
-            size = client.get_file_size(filename)
-            with open(f'{self.storage_path}/{filename}', 'wb') as fout:
-                for offset in range(0, size, MAX_CHUNK):
-                    fout.write(client.request_data(filename, offset, MAX_CHUNK))
+            with open(partial, 'w+b') as fout: # readable too, sendfile copies map it
+                if self.deltaSync and self.receive_delta(fout, filename, ip, port, chunk_size, deadline):
+                    pass
+                elif self.transfer == "sendfile" and self.receive_bulk(fout, filename, ip, port, deadline):
+                    pass
+                elif self.transfer == "stream":
+                    self.receive_stream(fout, filename, ip, port, chunk_size, deadline)
+                elif len(sources) > 1 or self.fetchWindow > 1 or self.fetchConnections > 1:
+                    self.fetch_pipelined(fout, filename, sources, chunk_size, deadline)
+                else:
+                    self.fetch_chunks(fout, filename, ip, port, chunk_size, deadline)
+            size = os.path.getsize(partial)
+            os.replace(partial, f'{self.storage_path}/{filename}')
+            self.fileCache.invalidate(f'{self.storage_path}/{filename}')
         finally:
-            trans.close()
+            if os.path.exists(partial):
+                os.remove(partial)
         self.update_file_metadata(filename, version)
+
+        # Throughput of this copy, copy_bytes / copy_seconds gives the average over all of them
+        elapsed = time.time() - start
+        rate = size / elapsed / 1e6 if elapsed > 0 else 0.0
+        dprint(f"Copied {filename} v{version} ({size} bytes) from {ip}:{port} in {elapsed * 1000:.2f}ms, {rate:.1f} MB/s")
+        self.bump_stat("copies")
+        self.bump_stat("copy_bytes", size)
+        self.bump_stat("copy_seconds", elapsed)
+        self.max_stat("copy_peak_MBps", rate)
     
+    def fetch_chunks(self, fout, filename, ip, port, chunk_size, deadline):
+        """Internal Function, pulls filename from ip:port one request_data call at a time"""
+        # Note: Used chatgpt to figure out how the thrift binary and binary read/write works (there is no thrift binary documentation)
+        with self.pool.connection(ip, port) as client:
+            size = client.get_file_size(filename)
+            codec = self.negotiate_codec(client, filename) if size else ""
+            chunks = ChunkSizer(chunk_size or self.chunkSize, self.adaptiveChunks, self.chunkCap)
+            start = time.time()
+            offset = 0
+            while offset < size:
+                if deadline_unreachable(deadline, start, offset, size):
+                    self.bump_stat("copies_aborted")
+                    raise TApplicationException(DEADLINE_EXCEEDED, f"Copy of {filename} cannot finish before its deadline")
+                sent = time.time()
+                self.send_chunk_request(client, filename, offset, chunks.size, codec)
+                data = self.recv_chunk(client, codec)
+                if not data:
+                    raise TApplicationException(TApplicationException.MISSING_RESULT, f"{filename} ended early at {offset} of {size} bytes")
+                chunks.observe(len(data), time.time() - sent)
+                fout.write(data)
+                offset += len(data)
+                self.bump_stat("chunks_fetched")
+
+    def fetch_pipelined(self, fout, filename, sources, chunk_size, deadline):
+        """Internal Function, pulls filename from every source at once keeping fetchWindow request_data calls outstanding
+
+        Each source gets fetchConnections pooled connections and each connection pipelines its share
+        of the window (requests go out back to back, the replies come back in order). Connections
+        take the next chunk from a shared queue, so faster sources serve more of the file, and chunks
+        are written in place as they arrive. A source that fails hands its chunks back to the others.
+        The chunk size stays fixed here.
+        """
+        # Each reply must be a whole chunk, and a server hands out at most CHUNK_CAP at once
+        chunk_size = min(chunk_size or self.chunkSize, self.chunkCap, CHUNK_CAP)
+        with self.pool.connection(sources[0].ip, sources[0].port) as client:
+            size = client.get_file_size(filename)
+        offsets = deque(range(0, size, chunk_size))
+        lanes = [source for source in sources for _ in range(self.fetchConnections)][:max(1, len(offsets))]
+        depth = max(1, -(-self.fetchWindow // len(lanes))) # outstanding calls per connection
+        progress = {"received": 0, "lanes": len(lanes), "failed": False}
+        failedSources = []
+        lock = threading.Lock()
+        start = time.time()
+
+        def lane(source):
+            pending = deque() # offsets requested on this connection, oldest first
+            current = None # offset whose reply is being read
+            try:
+                with self.pool.connection(source.ip, source.port) as client:
+                    codec = self.negotiate_codec(client, filename) # each source may answer differently
+                    try:
+                        while True:
+                            while len(pending) < depth:
+                                with lock:
+                                    if not offsets or progress["failed"]:
+                                        break
+                                    offset = offsets.popleft()
+                                self.send_chunk_request(client, filename, offset, chunk_size, codec)
+                                pending.append(offset)
+                            if not pending:
+                                return
+                            current = pending.popleft()
+                            data = self.recv_chunk(client, codec)
+                            if len(data) != min(chunk_size, size - current):
+                                raise TApplicationException(TApplicationException.MISSING_RESULT, f"{filename} ended early at {current} of {size} bytes")
+                            os.pwrite(fout.fileno(), data, current)
+                            current = None
+                            self.bump_stat("chunks_fetched")
+                            with lock:
+                                progress["received"] += len(data)
+                                received = progress["received"]
+                            if deadline_unreachable(deadline, start, received, size):
+                                raise TApplicationException(DEADLINE_EXCEEDED, f"Copy of {filename} cannot finish before its deadline")
+                    finally:
+                        # Read off the replies still on their way so the connection goes back to the pool clean
+                        for _ in pending:
+                            try:
+                                self.recv_chunk(client, codec)
+                            except TApplicationException:
+                                pass
+            except BaseException as e:
+                expired = isinstance(e, TApplicationException) and e.type == DEADLINE_EXCEEDED
+                with lock:
+                    progress["lanes"] -= 1
+                    failedSources.append(source)
+                    first = not progress["failed"]
+                    if expired or not progress["lanes"]:
+                        progress["failed"] = True
+                    else:
+                        # Someone else fetches what this connection still owed
+                        offsets.extend(pending)
+                        if current is not None:
+                            offsets.append(current)
+                        first = False
+                if first and expired:
+                    self.bump_stat("copies_aborted")
+                if progress["failed"]:
+                    raise
+                dprint(f"Fetching {filename} from {source.ip}:{source.port} failed, other sources take over: {e}")
+                self.bump_stat("source_failures")
+
+        futures = [self.fetchPool.submit(lane, source) for source in lanes[1:]]
+        try:
+            lane(lanes[0])
+        finally:
+            wait(futures)
+        for future in futures:
+            future.result()
+
+        # Chunks a failed source handed back after the other connections had already finished
+        healthy = [source for source in sources if source not in failedSources]
+        if offsets and healthy:
+            progress["lanes"] = 1
+            lane(healthy[0])
+        if progress["received"] < size: # every connection gave up before the file was complete
+            raise TApplicationException(TApplicationException.MISSING_RESULT, f"Fetched {progress['received']} of {size} bytes of {filename}")
+
+    def receive_delta(self, fout, filename, ip, port, chunk_size, deadline):
+        """Internal Function, rebuilds the new version of filename from the local copy and what ip:port says changed
+
+        Returns False, with fout emptied again, when there is no local copy worth building on, the source
+        finds too little in common, or the result fails its checksum, the caller then copies the
+        whole file.
+        """
+        local = f'{self.storage_path}/{filename}'
+        if not os.path.exists(local) or os.path.getsize(local) < DELTA_MIN_SIZE:
+            return False
+        chunk_size = chunk_size or self.chunkSize
+        with open(local, 'rb') as old:
+            signatures = block_signatures(old, DELTA_BLOCK)
+            if not signatures:
+                return False
+            crc = reused = fetched = 0
+            with self.pool.connection(ip, port) as client:
+                delta = client.request_delta(filename, DELTA_BLOCK, signatures)
+                if not delta.ops:
+                    self.bump_stat("delta_fallbacks")
+                    return False
+                for op in delta.ops:
+                    if op.block >= 0:
+                        old.seek(op.block * DELTA_BLOCK)
+                        pieces = (old.read(min(chunk_size, op.length - done)) for done in range(0, op.length, chunk_size))
+                        reused += op.length
+                    elif op.data:
+                        pieces = [op.data]
+                        fetched += op.length
+                    else:
+                        if deadline_passed(deadline):
+                            self.bump_stat("copies_aborted")
+                            raise TApplicationException(DEADLINE_EXCEEDED, f"Copy of {filename} cannot finish before its deadline")
+                        pieces = (client.request_data(filename, offset, min(chunk_size, op.offset + op.length - offset))
+                                  for offset in range(op.offset, op.offset + op.length, chunk_size))
+                        fetched += op.length
+                    for piece in pieces:
+                        fout.write(piece)
+                        crc = zlib.crc32(piece, crc)
+
+        if crc != delta.checksum:
+            self.bump_stat("delta_checksum_failures")
+            fout.seek(0)
+            fout.truncate()
+            return False
+        self.bump_stat("delta_syncs")
+        self.bump_stat("delta_bytes_reused", reused)
+        self.bump_stat("delta_bytes_fetched", fetched)
+        return True
+
+    def request_delta(self, filename, block_size, signatures):
+        """Externally Called from Another Server, which parts of filename a copy with these block
+        signatures is missing, no ops when copying the whole file is cheaper"""
+        with self.fileCache.open(f'{self.storage_path}/{filename}') as cached:
+            data = cached.contents()
+            runs = diff_blocks(data, block_size, signatures, cached.size * DELTA_MAX_LITERAL) if block_size > 0 else None
+            if not runs:
+                self.bump_stat("deltas_refused")
+                return Delta([], 0) # the copier copies the whole file, no checksum needed
+            ops = []
+            inline = 0
+            for block, offset, length in runs:
+                body = b""
+                if block < 0 and inline + length <= DELTA_INLINE:
+                    body = data[offset:offset + length]
+                    inline += length
+                ops.append(DeltaOp(block, offset, length, body))
+            self.bump_stat("deltas_sent")
+            return Delta(ops, zlib.crc32(data))
+
+    def receive_bulk(self, fout, filename, ip, port, deadline):
+        """Internal Function, pulls all of filename from ip:port over its sendfile side channel
+
+        The bytes land straight in a memory map of the (preallocated) copy. Returns False, with
+        fout emptied again, when the source can't hand out a bulk transfer so the caller can fall
+        back to request_data.
+        """
+        try:
+            with self.pool.connection(ip, port) as client:
+                ticket = client.open_bulk(filename, 0, 0)
+        except TApplicationException as e:
+            if e.type != TApplicationException.UNKNOWN_METHOD: # a source that predates the side channel
+                raise
+            self.bump_stat("bulk_fallbacks")
+            return False
+
+        fout.truncate(ticket.size)
+        if not ticket.size:
+            return True
+        start = time.time()
+        received = 0
+        with socket.create_connection((ip, ticket.port), timeout=BULK_TIMEOUT) as sock, \
+             mmap.mmap(fout.fileno(), ticket.size) as dest:
+            sock.sendall(ticket.token.to_bytes(8, "big"))
+            view = memoryview(dest)
+            try:
+                while received < ticket.size:
+                    if deadline_unreachable(deadline, start, received, ticket.size):
+                        self.bump_stat("copies_aborted")
+                        raise TApplicationException(DEADLINE_EXCEEDED, f"Copy of {filename} cannot finish before its deadline")
+                    try:
+                        count = sock.recv_into(view[received:])
+                    except socket.timeout:
+                        raise TApplicationException(TApplicationException.MISSING_RESULT,
+                                                    f"Bulk transfer of {filename} stalled at {received} of {ticket.size} bytes")
+                    if not count:
+                        raise TApplicationException(TApplicationException.MISSING_RESULT, f"Bulk transfer of {filename} ended at {received} of {ticket.size} bytes")
+                    received += count
+            finally:
+                view.release()
+        self.bump_stat("bulk_received")
+        return True
+
+    def open_bulk(self, filename, offset, length):
+        """Externally Called from Another Server, issues a token for length bytes of filename from offset
+        (0 = to the end) on this node's sendfile side channel"""
+        path = f'{self.storage_path}/{filename}'
+        size = os.path.getsize(path) - offset
+        if length > 0:
+            size = min(size, length)
+        token = int.from_bytes(os.urandom(8), "big") >> 1 # fits a thrift i64
+        now = time.time()
+        with self._bulk_lock:
+            for stale in [t for t, ticket in self.bulkTickets.items() if ticket[3] < now]:
+                del self.bulkTickets[stale]
+            self.bulkTickets[token] = (path, offset, size, now + BULK_TOKEN_TTL)
+        return BulkTicket(token, self.bulkListener.getsockname()[1], size)
+
+    def accept_bulk(self):
+        """Internal Function, accepts side channel connections for the life of the server"""
+        while True:
+            conn, _ = self.bulkListener.accept()
+            threading.Thread(target=self.serve_bulk, args=(conn,), daemon=True).start()
+
+    def serve_bulk(self, conn):
+        """Internal Function, sends the byte range a token names from disk to the socket with os.sendfile"""
+        with conn:
+            conn.settimeout(BULK_TIMEOUT)
+            try:
+                token = b""
+                while len(token) < 8:
+                    part = conn.recv(8 - len(token))
+                    if not part:
+                        return
+                    token += part
+                with self._bulk_lock:
+                    ticket = self.bulkTickets.pop(int.from_bytes(token, "big"), None)
+                if ticket is None or ticket[3] < time.time():
+                    self.bump_stat("bulk_rejected")
+                    return
+                path, offset, size, _ = ticket
+                with open(path, 'rb') as fp:
+                    # socket.sendfile drives os.sendfile and honours the socket timeout
+                    sent = conn.sendfile(fp, offset, size) if size else 0
+                self.bump_stat("bulk_bytes_sent", sent)
+                if sent < size:
+                    raise OSError(f"{path} ended after {sent} of {size} bytes")
+                self.bump_stat("bulk_sent")
+            except OSError as e:
+                # The copier hung up (e.g. it gave up on its deadline) or stalled, or the file came up short
+                dprint(f"Bulk transfer failed: {e}")
+                self.bump_stat("bulk_aborted")
+
+    def receive_stream(self, fout, filename, ip, port, chunk_size, deadline):
+        """Internal Function, has ip:port stream all of filename to us with a single stream_file call
+
+        The frames come in as stream_chunk calls on the source's own connection to this node,
+        and the checksum stream_file returns is checked against what was written.
+        """
+        streamId = next(self.streamIds)
+        sink = StreamSink(fout)
+        with self._stream_lock:
+            self.streams[streamId] = sink
+        try:
+            with self.pool.connection(ip, port) as client:
+                checksum = client.stream_file(filename, 0, 0, self.info, streamId, chunk_size or self.chunkSize,
+                                              self.streamWindow, deadline or 0)
+        except TApplicationException as e:
+            if e.type == DEADLINE_EXCEEDED:
+                self.bump_stat("copies_aborted")
+            raise
+        finally:
+            with self._stream_lock:
+                del self.streams[streamId]
+        if checksum != sink.crc:
+            self.bump_stat("stream_checksum_failures")
+            raise TApplicationException(TApplicationException.INTERNAL_ERROR,
+                                        f"Checksum mismatch streaming {filename} from {ip}:{port} ({sink.received} bytes)")
+        self.bump_stat("streams_received")
+
+    def stream_file(self, filename, offset, length, receiver, streamId, chunk_size, window, deadline):
+        """Externally Called from Another Server, pushes length bytes of filename from offset (0 = to the end)
+        to receiver as back-to-back stream_chunk frames and returns their CRC-32
+
+        After every window frames a stream_sync on the same connection waits for the receiver to
+        work through them, which bounds how far the source can run ahead.
+        """
+        crc = 0
+        chunk_size = min(chunk_size or self.chunkSize, CHUNK_CAP)
+        window = max(1, window or self.streamWindow)
+        with open(f'{self.storage_path}/{filename}', 'rb') as fp:
+            size = os.fstat(fp.fileno()).st_size - offset
+            if length > 0:
+                size = min(size, length)
+            fp.seek(offset)
+            with self.pool.connection(receiver.ip, receiver.port) as client:
+                start = time.time()
+                sent = frames = 0
+                while sent < size:
+                    if deadline_unreachable(deadline, start, sent, size):
+                        raise TApplicationException(DEADLINE_EXCEEDED, f"Stream of {filename} cannot finish before its deadline")
+                    data = fp.read(min(chunk_size, size - sent))
+                    if not data:
+                        break
+                    client.stream_chunk(streamId, data)
+                    crc = zlib.crc32(data, crc)
+                    sent += len(data)
+                    frames += 1
+                    if frames % window == 0:
+                        client.stream_sync(streamId)
+                client.stream_sync(streamId)
+        self.bump_stat("streams_sent")
+        return crc
+
+    def stream_chunk(self, streamId, data):
+        """Externally Called from a streaming source (oneway), one frame of a stream"""
+        sink = self.streams.get(streamId)
+        if sink is not None: # frames of a copy that was given up on are dropped
+            sink.write(data)
+
+    def stream_sync(self, streamId):
+        """Externally Called from a streaming source, returns once every earlier frame is written"""
+        sink = self.streams.get(streamId)
+        if sink is None:
+            raise TApplicationException(TApplicationException.UNKNOWN, f"Stream {streamId} is no longer open")
+        return sink.received
+
     #  ██████╗ ██████╗  ██████╗ ██████╗ ██████╗ ██╗███╗   ██╗ █████╗ ████████╗ ██████╗ ██████╗ 
     # ██╔════╝██╔═══██╗██╔═══██╗██╔══██╗██╔══██╗██║████╗  ██║██╔══██╗╚══██╔══╝██╔═══██╗██╔══██╗
     # ██║     ██║   ██║██║   ██║██████╔╝██║  ██║██║██╔██╗ ██║███████║   ██║   ██║   ██║██████╔╝
@@ -208,68 +1369,446 @@ class ReplicaServerHandler():
         for server in self.server_list:
             if server == self.info:
                 continue
-            client, transport = self.open_client(server.ip, server.port)
-            try:
+            with self.pool.connection(server.ip, server.port) as client:
                 returnedFileList = client.get_all_files()
-            finally:
-                transport.close()
             allFiles.append(CompleteInfo(server, returnedFileList))
         return allFiles
     
-    def cord_read_file(self, filename):
-        """Internal Coordinator Function"""
-        self.chosenServers = random.sample(self.server_list, self.NR)
+    def choose_servers(self, k, include=None):
+        """Internal Coordinator Function, picks k quorum members with the configured policy
+
+        A replica passed as include is always a member and comes first.
+        """
+        if include not in self.server_list:
+            with self._load_lock:
+                return self.pickServers(self.server_list, self.replicaLoads, k)
+        others = [i for i, server in enumerate(self.server_list) if server != include]
+        with self._load_lock:
+            picked = self.pickServers([self.server_list[i] for i in others], [self.replicaLoads[i] for i in others], k - 1)
+        return [include] + picked
+
+    def replica_load(self, server):
+        return self.replicaLoads[self.server_list.index(server)]
+
+    def fetch_version(self, server, filename):
+        """Internal Coordinator Function, asks one server for its version of a file"""
+        load = self.replica_load(server)
+        with self._load_lock:
+            load.inflight += 1
+        start = time.time()
+        try:
+            if server == self.info:
+                version = self.get_version(filename) # no RPC, and no server thread, to ask ourselves
+            else:
+                with self.pool.connection(server.ip, server.port) as client:
+                    version = client.get_version(filename)
+            with self._load_lock:
+                load.observe(time.time() - start) # failures would look fast, only time replies
+            return version
+        finally:
+            with self._load_lock:
+                load.inflight -= 1
+
+    def poll_quorum(self, filename, size, include=None):
+        """Internal Coordinator Function, queries a quorum in parallel and keeps the newest version
+
+        With hedging enabled, hedgeExtra spare replicas are queried as well (right away, or
+        once hedgeDelay passes without a quorum, or as soon as a member fails). Polling stops
+        at the first `size` distinct replies, which still intersects every quorum of the other
+        kind because NR + NW > N. A replica passed as include is always polled and is
+        preferred as the contact when it holds the newest version.
+        """
+        servers = self.choose_servers(min(size + self.hedgeExtra, len(self.server_list)), include)
+        spares = servers[size:]
+        futures = {}
+        self.bump_stat("quorum_polls")
+
+        def send(group):
+            sent = {self.pollPool.submit(self.fetch_version, server, filename): server for server in group}
+            futures.update(sent)
+            return set(sent)
+
+        pending = send(servers[:size])
+        if spares and not self.hedgeDelay:
+            pending |= send(spares)
+            self.bump_stat("hedge_queries", len(spares))
+            spares = []
+        hedgeAt = time.time() + self.hedgeDelay
+
         newest = Response(0, None)
+        replies = [] # (server, version) for every member that answered
+        while len(replies) < size:
+            if not pending and not spares:
+                raise RuntimeError(f"Could not reach {size} replicas for {filename}")
+            timeout = max(0, hedgeAt - time.time()) if spares else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            failed = False
+            for future in done:
+                try:
+                    version = future.result()
+                except Exception as e:
+                    dprint(f"Version poll of {futures[future]} failed: {e}")
+                    failed = True
+                    continue
+                replies.append((futures[future], version))
+                if version > newest.version or (version == newest.version and futures[future] == include):
+                    newest.version = version
+                    newest.contact = futures[future]
 
-        for server in self.chosenServers:
-            client, transport = self.open_client(server.ip, server.port)
-            try:
-                version = client.get_version(filename)
-            finally:
-                transport.close()
-            if version > newest.version:
-                newest.version = version
-                newest.contact = server
-        return newest
+            # Hedge delay ran out or a member failed, bring in the spares
+            if spares and (failed or not done) and len(replies) < size:
+                pending |= send(spares)
+                self.bump_stat("hedges_fired")
+                self.bump_stat("hedge_queries", len(spares))
+                spares = []
+
+        if any(server in servers[size:] for server, _ in replies):
+            self.bump_stat("hedge_wins")
+
+        # Whatever the quorum agrees is newest is safe to remember
+        holders = [server for server, version in replies if version == newest.version]
+        self.record_version(filename, newest.version, holders)
+        return newest, replies
+
+    def lookup_version(self, filename, prefer=None):
+        """Internal Coordinator Function, answers from the version directory if it knows the file
+
+        Returns the newest version with a contact (prefer, if it holds that version) and every holder.
+        """
+        if not self.useDirectory:
+            return None
+        with self._directory_lock:
+            entry = self.versionDirectory.get(filename)
+        if entry is None:
+            self.bump_stat("directory_misses")
+            return None
+        self.bump_stat("directory_hits")
+        version, holders = entry
+        return Response(version, prefer if prefer in holders else random.choice(holders)), holders
 
-    def cord_write_file(self, filename):
+    def record_version(self, filename, version, holders):
+        """Internal Coordinator Function, remembers the latest committed version of a file"""
+        if not self.useDirectory or not version or not holders:
+            return
+        with self._directory_lock:
+            self.versionDirectory[filename] = (version, holders)
+
+    def forget_version(self, filename):
+        """Internal Coordinator Function, stops trusting the directory for a file until it is polled again"""
+        if not self.useDirectory:
+            return
+        with self._directory_lock:
+            if self.versionDirectory.pop(filename, None) is not None:
+                self.bump_stat("directory_invalidations")
+
+    def cord_read_file(self, filename, requester=None):
+        """Internal Coordinator Function, returns the newest version and the replicas known to hold it"""
+        entry = self.lookup_version(filename, requester)
+        if entry is not None:
+            return entry
+        newest, replies = self.poll_quorum(filename, self.NR, requester)
+        return newest, [server for server, version in replies if version == newest.version]
+
+    def cord_write_file(self, filename, jobId):
         """Internal Coordinator Function"""
-        self.chosenServers = random.sample(self.server_list, self.NW)
-        newest = Response(0, None)
+        fileQueue = self.jobQueues[filename]
+        if fileQueue.nextWrite is not None:
+            # Build on the write this one was coalesced with, its quorum gets the final version
+            newest, fileQueue.nextWrite = fileQueue.nextWrite, None
+            fileQueue.chosenServers = fileQueue.writeGroup.quorum
+            fileQueue.writeGroup.carrier = jobId
+            return newest
 
-        for server in self.chosenServers:
-            client, transport = self.open_client(server.ip, server.port)
-            try:
-                version = client.get_version(filename)
-            finally:
-                transport.close()
-            if version > newest.version:
-                newest.version = version
-                newest.contact = server
+        entry = self.lookup_version(filename)
+        if entry is None:
+            newest, replies = self.poll_quorum(filename, self.NW)
+            quorum = [server for server, _ in replies]
+        else:
+            newest, _ = entry
+            quorum = self.choose_servers(self.NW)
+        fileQueue.chosenServers = quorum
         return newest
     
+    def check_partition(self, filenames):
+        """Internal Coordinator Function, rejects files owned by another coordinator
+
+        Only the owner serializes jobs on a file, admitting one here would break mutual exclusion.
+        """
+        for filename in filenames:
+            owner = self.coordinator_for(filename)
+            if owner != self.info:
+                self.bump_stat("jobs_misrouted")
+                raise TApplicationException(TApplicationException.INTERNAL_ERROR,
+                                            f"{filename} belongs to coordinator {owner.ip}:{owner.port}")
+
+    def job_class(self, request):
+        """Internal Coordinator Function, scheduling class a job is queued under"""
+        cls = request.priority or DEFAULT_CLASS[request.type]
+        if cls not in self.classWeights:
+            raise TApplicationException(TApplicationException.INTERNAL_ERROR,
+                                        f"Unknown scheduling class {cls}, expected one of {', '.join(self.classWeights)}")
+        return cls
+
+    def acquire_file(self, request):
+        """Internal Coordinator Function, queues a job for its file and sleeps until it is admitted"""
+        turn = threading.Event()
+        with self._queue_lock:
+            fileQueue = self.jobQueues.setdefault(request.filename, FileJobQueue())
+            fileQueue.admit(request.type, turn)
+
+        # Sleep until finish_read/finish_write on this file hands the turn to us
+        turn.wait()
+        return fileQueue
+
+    def grant_job(self, request, fileQueue, enqueued):
+        """Internal Coordinator Function, leases an admitted job and looks up the version it works from"""
+        cls = self.job_class(request)
+        with self.pollGate.slot(cls):
+            with self._queue_lock:
+                jobId = next(self.jobIds)
+                self.leases[jobId] = JobLease(jobId, request.filename, request.type, cls, self.leaseTimeout)
+            self.record_queue_wait(jobId, request, time.time() - enqueued)
+            try:
+                return self.grant_version(request, fileQueue, jobId)
+            except BaseException:
+                # Nothing was granted, hand the file on now rather than once the lease runs out
+                self.end_lease(jobId)
+                raise
+
+    def grant_version(self, request, fileQueue, jobId):
+        """Internal Coordinator Function, the version and contact a leased job works from"""
+        if request.type == "read":
+            # Readers admitted together share one quorum poll, no write can land in between
+            with fileQueue.pollLock:
+                polled = fileQueue.readResult is None
+                if polled:
+                    fileQueue.readResult = self.cord_read_file(request.filename, request.requester)
+                newest, holders = fileQueue.readResult
+            if request.requester is not None:
+                # A requester that already holds the newest version reads without any transfer
+                if request.requester in holders:
+                    newest = Response(newest.version, request.requester)
+                    self.bump_stat("locality_hits")
+                elif polled:
+                    self.bump_stat("locality_misses")
+                # else the shared poll just didn't include this requester, it may well hold the file
+            # Every replica with the newest version, the contact first, a stale reader may pull from all of them
+            # A file nobody has written yet has no contact (or one not polled), and nothing to pull
+            contacts = [newest.contact] if newest.contact is not None else []
+            holders = contacts + [server for server in holders if server != newest.contact] if newest.version else []
+            return Response(newest.version, newest.contact, jobId, 0, holders)
+        newest = self.cord_write_file(request.filename, jobId)
+        return Response(newest.version, newest.contact, jobId)
+
+    def enter_admission(self):
+        """Internal Function, claims an admission slot or returns how long the caller should back off
+
+        Every admitted call may block a server thread until its job gets the file, so only
+        admissionLimit of them run at once and the remaining threads stay free for the
+        finish_*, get_version and data transfer calls that let queued jobs through.
+        """
+        with self._queue_lock:
+            if self.admitting < self.admissionLimit:
+                self.admitting += 1
+                return None
+        self.bump_stat("jobs_rejected")
+        with self._stats_lock:
+            dispatched = self.stats.get("jobs_dispatched", 0)
+            meanWait = self.stats.get("queue_wait_total_s", 0) / dispatched if dispatched else 0
+        return min(RETRY_AFTER_MAX, max(RETRY_AFTER_MIN, meanWait))
+
+    def leave_admission(self):
+        with self._queue_lock:
+            self.admitting -= 1
+
+    @contextlib.contextmanager
+    def admission(self):
+        """Internal Function, holds an admission slot for a client operation or raises OVERLOADED"""
+        retryAfter = self.enter_admission()
+        if retryAfter is not None:
+            raise TApplicationException(OVERLOADED, f"Replica {self.info.ip}:{self.info.port} overloaded, "
+                                                    f"retry after {retryAfter:.3f}s")
+        try:
+            yield
+        finally:
+            self.leave_admission()
+
     def insert_job(self, request):
-        """Called from server, inserts a job"""
+        """Called from server, inserts a job into the queue for its file"""
+        retryAfter = self.enter_admission()
+        if retryAfter is not None:
+            return Response(0, None, 0, retryAfter)
+        try:
+            return self.admit_job(request)
+        finally:
+            self.leave_admission()
 
+    def insert_jobs(self, requests):
+        """Called from server, admits a group of jobs together and returns one Response per request"""
+        retryAfter = self.enter_admission()
+        if retryAfter is not None:
+            return [Response(0, None, 0, retryAfter) for _ in requests]
+        try:
+            return self.admit_batch(requests)
+        finally:
+            self.leave_admission()
+
+    def drop_expired(self, requests, acquired=False):
+        """Internal Coordinator Function, drops jobs whose caller has already given up
+
+        With acquired set the jobs hold their files, which are handed on to the next in line.
+        """
+        if not any(deadline_passed(request.deadline) for request in requests):
+            return
+        if acquired:
+            # A writer handed a coalesced burst can't drop it, the burst's writers are waiting on it
+            carried = {request.filename for request in requests
+                       if request.type == "write" and self.carry_coalesced(request.filename)}
+            with self._queue_lock:
+                for request in requests:
+                    if request.filename not in carried:
+                        self.advance_job(request.filename, request.type)
+        self.bump_stat("jobs_expired", len(requests))
+        raise TApplicationException(DEADLINE_EXCEEDED, f"Deadline passed before {requests[0].filename} was admitted")
+
+    def carry_coalesced(self, filename):
+        """Internal Coordinator Function, propagates the coalesced burst handed to a writer that expired
+
+        The coordinator takes the writer's place under a committing lease of its own and releases
+        the file once the burst reached its quorum. Returns False if no burst was handed over.
+        """
         with self._queue_lock:
-            taskNumber = self.taskNumberAssigned
-            self.taskNumberAssigned += 1
+            fileQueue = self.jobQueues[filename]
+            carried, group = fileQueue.nextWrite, fileQueue.writeGroup
+            if carried is None or group is None:
+                return False
+            fileQueue.nextWrite = fileQueue.writeGroup = None
+            jobId = next(self.jobIds)
+            self.leases[jobId] = JobLease(jobId, filename, "write", DEFAULT_CLASS["write"], self.leaseTimeout)
+            self.leases[jobId].committing = True
+            group.carrier = jobId
+
+        dprint(f"Propagating coalesced write of {filename} v{carried.version} for an expired writer")
+        self.bump_stat("coalesced_writes_carried")
+        error = self.propagate_write(filename, carried.version, carried.contact, group.quorum, DEFAULT_CLASS["write"])
+        group.finish(error)
+        if self.end_lease(jobId) and error is None:
+            self.record_version(filename, carried.version,
+                                [carried.contact] + [server for server in group.quorum if server != carried.contact])
+        else:
+            self.forget_version(filename)
+        return True
+
+    def admit_job(self, request):
+        """Internal Coordinator Function, waits for a job's file and grants it"""
+        self.check_partition([request.filename])
+        self.job_class(request)
+        self.drop_expired([request])
+        enqueued = time.time()
+        fileQueue = self.acquire_file(request)
+        self.drop_expired([request], acquired=True) # expired while queued, skip its polling and propagation
+        return self.grant_job(request, fileQueue, enqueued)
+
+    def admit_batch(self, requests):
+        """Internal Coordinator Function, acquires every file of a batch and grants its jobs"""
+        self.check_partition([request.filename for request in requests])
+        for request in requests:
+            self.job_class(request)
+        self.drop_expired(requests)
+        enqueued = time.time()
+
+        # One job per file, a write to a file covers any reads of it in the same batch
+        merged = {}
+        for request in requests:
+            if merged.get(request.filename) is None or request.type == "write":
+                merged[request.filename] = Request(request.type, request.filename, request.requester,
+                                                   request.priority, request.deadline)
 
+        # Take the files in sorted order so overlapping batches can never deadlock
+        fileQueues = {filename: self.acquire_file(merged[filename]) for filename in sorted(merged)}
+        self.drop_expired(list(merged.values()), acquired=True)
+        futures = {filename: self.batchPool.submit(self.grant_job, merged[filename], fileQueues[filename], enqueued)
+                   for filename in merged}
+        wait(futures.values())
+        error = next((future.exception() for future in futures.values() if future.exception()), None)
+        if error is not None:
+            # The caller never sees the jobs that were granted, release their files too
+            for future in futures.values():
+                if future.exception() is None:
+                    self.end_lease(future.result().jobId)
+            raise error
+        self.bump_stat("batches_admitted")
+        return [futures[request.filename].result() for request in requests]
+
+    def advance_job(self, filename, type):
+        """Internal Coordinator Function, releases a file for the next job(s) in its queue
+
+        Must be called while holding the queue lock.
+        """
+        fileQueue = self.jobQueues[filename]
+        fileQueue.release(type)
+        if fileQueue.idle():
+            # Nobody else wants this file, drop its queue
+            del self.jobQueues[filename]
+
+    def renew_lease(self, jobId, committing=False):
+        """Internal Coordinator Function, extends a job's lease or fences it off if it already expired
+
+        A committing lease is never reclaimed, the coordinator itself is propagating the write and
+        ends the lease once that is done.
+        """
+        with self._queue_lock:
+            lease = self.leases.get(jobId)
+            if lease is not None:
+                lease.renew()
+                lease.committing = lease.committing or committing
+                return lease
+        self.bump_stat("late_completions_fenced")
+        raise TApplicationException(LEASE_EXPIRED, f"Lease for job {jobId} expired, operation was not committed")
+
+    def end_lease(self, jobId):
+        """Internal Coordinator Function, finishes a job and releases its file, False if the lease was already reclaimed"""
+        with self._queue_lock:
+            lease = self.leases.pop(jobId, None)
+            if lease is not None:
+                self.advance_job(lease.filename, lease.type)
+        if lease is None:
+            self.bump_stat("late_completions_fenced")
+        return lease is not None
+
+    def reap_leases(self):
+        """Internal Coordinator Function, background thread reclaiming files from expired jobs"""
         while True:
-            with self._coord_lock:
-                if taskNumber != self.taskNumberProcessing:
-                    # not our turn yet, someone else is processing
-                    pass
-                else:
-                    # it *is* our turn, process the read or write quorum
-                    if request.type == "read":
-                        response = self.cord_read_file(request.filename)
-                    else:
-                        response = self.cord_write_file(request.filename)
+            time.sleep(min(1.0, self.leaseTimeout / 4))
+            now = time.time()
+            with self._queue_lock:
+                expired = [lease for lease in self.leases.values() if lease.expired(now)]
+                for lease in expired:
+                    del self.leases[lease.jobId]
+                    fileQueue = self.jobQueues[lease.filename]
+                    if lease.type == "write" and fileQueue.writeGroup is not None:
+                        # The burst this writer was carrying will never be propagated
+                        fileQueue.writeGroup.finish(TApplicationException(LEASE_EXPIRED,
+                            f"Coalesced write to {lease.filename} was lost when job {lease.jobId} expired"))
+                        fileQueue.writeGroup = None
+                        fileQueue.nextWrite = None
+                    self.advance_job(lease.filename, lease.type)
+
+            for lease in expired:
+                dprint(f"Reclaimed {lease.type} job {lease.jobId} on {lease.filename} after its lease expired")
+                self.bump_stat("jobs_reclaimed")
+                if lease.type == "write":
+                    # The writer may have updated part of the quorum
+                    self.forget_version(lease.filename)
 
-                    # self.taskNumberProcessing += 1
-                    return response
-            time.sleep(0.005)
+    def record_queue_wait(self, jobId, request, waited):
+        """Internal Coordinator Function, tracks how long a job sat in the queue, overall and per class"""
+        cls = self.job_class(request)
+        for suffix in ("", f".{cls}"):
+            self.bump_stat(f"jobs_dispatched{suffix}")
+            self.bump_stat(f"queue_wait_total_s{suffix}", waited)
+            self.max_stat(f"queue_wait_max_s{suffix}", waited)
+        dprint(f"Job {jobId} ({request.type} {request.filename}, {cls}) waited {waited * 1000:.2f}ms")
 
     # ██████╗ ███████╗██████╗ ██╗     ██╗ ██████╗ █████╗                        
     # ██╔══██╗██╔════╝██╔══██╗██║     ██║██╔════╝██╔══██╗                       
@@ -285,70 +1824,190 @@ class ReplicaServerHandler():
     # ██║     ╚██████╔╝██║ ╚████║╚██████╗   ██║   ██║╚██████╔╝██║ ╚████║███████║
     # ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝   ╚═╝   ╚═╝ ╚═════╝ ╚═╝  ╚═══╝╚══════╝
 
+    def call_coordinator(self, coordinator, method, *args):
+        """Internal Function, calls a coordinator RPC, directly when we are that coordinator
+
+        Going through Thrift to ourselves would hold a second server thread for the same operation.
+        """
+        if coordinator == self.info:
+            return getattr(self, method)(*args)
+        with self.pool.connection(coordinator.ip, coordinator.port) as client:
+            return getattr(client, method)(*args)
+
+    def request_jobs(self, coordinator, requests, batch=False):
+        """Internal Function, inserts jobs on their coordinator, backing off while it reports overload"""
+        if coordinator == self.info:
+            # Our own partition, the client operation already holds an admission slot here
+            return self.admit_batch(requests) if batch else [self.admit_job(requests[0])]
+
+        for attempt in range(ADMISSION_RETRIES + 1):
+            if batch:
+                responses = self.call_coordinator(coordinator, "insert_jobs", requests)
+            else:
+                responses = [self.call_coordinator(coordinator, "insert_job", requests[0])]
+            retryAfter = responses[0].retryAfter
+            if not retryAfter:
+                return responses
+
+            # Jittered exponential back-off from the coordinator's hint, unless the caller gives up first
+            if deadline_passed(requests[0].deadline):
+                break
+            self.bump_stat("admission_retries")
+            dprint(f"Coordinator {coordinator.port} overloaded, retrying in {retryAfter:.2f}s")
+            time.sleep(retryAfter * (2 ** attempt) * random.uniform(0.5, 1.5))
+        if deadline_passed(requests[0].deadline):
+            self.bump_stat("requests_expired")
+            raise TApplicationException(DEADLINE_EXCEEDED, f"Deadline passed while {coordinator.ip}:{coordinator.port} was overloaded")
+        raise TApplicationException(OVERLOADED, f"Coordinator {coordinator.ip}:{coordinator.port} overloaded, retry later")
+
     def list_files(self):
         """Externally Called From Client"""
-        # Delegate to coordinator if necessary
-        if self.info != self.coordinatorContact:
-            client, transport = self.open_client(self.coordinatorContact.ip, self.coordinatorContact.port)
-            try:
-                response = client.cord_list_files()
-            finally:
-                transport.close()
-            return response
+        # Delegate to coordinator if necessary, listing covers every partition so any of them will do
+        if self.role != 1:
+            coordinator = random.choice(self.coordinators)
+            with self.pool.connection(coordinator.ip, coordinator.port) as client:
+                return client.cord_list_files()
         
         # Otherwise, we are coordinator, fall to cord_list_files
         return self.cord_list_files()
 
-    def read_file(self, filename):
+    def check_deadline(self, deadline):
+        """Internal Function, turns away client operations that arrive after their deadline"""
+        if deadline_passed(deadline):
+            self.bump_stat("requests_expired")
+            raise TApplicationException(DEADLINE_EXCEEDED, "Deadline passed before the operation started")
+
+    def read_file(self, filename, priority=None, deadline=None):
         """Externally Called From Client"""
-        request = Request("read", filename)
+        self.check_deadline(deadline)
+        with self.admission():
+            return self.run_read(filename, priority, deadline)
+
+    def run_read(self, filename, priority, deadline):
+        request = Request("read", filename, self.info, priority, deadline)
+        coordinator = self.coordinator_for(filename)
 
         dprint("Read Operation: inserting job to coordinator")
-        client, transport = self.open_client(self.coordinatorContact.ip, self.coordinatorContact.port)
-        try:
-            response = client.insert_job(request)
-        finally:
-            transport.close()
+        response, = self.request_jobs(coordinator, [request])
         
         # Ensure local copy is up‑to‑date
-        local_version = self.get_version(filename)
-        if local_version < response.version: # Update file if needed
-            dprint(f"Read Operation: Copying File")
-            self.copy_file(response.version, filename, response.contact.ip, response.contact.port)
-        else:
-            dprint(f"Local Copy Already Most Recent Version")
-        
-        # ACK
-        client, transport = self.open_client(self.coordinatorContact.ip, self.coordinatorContact.port)
         try:
-            client.finish_read()
+            local_version = self.get_version(filename)
+            if local_version < response.version: # Update file if needed
+                dprint(f"Read Operation: Copying File")
+                self.copy_file(response.version, filename, response.contact.ip, response.contact.port,
+                               deadline=deadline, sources=response.holders)
+                self.bump_stat("reads_copied")
+            else:
+                dprint(f"Local Copy Already Most Recent Version")
+                self.bump_stat("reads_local")
         finally:
-            transport.close()
+            # ACK, even for an abandoned copy so the file is released
+            self.call_coordinator(coordinator, "finish_read", filename, response.jobId)
 
         return f"{self.storage_path}/{filename}"
 
-    def write_file(self, filename, filepath):
-        """Externally Called from Client"""
-        request = Request("write", filename)
+    def read_files(self, filenames, priority=None, deadline=None):
+        """Externally Called From Client, reads several files under a single batch of coordinator jobs"""
+        self.check_deadline(deadline)
+        with self.admission():
+            return self.run_reads(filenames, priority, deadline)
 
-        dprint("Write Operation: inserting job to coordinator")
-        client, transport = self.open_client(self.coordinatorContact.ip, self.coordinatorContact.port)
+    def run_reads(self, filenames, priority, deadline):
+        # Split the batch by owning coordinator
+        partitions = {}
+        for filename in filenames:
+            partitions.setdefault(self.coordinatorRing.index(filename), []).append(filename)
+
+        # Admit partition by partition in ring order, every batch locks files in the same global order
+        responses = {}
+        admitted = []
         try:
-            response = client.insert_job(request)
+            for index in sorted(partitions):
+                coordinator = self.coordinators[index]
+                requests = [Request("read", filename, self.info, priority, deadline) for filename in partitions[index]]
+                dprint(f"Read Operation: inserting batch of {len(requests)} jobs to coordinator {coordinator.port}")
+                responses.update(zip(partitions[index], self.request_jobs(coordinator, requests, batch=True)))
+                admitted.append(index)
+
+            # Bring every stale local copy up to date
+            for filename, response in responses.items():
+                if self.get_version(filename) < response.version:
+                    dprint(f"Read Operation: Copying File {filename}")
+                    self.copy_file(response.version, filename, response.contact.ip, response.contact.port,
+                                   deadline=deadline, sources=response.holders)
+                    self.bump_stat("reads_copied")
+                else:
+                    self.bump_stat("reads_local")
         finally:
-            transport.close()
+            # ACK each coordinator's share of the batch at once, also when the batch is abandoned part way
+            for index in admitted:
+                completed = [Completion(responses[filename].jobId, filename, responses[filename].version, "read")
+                             for filename in partitions[index]]
+                self.call_coordinator(self.coordinators[index], "finish_jobs", completed, self.info)
+
+        return [f"{self.storage_path}/{filename}" for filename in filenames]
+
+    def write_file(self, filename, filepath, priority=None, deadline=None):
+        """Externally Called from Client
+
+        The deadline only covers waiting for the coordinator, a granted write always commits.
+        """
+        self.check_deadline(deadline)
+        with self.admission():
+            self.run_write(filename, filepath, priority, deadline)
+
+    def run_write(self, filename, filepath, priority, deadline):
+        request = Request("write", filename, self.info, priority, deadline)
+        coordinator = self.coordinator_for(filename)
+
+        dprint("Write Operation: inserting job to coordinator")
+        response, = self.request_jobs(coordinator, [request])
 
         # Update file version
         new_version = response.version + 1
-        shutil.copy(filepath, f"{self.storage_path}/")
+        # Swapped in whole, so anyone still serving the old version from a memory map keeps reading it intact
+        stored = f"{self.storage_path}/{os.path.basename(filepath)}"
+        partial = f"{self.storage_path}/.{os.path.basename(filepath)}.{threading.get_ident()}.part"
+        previous = f"{self.storage_path}/.{os.path.basename(filepath)}.{threading.get_ident()}.old" # kept until committed
+        old_version = self.get_version(filename)
+        try:
+            shutil.copy(filepath, partial)
+            if os.path.exists(stored):
+                os.link(stored, previous)
+            os.replace(partial, stored)
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+        self.fileCache.invalidate(stored)
         self.update_file_metadata(filename, new_version)
 
         # Inform coordinator
-        client, transport = self.open_client(self.coordinatorContact.ip, self.coordinatorContact.port)
         try:
-            client.finish_write(new_version, filename, self.info.ip, self.info.port, self.info.ip, self.info.port)
+            self.call_coordinator(coordinator, "finish_write", new_version, filename, self.info.ip, self.info.port,
+                                  self.info.ip, self.info.port, response.jobId)
+        except TApplicationException as e:
+            if e.type == LEASE_EXPIRED:
+                # The coordinator already gave the file to someone else, this write must not stay visible here
+                self.rollback_write(filename, stored, previous, old_version)
+            raise
         finally:
-            transport.close()
+            if os.path.exists(previous):
+                os.remove(previous)
+
+    def rollback_write(self, filename, stored, previous, old_version):
+        """Internal Function, puts back the file and version a fenced write replaced"""
+        if os.path.exists(previous):
+            os.replace(previous, stored)
+        else:
+            os.remove(stored)
+        self.fileCache.invalidate(stored)
+        if old_version:
+            self.update_file_metadata(filename, old_version)
+        else:
+            self.contained_files = [f for f in self.contained_files if f.name != filename]
+        self.bump_stat("writes_rolled_back")
+        dprint(f"Write of {filename} was fenced off, rolled back to version {old_version}")
 
     #  ██████╗ █████╗ ██╗     ██╗             
     # ██╔════╝██╔══██╗██║     ██║             
@@ -364,27 +2023,133 @@ class ReplicaServerHandler():
     # ██████╔╝██║  ██║╚██████╗██║  ██╗███████║
     # ╚═════╝ ╚═╝  ╚═╝ ╚═════╝╚═╝  ╚═╝╚══════╝
                                         
-    def finish_write(self, version, filename, ip, port, source_ip, source_port):
-        # Hold the coordinator lock while pushing updates to the write quorum
-        with self._coord_lock:
-            if self.chosenServers:
-                for server in self.chosenServers:
-                    # skip the original writer
-                    if (source_ip, source_port) == (server.ip, server.port):
-                        continue
-                    client, transport = self.open_client(server.ip, server.port)
-                    try:
-                        client.copy_file(version, filename, ip, port)
-                    finally:
-                        transport.close()
-                self.chosenServers = None
-            self.currentServers = None
-            self.taskNumberProcessing += 1
+    def push_file(self, server, version, filename, ip, port):
+        """Internal Coordinator Function, has one quorum member copy a new version and times it"""
+        load = self.replica_load(server)
+        with self._load_lock:
+            load.inflight += 1
+        start = time.time()
+        try:
+            if server == self.info:
+                self.copy_file(version, filename, ip, port)
+            else:
+                with self.pool.connection(server.ip, server.port) as client:
+                    client.copy_file(version, filename, ip, port, 0)
+        finally:
+            with self._load_lock:
+                load.inflight -= 1
+        elapsed = time.time() - start
 
-    def finish_read(self):
-        with self._coord_lock:
-            self.chosenServers = None
-            self.taskNumberProcessing += 1
+        dprint(f"Pushed {filename} v{version} to {server.ip}:{server.port} in {elapsed * 1000:.2f}ms")
+        self.bump_stat("pushes")
+        self.bump_stat("push_time_total_s", elapsed)
+        self.max_stat("push_time_max_s", elapsed)
+
+    def propagate_write(self, filename, version, contact, quorum, cls, writer=None):
+        """Internal Coordinator Function, has every quorum member but the writer copy version from contact
+
+        Returns the first push error, or None once all of them have the new version.
+        """
+        writer = writer or contact
+        with self.pushGate.slot(cls):
+            futures = [self.pushPool.submit(self.push_file, server, version, filename, contact.ip, contact.port)
+                       for server in quorum
+                       if (writer.ip, writer.port) != (server.ip, server.port)] # skip the original writer
+            wait(futures)
+        return next((future.exception() for future in futures if future.exception()), None)
+
+    def defer_write(self, version, filename, source_ip, source_port, jobId):
+        """Internal Coordinator Function, hands the file straight to the next queued writer instead of propagating
+
+        Returns the WriteGroup this write joined, or None if no writer is queued behind it.
+        """
+        with self._queue_lock:
+            fileQueue = self.jobQueues[filename]
+            head = fileQueue.peek()
+            if jobId not in self.leases or head is None or head[0] != "write":
+                return None
+            if fileQueue.writeGroup is None:
+                fileQueue.writeGroup = WriteGroup(fileQueue.chosenServers)
+            fileQueue.nextWrite = Response(version, ContactInfo(source_ip, source_port))
+            group = fileQueue.writeGroup
+            group.carrier = None
+            del self.leases[jobId]
+            self.advance_job(filename, "write")
+
+        dprint(f"Coalesced write of {filename} v{version} into the next queued write")
+        self.bump_stat("writes_coalesced")
+        return group
+
+    def await_group(self, group, filename):
+        """Internal Coordinator Function, waits for a coalesced group to be propagated, raising its error
+
+        Every lease timeout the group must have moved on to a new carrier or still be carried by a
+        live lease, otherwise nothing is left to propagate it and the write fails.
+        """
+        carrier = group.carrier
+        while not group.done.wait(self.leaseTimeout):
+            with self._queue_lock:
+                stalled = group.carrier == carrier and group.carrier not in self.leases
+                carrier = group.carrier
+                fileQueue = self.jobQueues.get(filename)
+                if stalled and fileQueue is not None and fileQueue.writeGroup is group:
+                    fileQueue.writeGroup = None
+                    fileQueue.nextWrite = None
+            if stalled:
+                self.bump_stat("coalesced_writes_stalled")
+                group.finish(TApplicationException(LEASE_EXPIRED,
+                                                   f"Coalesced write to {filename} was never propagated"))
+        if group.error is not None:
+            raise group.error
+
+    def finish_write(self, version, filename, ip, port, source_ip, source_port, jobId):
+        # The file's queue is held until the updates reach the write quorum, however long the pushes take
+        lease = self.renew_lease(jobId, committing=True)
+        if self.coalesceWrites:
+            group = self.defer_write(version, filename, source_ip, source_port, jobId)
+            if group is not None:
+                # A later write carries this one, acknowledge once it reaches the quorum
+                self.await_group(group, filename)
+                return
+
+        fileQueue = self.jobQueues[filename]
+        group = fileQueue.writeGroup
+        chosenServers = fileQueue.chosenServers or []
+        # Only acknowledge once every quorum member has the new version
+        error = self.propagate_write(filename, version, ContactInfo(ip, port), chosenServers, lease.cls,
+                                     ContactInfo(source_ip, source_port))
+        if group is not None:
+            with self._queue_lock:
+                fileQueue.writeGroup = None
+            group.finish(error)
+        if self.end_lease(jobId) and error is None:
+            holders = [server for server in chosenServers if (server.ip, server.port) != (source_ip, source_port)]
+            self.record_version(filename, version, [ContactInfo(source_ip, source_port)] + holders)
+        else:
+            self.forget_version(filename)
+        if error is not None:
+            raise error
+
+    def finish_read(self, filename, jobId):
+        if not self.end_lease(jobId):
+            dprint(f"Late finish_read for job {jobId} on {filename}, lease already reclaimed")
+
+    def finish_jobs(self, completions, source):
+        """Completes a batch from insert_jobs, writes are pushed to their quorums concurrently"""
+        with self._queue_lock:
+            types = {jobId: lease.type for jobId, lease in self.leases.items()}
+
+        futures = []
+        for jobId, completion in {completion.jobId: completion for completion in completions}.items():
+            # A write whose lease is gone has no type left here, it must still go through finish_write to be fenced
+            if "write" in (completion.type, types.get(jobId)):
+                futures.append(self.batchPool.submit(self.finish_write, completion.version, completion.filename,
+                                                     source.ip, source.port, source.ip, source.port, jobId))
+            else:
+                self.finish_read(completion.filename, jobId)
+        wait(futures)
+        for future in futures:
+            future.result()
 
 #  ███╗   ███╗ █████╗ ██╗███╗   ██╗
 #  ████╗ ████║██╔══██╗██║████╗  ██║
@@ -393,30 +2158,94 @@ class ReplicaServerHandler():
 #  ██║ ╚═╝ ██║██║  ██║██║██║ ╚████║
 #  ╚═╝     ╚═╝╚═╝  ╚═╝╚═╝╚═╝  ╚═══╝
 
-def run_replica_server(node_ip, node_port, storage_path):
-    handler = ReplicaServerHandler(node_ip, node_port, storage_path)
+def run_replica_server(node_ip, node_port, storage_path, **options):
+    handler = ReplicaServerHandler(node_ip, node_port, storage_path, **options)
     processor = replicaServer.Processor(handler)
     transport = TSocket.TServerSocket(host='0.0.0.0', port=node_port)
     tfactory = TTransport.TBufferedTransportFactory()
     pfactory = TBinaryProtocol.TBinaryProtocolFactory()
     server = TServer.TThreadPoolServer(processor, transport, tfactory, pfactory)
-    server.setNumThreads(16)
+    # Every peer may park up to maxPerPeer pooled connections here, each pinning a thread while idle
+    server.setNumThreads(SERVER_THREADS + len(handler.server_list) * handler.pool.maxPerPeer)
 
     print(f'Replica Server running @ {node_port} (coord={handler.role == 1})')
     server.serve()
 
+def parse_class_weights(text):
+    """Parses --class-weights, e.g. interactive=8,bulk=1,background=0.25"""
+    weights = {}
+    for item in text.split(","):
+        cls, _, weight = item.partition("=")
+        try:
+            weights[cls.strip()] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"bad class weight {item!r}, expected class=weight")
+        if weights[cls.strip()] <= 0:
+            raise argparse.ArgumentTypeError(f"weight of {cls} must be positive")
+    for cls in DEFAULT_CLASS.values():
+        weights.setdefault(cls, CLASS_WEIGHTS[cls]) # jobs without a class still need theirs
+    return weights
+
 def main():
     parser = argparse.ArgumentParser(description="Replica Server in DFS Network")
     parser.add_argument("node_ip", type=str, help="ip for replica server")
     parser.add_argument("node_port", type=int, help="Port number for replica server")
     parser.add_argument("storage_path", type=str, help="path to store data in")
     parser.add_argument("-d", "--debug", action="store_true", help="Enable debug output")
+    parser.add_argument("--hedge-extra", type=int, default=0, help="Spare replicas to query on top of NR/NW (coordinator)")
+    parser.add_argument("--hedge-delay", type=float, default=0.0, help="Milliseconds to wait before querying the spares")
+    parser.add_argument("--push-workers", type=int, default=PUSH_WORKERS, help="Replicas a write is pushed to at once (coordinator)")
+    parser.add_argument("--version-directory", action="store_true", help="Answer version lookups from committed writes (coordinator)")
+    parser.add_argument("--lease-timeout", type=float, default=LEASE_TIMEOUT, help="Seconds a job may hold its file before it is reclaimed (coordinator)")
+    parser.add_argument("--coalesce-writes", action="store_true", help="Propagate bursts of queued writes to a file once (coordinator)")
+    parser.add_argument("--quorum-policy", choices=QUORUM_POLICIES, default="random", help="How quorum members are picked (coordinator)")
+    parser.add_argument("--reserved-threads", type=int, default=RESERVED_THREADS,
+                        help="Server threads client operations and job admission leave free for completion and transfer calls")
+    parser.add_argument("--pool-size", type=int, default=POOL_SIZE,
+                        help="Open connections kept per peer, 0 opens one per call")
+    parser.add_argument("--pool-idle", type=float, default=IDLE_TIMEOUT,
+                        help="Seconds a pooled connection may sit idle before it is closed")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Bytes fetched per request_data call")
+    parser.add_argument("--adaptive-chunks", action="store_true", help="Grow the chunk size while throughput keeps improving")
+    parser.add_argument("--chunk-cap", type=int, default=CHUNK_CAP, help="Largest chunk an adaptive transfer may use")
+    parser.add_argument("--transfer", choices=TRANSFER_MODES, default="chunked",
+                        help="chunked: pull files with request_data calls, stream: the source pushes them in one call, "
+                             "sendfile: the source sends them over a raw side channel with os.sendfile")
+    parser.add_argument("--stream-window", type=int, default=STREAM_WINDOW,
+                        help="Frames a streaming source may send before waiting for this node to catch up")
+    parser.add_argument("--fetch-window", type=int, default=FETCH_WINDOW,
+                        help="request_data calls a chunked copy keeps outstanding")
+    parser.add_argument("--fetch-connections", type=int, default=1,
+                        help="Connections a pipelined copy spreads its window over")
+    parser.add_argument("--max-sources", type=int, default=MAX_SOURCES,
+                        help="Replicas holding the newest version a read's copy pulls from at once")
+    parser.add_argument("--file-cache", type=int, default=FILE_CACHE_SIZE,
+                        help="Files kept memory mapped for request_data, 0 opens the file on every call")
+    parser.add_argument("--delta-sync", action="store_true",
+                        help="Update an older local copy by fetching only the blocks that changed")
+    parser.add_argument("--compress", nargs="+", choices=COMPRESSORS, default=[],
+                        help="Codecs chunked copies ask their source for, in order of preference")
+    parser.add_argument("--compress-level", type=int, choices=range(10), default=COMPRESS_LEVEL,
+                        help="Compression level the source is asked to use")
+    parser.add_argument("--class-weights", type=parse_class_weights, default=CLASS_WEIGHTS,
+                        help="Fair queuing weights as class=weight,... (coordinator)")
 
     args = parser.parse_args()
     if args.debug:
+        global DEBUG
         DEBUG = 1
     
-    run_replica_server(args.node_ip, args.node_port, args.storage_path)
+    run_replica_server(args.node_ip, args.node_port, args.storage_path,
+                       hedge_extra=args.hedge_extra, hedge_delay=args.hedge_delay / 1000,
+                       push_workers=args.push_workers, version_directory=args.version_directory,
+                       lease_timeout=args.lease_timeout, coalesce_writes=args.coalesce_writes,
+                       quorum_policy=args.quorum_policy, class_weights=args.class_weights,
+                       reserved_threads=args.reserved_threads, pool_size=args.pool_size, pool_idle=args.pool_idle,
+                       chunk_size=args.chunk_size, adaptive_chunks=args.adaptive_chunks, chunk_cap=args.chunk_cap,
+                       transfer=args.transfer, stream_window=args.stream_window,
+                       fetch_window=args.fetch_window, fetch_connections=args.fetch_connections,
+                       max_sources=args.max_sources, file_cache=args.file_cache, delta_sync=args.delta_sync,
+                       compress=args.compress, compress_level=args.compress_level)
 
 if __name__ == "__main__":
     main()
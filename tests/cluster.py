@@ -0,0 +1,63 @@
+# cluster.py
+# Written by Matthew Breach and Lily Hymes
+
+"""
+Shared setup of the regression tests
+---------------------------------------
+* ClusterTest starts NODES replica handlers on loopback inside the test process, node 0 is the coordinator.
+* Each test gets a fresh temp directory holding compute_nodes.txt and every node's storage.
+"""
+
+import os, shutil, socket, sys, tempfile, threading, time, unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT) # replica_server finds gen-py and thrift relative to the working directory
+sys.path.insert(0, ROOT)
+
+from replica_server import ReplicaServerHandler
+from PA3 import replicaServer
+from thrift.transport import TSocket, TTransport
+from thrift.protocol import TBinaryProtocol
+from thrift.server import TServer
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def serve(handler, port):
+    server = TServer.TThreadPoolServer(replicaServer.Processor(handler), TSocket.TServerSocket(host="127.0.0.1", port=port),
+                                       TTransport.TBufferedTransportFactory(),
+                                       TBinaryProtocol.TBinaryProtocolFactory(), daemon=True)
+    server.setNumThreads(8)
+    threading.Thread(target=server.serve, daemon=True).start()
+    for _ in range(50): # wait until it accepts connections
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"test server on port {port} did not start")
+
+class ClusterTest(unittest.TestCase):
+    NODES = 3
+    QUORUMS = (2, 2) # NR, NW
+    OPTIONS = {} # handler options of every node
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp(prefix="pa3_test_")
+        ports = [free_port() for _ in range(self.NODES)]
+        with open(os.path.join(self.workdir, "compute_nodes.txt"), "w") as fp:
+            fp.write("%d,%d\n" % self.QUORUMS + "".join(f"127.0.0.1,{port},{int(n == 0)}\n" for n, port in enumerate(ports)))
+        os.chdir(self.workdir) # handlers read compute_nodes.txt from the working directory
+        self.nodes = [ReplicaServerHandler("127.0.0.1", port, os.path.join(self.workdir, f"node{n}"), **self.OPTIONS)
+                      for n, port in enumerate(ports)]
+        for node, port in zip(self.nodes, ports):
+            serve(node, port)
+        self.coordinator = self.nodes[0]
+
+    def tearDown(self):
+        for node in self.nodes:
+            node.pool.close()
+        os.chdir(ROOT)
+        shutil.rmtree(self.workdir)
@@ -0,0 +1,70 @@
+# test_coalesce_deadline.py
+# Written by Matthew Breach and Lily Hymes
+
+"""
+Regression test: write coalescing combined with deadlines
+---------------------------------------
+W1 holds a file, W2 queues behind it with a short deadline and W1 finishes after that deadline
+passed. W1's write is handed to W2, which is dropped as expired; the coordinator has to
+propagate W1's write in W2's place, so W1 is acknowledged and W3 builds on W1's version.
+
+Run from the repository root: python3 -m unittest discover tests
+"""
+
+import os, threading, time, unittest
+
+from cluster import ClusterTest
+from replica_server import DEADLINE_EXCEEDED
+from PA3.ttypes import Request
+from thrift.Thrift import TApplicationException
+
+class CoalescedWriteDeadlineTest(ClusterTest):
+    OPTIONS = {"coalesce_writes": True}
+
+    def write_request(self, deadline=0):
+        return Request("write", "f.txt", self.coordinator.info, None, deadline)
+
+    def test_expired_writer_handed_a_coalesced_write(self):
+        coordinator = self.coordinator
+        first = coordinator.admit_job(self.write_request())
+        self.assertEqual(first.version, 0)
+
+        # W2 queues behind W1 and gives up while W1 still holds the file
+        second = {}
+        def queue_second():
+            try:
+                second["response"] = coordinator.admit_job(self.write_request(time.time() + 0.3))
+            except TApplicationException as e:
+                second["error"] = e
+        waiter = threading.Thread(target=queue_second, daemon=True)
+        waiter.start()
+        time.sleep(0.6)
+
+        # W1 stores version 1 locally and finishes, its write is coalesced into W2's
+        with open(os.path.join(coordinator.storage_path, "f.txt"), "w") as fp:
+            fp.write("written by W1")
+        coordinator.update_file_metadata("f.txt", 1)
+        finished = {}
+        def finish_first():
+            try:
+                coordinator.finish_write(1, "f.txt", *2 * [coordinator.info.ip, coordinator.info.port], first.jobId)
+                finished["ok"] = True
+            except Exception as e:
+                finished["error"] = e
+        finisher = threading.Thread(target=finish_first, daemon=True)
+        finisher.start()
+
+        finisher.join(10)
+        waiter.join(10)
+        self.assertFalse(finisher.is_alive(), "W1's finish_write never returned")
+        self.assertEqual(finished, {"ok": True})
+        self.assertEqual(second["error"].type, DEADLINE_EXCEEDED)
+        self.assertEqual(coordinator.stats.get("coalesced_writes_carried"), 1)
+
+        # W3 builds on W1's version, every node of W1's quorum holds it
+        third = coordinator.admit_job(self.write_request())
+        self.assertEqual(third.version, 1)
+        self.assertGreaterEqual(sum(node.get_version("f.txt") == 1 for node in self.nodes), 2)
+
+if __name__ == "__main__":
+    unittest.main()
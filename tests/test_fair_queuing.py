@@ -0,0 +1,53 @@
+# test_fair_queuing.py
+# Written by Matthew Breach and Lily Hymes
+
+"""
+Regression tests: scheduling classes
+---------------------------------------
+Jobs on one file keep their arrival order whatever their class, a later interactive read
+must not overtake a queued bulk write. Class weights only decide who gets the coordinator's
+shared capacity next.
+
+Run from the repository root: python3 -m unittest discover tests
+"""
+
+import threading, time, unittest
+
+import cluster # puts gen-py on the path
+from replica_server import CLASS_WEIGHTS, FairGate, FileJobQueue
+
+class FileOrderTest(unittest.TestCase):
+    def test_read_waits_for_earlier_write(self):
+        fileQueue = FileJobQueue()
+        first, write, read = threading.Event(), threading.Event(), threading.Event()
+        fileQueue.admit("write", first)
+        fileQueue.admit("write", write)
+        fileQueue.admit("read", read)
+        fileQueue.release("write")
+        self.assertTrue(write.is_set())
+        self.assertFalse(read.is_set())
+        fileQueue.release("write")
+        self.assertTrue(read.is_set())
+
+class FairGateTest(unittest.TestCase):
+    def test_interactive_overtakes_bulk_backlog(self):
+        gate = FairGate(1, CLASS_WEIGHTS)
+        order = []
+
+        def job(cls, name):
+            with gate.slot(cls):
+                order.append(name)
+
+        with gate.slot("bulk"):
+            threads = []
+            for cls, name in [("bulk", "b1"), ("bulk", "b2"), ("bulk", "b3"), ("interactive", "i1")]:
+                threads.append(threading.Thread(target=job, args=(cls, name)))
+                threads[-1].start()
+                while sum(map(len, gate.waiting.values())) < len(threads):
+                    time.sleep(0.001) # let the job queue up, so arrival order is fixed
+        for thread in threads:
+            thread.join()
+        self.assertEqual(order, ["i1", "b1", "b2", "b3"])
+
+if __name__ == "__main__":
+    unittest.main()
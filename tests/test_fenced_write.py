@@ -0,0 +1,65 @@
+# test_fenced_write.py
+# Written by Matthew Breach and Lily Hymes
+
+"""
+Regression tests: a write fenced off by its coordinator must not stay visible
+---------------------------------------
+The writer's local copy is slow enough for the coordinator to reclaim its lease, so finish_write
+is rejected. The writer has to put back the file and version it replaced, otherwise the next
+write builds on the rejected version. A late write completed through finish_jobs is rejected too.
+
+Run from the repository root: python3 -m unittest discover tests
+"""
+
+import os, shutil, time, unittest
+from unittest import mock
+
+from cluster import ClusterTest
+from replica_server import LEASE_EXPIRED
+from PA3.ttypes import Completion, Request
+from thrift.Thrift import TApplicationException
+
+class FencedWriteTest(ClusterTest):
+    OPTIONS = {"lease_timeout": 0.5}
+
+    def source_file(self, text):
+        os.makedirs(os.path.join(self.workdir, "src"), exist_ok=True)
+        path = os.path.join(self.workdir, "src", "f.txt")
+        with open(path, "w") as fp:
+            fp.write(text)
+        return path
+
+    def test_fenced_write_is_rolled_back(self):
+        self.nodes[1].write_file("f.txt", self.source_file("first"))
+        writer = self.nodes[2]
+        before = writer.get_version("f.txt")
+        stored = os.path.join(writer.storage_path, "f.txt")
+        content = open(stored).read() if os.path.exists(stored) else None
+
+        copy = shutil.copy
+        def slow_copy(src, dst):
+            time.sleep(1.5) # outlasts the lease
+            return copy(src, dst)
+        with mock.patch("replica_server.shutil.copy", slow_copy):
+            with self.assertRaises(TApplicationException) as fenced:
+                writer.write_file("f.txt", self.source_file("rejected"))
+        self.assertEqual(fenced.exception.type, LEASE_EXPIRED)
+
+        self.assertEqual(writer.get_version("f.txt"), before)
+        self.assertEqual(open(stored).read() if os.path.exists(stored) else None, content)
+        self.assertEqual(max(node.get_version("f.txt") for node in self.nodes), 1)
+
+        # The next write builds on the committed version, not the rejected one
+        self.nodes[0].write_file("f.txt", self.source_file("second"))
+        self.assertEqual(max(node.get_version("f.txt") for node in self.nodes), 2)
+
+    def test_late_batched_write_is_fenced(self):
+        writer = self.nodes[1]
+        response, = self.coordinator.admit_batch([Request("write", "f.txt", writer.info, None, 0)])
+        time.sleep(1.5) # the reaper reclaims the lease
+        with self.assertRaises(TApplicationException) as fenced:
+            self.coordinator.finish_jobs([Completion(response.jobId, "f.txt", response.version + 1, "write")], writer.info)
+        self.assertEqual(fenced.exception.type, LEASE_EXPIRED)
+
+if __name__ == "__main__":
+    unittest.main()
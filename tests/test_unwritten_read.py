@@ -0,0 +1,30 @@
+# test_unwritten_read.py
+# Written by Matthew Breach and Lily Hymes
+
+"""
+Regression test: reading a file nobody has written yet
+---------------------------------------
+A read of a never-written file finds version 0 and no contact. The coordinator must still send
+back a Response that serializes, with no holders, rather than fail the RPC and keep the lease.
+
+Run from the repository root: python3 -m unittest discover tests
+"""
+
+import unittest
+
+from cluster import ClusterTest
+from PA3.ttypes import Request
+
+class UnwrittenReadTest(ClusterTest):
+    OPTIONS = {"hedge_extra": 3}
+
+    def test_read_of_missing_file(self):
+        coordinator = self.coordinator
+        with self.nodes[1].pool.connection(coordinator.info.ip, coordinator.info.port) as client:
+            response = client.insert_job(Request("read", "nofile"))
+            self.assertEqual((response.version, response.contact, response.holders), (0, None, []))
+            client.finish_read("nofile", response.jobId)
+        self.assertFalse(coordinator.leases)
+
+if __name__ == "__main__":
+    unittest.main()